@@ -0,0 +1 @@
+DevlogSearch.receive("0", {"00":[11],"051":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("1", {"10":[9,2],"100":[2],"12":[10,1],"134":[11],"15":[0],"156":[11],"16":[9],"172":[8],"173":[8]});
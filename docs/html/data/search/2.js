@@ -0,0 +1 @@
+DevlogSearch.receive("2", {"200":[11],"247":[10],"248":[10]});
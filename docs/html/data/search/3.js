@@ -0,0 +1 @@
+DevlogSearch.receive("3", {"30":[4,7],"35":[11],"360":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("4", {"403":[8],"409":[8]});
@@ -0,0 +1 @@
+DevlogSearch.receive("5", {"561":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("7", {"718":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("a", {"accept":[1],"accessibility":[2],"achieve":[8],"achieved":[9],"across":[2],"actions":[9],"add":[1],"added":[4,1,3,1],"all":[2,2,3,1,1,2],"alpha":[11],"always":[10],"analysis":[5],"and":[0,1,1,1,1,1,1,1,1,1],"answer":[1],"any":[11],"api":[0,1,2,2,2,1,1,2],"app":[0,8,1,1,1],"apps":[0,9,1,1],"as":[9],"asset":[10],"assets":[10],"audit":[6],"auth":[2,1,3,1,1,2],"authentication":[0,3],"authguard":[3],"automated":[5,1],"automatic":[2]});
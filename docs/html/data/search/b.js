@@ -0,0 +1 @@
+DevlogSearch.receive("b", {"backend":[0,4,1],"based":[5],"before":[9],"behavior":[8],"best":[1],"body":[8],"book":[11],"both":[5],"browser":[5],"build":[10],"bundle":[5],"by":[9]});
@@ -0,0 +1 @@
+DevlogSearch.receive("c", {"caching":[5],"callback":[3],"canvas":[10,1],"cd":[9],"cdn":[5],"centralized":[7],"chapter":[11],"chapters":[0,7],"chat":[11],"check":[9],"checks":[6],"ci":[6,3],"class":[6],"claude":[0,1,1,1,1,1,1,1,1,1,2],"cleanup":[7],"client":[9],"code":[0,1,1,1,1,1,1,1,1,1],"codes":[8],"coding":[4],"collaborativecanvas":[10],"columns":[5],"com":[11],"comment":[8],"comments":[0,1,6,1],"community":[1,1,5,1,2],"compatibility":[9],"complete":[2,6],"complex":[5],"component":[2],"components":[2,8,1],"compose":[10],"comprehensive":[4,1,1,1],"config":[8,2],"configuration":[5,3,1],"confirmed":[9],"connection":[5],"consistency":[9],"console":[11],"constraint":[8],"content":[6],"copy":[10],"core":[0],"corrected":[8],"cors":[6,2],"count":[1,7],"course":[4,3,1,3],"courselist":[10,1],"courses":[0,2,2,3,1,2,1],"coverage":[7],"covering":[4],"create":[1],"crew":[10,1],"crewspace":[10,1],"crud":[1],"csp":[10],"css":[0,10],"cta":[10],"current":[3],"currentpage":[11],"curriculum":[4],"cursor":[5]});
@@ -0,0 +1 @@
+DevlogSearch.receive("d", {"dark":[0],"dashboard":[2],"data":[4,4],"database":[4,1,2,1],"delete":[1],"demo":[11],"demobanner":[11],"demopage":[11],"dependency":[6],"deploy":[11],"deployment":[9],"deployments":[10],"description":[10],"design":[0,11],"detail":[1],"detection":[2],"dev":[11],"devdependency":[9],"develop":[11],"diagrams":[11],"docker":[10],"docs":[11],"downvote":[1],"dropdown":[3],"duplicate":[8]});
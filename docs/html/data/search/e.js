@@ -0,0 +1 @@
+DevlogSearch.receive("e", {"e2e":[6,1,1,1],"edit":[3],"en":[2,8,1],"enabled":[10],"endpoint":[8],"english":[2],"enhanced":[6],"enrollment":[7,1],"enrollments":[0,7,1],"ensures":[9],"env":[8],"environment":[7,1],"error":[8,3],"eslint":[9],"eslintrc":[9],"esm":[10],"excalidraw":[10],"expectations":[8]});
@@ -0,0 +1 @@
+DevlogSearch.receive("f", {"failures":[8,1],"fallback":[10],"feat":[1,1,1,1,1,1,5],"feature":[8],"features":[0,1],"field":[8],"fields":[4],"filters":[1],"fixed":[8,1],"fixes":[8,1],"flow":[3,4,1],"font":[10],"footer":[10],"for":[1,3,1,2,1,1],"form":[2],"frame":[6],"frequently":[5],"from":[9],"frontend":[0,4,1],"functionality":[3]});
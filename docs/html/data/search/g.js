@@ -0,0 +1 @@
+DevlogSearch.receive("g", {"generation":[7,1,1],"get":[1,2],"github":[3,6,2],"gitignore":[10],"glossary":[9],"go":[10,1]});
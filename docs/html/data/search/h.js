@@ -0,0 +1 @@
+DevlogSearch.receive("h", {"handling":[3],"hardening":[6],"header":[10],"headers":[5,1],"health":[11],"helmet":[6],"helpers":[7,1],"hooks":[10],"http":[11]});
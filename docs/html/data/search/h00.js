@@ -0,0 +1 @@
+DevlogSearch.receive("h00", {"가능":[11],"가이":[11],"가입":[10],"각형":[10],"간에":[10],"감지":[10],"강사":[11],"강하":[11],"개":[10,1],"개발":[11],"개선":[10,1],"검색":[11],"결과":[11],"고유":[11],"공간":[10],"광대":[10],"구나":[11],"구성":[11],"국어":[10],"규칙":[11],"그라":[10],"그램":[11],"그인":[10,1],"기간":[11],"기타":[10]});
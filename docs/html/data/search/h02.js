@@ -0,0 +1 @@
+DevlogSearch.receive("h02", {"나의":[10],"널별":[11],"네이":[11],"누구":[11],"누락":[11],"니다":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("h03", {"다이":[11],"대폭":[11],"더링":[10],"덕션":[11],"데모":[10,1],"데이":[10],"동일":[10],"동작":[11],"되지":[11],"드코":[11],"등":[11],"디렉":[11]});
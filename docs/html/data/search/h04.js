@@ -0,0 +1 @@
+DevlogSearch.receive("h04", {"따라":[11]});
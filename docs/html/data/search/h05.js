@@ -0,0 +1 @@
+DevlogSearch.receive("h05", {"라이":[11],"라인":[10],"란색":[10],"랜딩":[10],"레벨":[11],"레이":[10],"렉토":[11],"렌더":[10],"렬로":[11],"로":[10,1],"로고":[10],"로그":[10,1],"로덕":[11],"로젝":[11],"료로":[10,1],"루에":[10],"를":[11],"리브":[10],"리셋":[11],"립트":[10]});
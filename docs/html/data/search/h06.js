@@ -0,0 +1 @@
+DevlogSearch.receive("h06", {"메시":[11],"명":[11],"모드":[11],"무료":[10,1],"문자":[11],"문제":[10],"미로":[11],"및":[10,1]});
@@ -0,0 +1 @@
+DevlogSearch.receive("h07", {"반응":[11],"배너":[11],"배포":[11],"버스":[10],"번역":[11],"변경":[10],"병렬":[11],"보강":[11],"복사":[10],"부분":[11],"부족":[11],"분을":[11],"불일":[11],"브랜":[10],"빈":[11],"빌드":[10]});
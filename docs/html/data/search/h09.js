@@ -0,0 +1 @@
+DevlogSearch.receive("h09", {"사각":[10],"사명":[11],"사용":[11],"사이":[10],"삭제":[11],"상수":[11],"색바":[11],"생성":[11],"서버":[11],"선언":[10],"설명":[11],"설정":[10],"성하":[11],"쇄적":[10],"수":[11],"수동":[11],"수정":[10,1],"스의":[10],"스크":[10],"스템":[11],"습니":[11],"습을":[10],"시":[10,1],"시스":[11],"시작":[10,1],"시지":[11],"실전":[11],"실제":[11]});
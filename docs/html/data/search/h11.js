@@ -0,0 +1 @@
+DevlogSearch.receive("h11", {"아웃":[10],"아이":[10],"않습":[11],"어그":[11],"언트":[11],"업과":[10],"없음":[11],"에":[10],"에서":[10],"에이":[11],"연쇄":[10],"영어":[10],"옵션":[10],"완료":[10,1],"완전":[10],"용자":[11],"원광":[10],"유저":[11],"으로":[10],"이드":[11],"이션":[11],"이아":[10],"이어":[11],"이언":[11],"이전":[11],"이지":[10,1],"이콘":[10],"이터":[10],"이트":[10],"이틀":[10,1],"이후":[11],"인":[11],"일괄":[10],"일치":[11],"입하":[10],"있습":[11]});
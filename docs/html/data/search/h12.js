@@ -0,0 +1 @@
+DevlogSearch.receive("h12", {"자도":[11],"자동":[11],"자열":[11],"작하":[10],"작할":[11],"장되":[11],"저장":[11],"적으":[10],"적화":[11],"전송":[11],"전체":[10,1],"전트":[11],"전환":[11],"정리":[11],"제거":[10,1],"제를":[10],"제목":[11],"제외":[10],"제작":[11],"젝트":[11],"족한":[11],"줄":[10],"지네":[11],"지는":[11],"지원":[11],"집필":[11]});
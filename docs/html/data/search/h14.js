@@ -0,0 +1 @@
+DevlogSearch.receive("h14", {"차단":[10],"채널":[11],"책":[11],"책의":[11],"최적":[11],"추가":[10,1],"칙에":[11]});
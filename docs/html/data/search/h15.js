@@ -0,0 +1 @@
+DevlogSearch.receive("h15", {"캔버":[10],"코드":[11],"코딩":[11],"크기":[10],"크루":[10],"크립":[10],"클라":[11],"키":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("h16", {"타이":[10,1],"타입":[10,1],"태그":[10,1],"터링":[11],"토리":[11],"트명":[10],"트에":[10],"트의":[11],"팀":[10,1]});
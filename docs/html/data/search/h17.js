@@ -0,0 +1 @@
+DevlogSearch.receive("h17", {"파란":[10],"파일":[10],"페이":[10,1],"편집":[11],"폰트":[10],"폴백":[11],"품질":[11],"프로":[11],"필터":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("h18", {"하고":[11],"하기":[10],"하나":[10],"하드":[11],"하여":[11],"학습":[10],"한국":[10],"해결":[10],"협업":[10],"확인":[11],"확장":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("i", {"i18n":[2,8,1],"id":[1,2,5,2],"image":[5],"images":[11],"implementation":[0,1,1,1,3,1],"implemented":[5,3],"import":[10],"in":[3,3,3],"including":[0,1,4,1,1],"increased":[8],"incremental":[5],"index":[10,1],"indexes":[5],"initial":[0],"initialization":[0],"initiate":[3],"injection":[6,2],"input":[6],"integration":[7,1],"interaction":[7,1],"interactions":[1],"internationalization":[2],"introduction":[11],"introductions":[11],"is":[9],"isr":[5],"issues":[9]});
@@ -0,0 +1 @@
+DevlogSearch.receive("j", {"job":[9],"joins":[5],"js":[0,5,1,3,1],"json":[9,1,1],"jwt":[0,3,4]});
@@ -0,0 +1 @@
+DevlogSearch.receive("k", {"ko":[2,8,1],"korean":[2]});
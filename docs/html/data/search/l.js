@@ -0,0 +1 @@
+DevlogSearch.receive("l", {"labels":[2],"landing":[10],"language":[2],"languagecontext":[11],"languages":[2],"layout":[10],"lazy":[5],"leaderboard":[10,1],"lib":[10],"light":[0],"limiting":[6,2],"limits":[8],"lines":[11],"lint":[9],"list":[1],"listing":[1],"live":[9],"loading":[5],"locale":[2,9],"localstorage":[11],"lockfileversion":[9],"logging":[5],"login":[3,7],"logout":[3]});
@@ -0,0 +1 @@
+DevlogSearch.receive("m", {"main":[11],"management":[3],"md":[11],"me":[3,5],"measurement":[5],"member":[7,1],"menu":[3],"merge":[11],"mermaid":[11],"messageinput":[11],"messages":[2,8,1],"metadata":[10],"metrics":[5],"mismatch":[9],"missing":[9],"module":[8],"modules":[0],"monorepo":[0],"month":[11],"multi":[6]});
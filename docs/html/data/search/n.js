@@ -0,0 +1 @@
+DevlogSearch.receive("n", {"navigation":[2,1],"nested":[1],"nestjs":[0,9],"next":[0,5,4,1],"not":[8],"npm":[6]});
@@ -0,0 +1 @@
+DevlogSearch.receive("o", {"oauth":[3],"of":[0,1,2,4],"offline":[5],"ok":[11],"on":[1,4],"operations":[1],"optimization":[5],"options":[6],"order":[4],"orm":[0]});
@@ -0,0 +1 @@
+DevlogSearch.receive("p", {"package":[9,1],"packages":[0],"page":[2,1,6,1,1],"pages":[2],"paginated":[8],"pagination":[5],"parser":[9],"part":[11],"part1":[11],"part2":[11],"passing":[8,1],"patch":[1,2],"path":[8,2],"paths":[8],"performance":[5,4],"persistent":[2],"ph":[10,1],"phase":[0,1],"pipeline":[6,3],"planning":[11],"plugin":[9],"pnpm":[9],"policy":[6],"pooling":[5],"port":[8],"post":[1],"postgresql":[0],"postlist":[10],"posts":[0,1,6],"pr":[11],"preference":[2],"prerequisites":[4],"prevent":[8],"prevention":[6],"prisma":[0,6,3],"problems":[9],"profile":[2,1],"profilepage":[3],"profiling":[5],"progress":[7,1],"project":[0,7,1,3],"projectlist":[11],"projectmembers":[0],"projects":[0,2,5,1,3],"protected":[3],"protection":[6],"public":[10]});
@@ -0,0 +1 @@
+DevlogSearch.receive("q", {"qna":[10],"quality":[11],"queried":[5],"query":[5],"questionlist":[10],"questions":[11]});
@@ -0,0 +1 @@
+DevlogSearch.receive("r", {"rate":[6,2],"readme":[11],"ready":[5],"redis":[5],"refactor":[10],"regeneration":[5],"replies":[1],"required":[8],"resolving":[9],"response":[5,3],"responses":[5],"responsive":[0],"restart":[10],"restful":[0],"retry":[10],"rewrite":[8],"rewrote":[8],"route":[3],"router":[0]});
@@ -0,0 +1 @@
+DevlogSearch.receive("s", {"scan":[9],"scanning":[6],"scripts":[10],"search":[1],"security":[6,2,1],"seed":[4],"selection":[1],"self":[8],"sendfailed":[11],"service":[5,2],"services":[7],"session":[3],"setglobalprefix":[8],"setup":[0,7,1,1],"sh":[10,1],"shadcn":[0],"shared":[0],"size":[11],"skipped":[8],"slug":[8],"snt":[10,1],"software":[10],"spec":[6,1,1],"splitting":[5],"sql":[6],"src":[8,1,1,1],"staging":[9],"standalone":[10],"state":[11],"static":[5],"status":[8],"step":[9],"steps":[9],"stopped":[10],"strict":[6],"strings":[2],"structure":[0,8],"successfully":[9],"support":[0,5],"supporting":[2],"switcher":[2],"system":[1]});
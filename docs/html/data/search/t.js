@@ -0,0 +1 @@
+DevlogSearch.receive("t", {"tags":[1],"tailwind":[0],"task":[11],"technologies":[4],"test":[7,1,1],"testhelpers":[8],"testing":[6],"tests":[5,2,1,1],"theme":[0],"throttlermodule":[8],"tier":[6],"time":[5],"title":[10],"to":[8,1],"token":[7],"tooltips":[2],"topics":[4],"tracking":[1],"translated":[2],"translations":[2],"transport":[6],"ts":[6,1,1,1,1],"tsx":[9,1,1],"tunnel":[10],"turborepo":[0],"type":[6,3],"types":[0,10],"typescript":[0,8,1]});
@@ -0,0 +1 @@
+DevlogSearch.receive("u", {"ui":[0,2],"unimplemented":[8],"unique":[8],"unit":[7],"university":[10],"unless":[10],"update":[3],"updated":[9],"upvote":[1],"url":[8,3],"use":[10],"usememo":[11],"user":[1,2,8],"usermenu":[3],"users":[0,3,4],"utilities":[0,7]});
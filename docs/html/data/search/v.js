@@ -0,0 +1 @@
+DevlogSearch.receive("v", {"validation":[2,4],"validator":[6],"version":[9],"view":[1,2],"violations":[8],"vote":[1],"votes":[0,7],"voting":[1,7],"vulnerability":[6]});
@@ -0,0 +1 @@
+DevlogSearch.receive("w", {"web":[0,9,1,1],"week":[11],"window":[10],"with":[0,1,1,1,1,1,1,2,1],"wku":[10,1],"wkustudentonly":[11],"worker":[5],"workflow":[9],"workflows":[9],"wrapper":[3],"ws":[10]});
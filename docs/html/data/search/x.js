@@ -0,0 +1 @@
+DevlogSearch.receive("x", {"xss":[6]});
@@ -0,0 +1 @@
+DevlogSearch.receive("y", {"yml":[9,1]});
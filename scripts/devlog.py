@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Dev Log Build Tool
+Parses dev-logs once and renders every HTML page in a single process
+
+Usage:
+    python3 scripts/devlog.py build                  # parse + all pages
+    python3 scripts/devlog.py build --page timeline  # parse + selected pages
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import traceback
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple
+
+import devlog_profile as profile
+from devlog_details import write_detail_shards
+from devlog_search import write_search_index
+from devlog_index import log_index
+
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+DEVLOG_DIR = PROJECT_ROOT / 'docs' / 'dev-log'
+HTML_DIR = PROJECT_ROOT / 'docs' / 'html'
+DATA_DIR = HTML_DIR / 'data'
+BUILD_CACHE_FILE = DATA_DIR / '.build-cache.json'
+
+# (page name, generator script, output file, render function)
+PAGES = [
+    ('index', 'generate-html.py', 'index.html', 'generate_html'),
+    ('timeline', 'generate-timeline.py', 'timeline.html', 'generate_html'),
+    ('heatmap', 'generate-heatmap.py', 'heatmap.html', 'generate_html'),
+    ('files', 'generate-files-history.py', 'files.html', 'generate_html'),
+    ('commit-size', 'generate-commit-size.py', 'commit-size.html', 'generate_html'),
+    ('time-analysis', 'generate-time-analysis.py', 'time-analysis.html', 'generate_html'),
+    ('deployment', 'generate-deployment.py', 'deployment.html', 'generate_html'),
+    ('stats', 'generate-stats.py', 'stats.html', 'generate_stats_html'),
+]
+PAGE_NAMES = [page[0] for page in PAGES]
+
+# Parsed model for render workers. Set before the pool forks so workers
+# inherit it copy-on-write instead of receiving a pickled copy per task.
+_MODEL: Optional[Dict] = None
+
+
+def load_script(filename: str) -> ModuleType:
+    """Import a hyphen-named script from the scripts directory as a module"""
+    module_name = filename[:-3].replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPT_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse(args: argparse.Namespace) -> Dict:
+    """Parse dev-logs and write dev-logs.json, returning the in-memory model"""
+    parser = load_script('parse-devlog.py')
+
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = None if args.no_cache else DATA_DIR / '.parse-cache.json'
+
+    print("\n[Parsing] dev-log files...")
+    with profile.span('parse'):
+        logs, activity = parser.parse_all_devlogs(DEVLOG_DIR, cache_file, args.jobs)
+    data = parser.build_devlog_data(logs, activity)
+    parser.save_devlog_data(DATA_DIR / 'dev-logs.json', data)
+    with profile.span('search.write'):
+        write_search_index(logs)
+
+    print(f"[OK] Parsed {len(logs)} logs")
+    return data
+
+
+def page_input_hash(module: ModuleType, script: str, data: Dict) -> str:
+    """Hash the generator source plus the slice of the model it declares it reads
+
+    generated_at is deliberately left out: a page that is skipped keeps the
+    timestamp of the build that last changed it.
+    """
+    log_fields = getattr(module, 'LOG_FIELDS', None)
+    stat_fields = getattr(module, 'STAT_FIELDS', None)
+    stats = data['statistics']
+
+    if log_fields is None:
+        logs = data['logs']
+    else:
+        logs = [[log.get(field) for field in log_fields] for log in data['logs']]
+
+    if stat_fields is None:
+        stats_slice = stats
+    else:
+        stats_slice = {key: stats.get(key) for key in stat_fields}
+
+    digest = hashlib.sha256((SCRIPT_DIR / script).read_bytes())
+    # Shared devlog_* helper modules count as part of every generator
+    for helper in sorted(SCRIPT_DIR.glob('devlog_*.py')):
+        digest.update(helper.read_bytes())
+    digest.update(json.dumps([logs, stats_slice], ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_build_cache() -> Dict[str, str]:
+    """Load the page -> input hash manifest of the last build"""
+    try:
+        with profile.span('json.load'), open(BUILD_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_build_cache(cache: Dict[str, str]):
+    """Write the page -> input hash manifest"""
+    tmp_file = BUILD_CACHE_FILE.with_suffix('.json.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, BUILD_CACHE_FILE)
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write text unless the file already holds exactly these bytes"""
+    encoded = text.encode('utf-8')
+    try:
+        if path.stat().st_size == len(encoded) and path.read_bytes() == encoded:
+            return False
+    except OSError:
+        pass
+
+    path.write_bytes(encoded)
+    return True
+
+
+def fork_context() -> Optional[multiprocessing.context.BaseContext]:
+    """Get the fork start method where the platform supports it"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def render_page(page: Tuple[str, str, str, str]) -> Dict:
+    """Render and write one page from the shared model, capturing any failure"""
+    name, script, output, render = page
+    started = time.perf_counter()
+
+    try:
+        module = load_script(script)
+        with profile.span(f'render.{name}'):
+            html = getattr(module, render)(_MODEL)
+        with profile.span(f'write.{name}'):
+            status = 'generated' if write_if_changed(HTML_DIR / output, html) else 'unchanged'
+        error = None
+    except Exception:
+        status = 'failed'
+        error = traceback.format_exc()
+
+    return {
+        'page': name,
+        'output': output,
+        'status': status,
+        'error': error,
+        'seconds': time.perf_counter() - started,
+        'profile': profile.drain() if profile.enabled() else [],
+    }
+
+
+def render_pages(data: Dict, pages: List[str], force: bool = False, jobs: int = 1) -> List[Dict]:
+    """Render the selected pages whose inputs changed since the last build
+
+    With jobs > 1 pages render concurrently in forked worker processes.
+    Returns one result per page that was rendered; failed pages keep their
+    old input hash so the next build retries them.
+    """
+    global _MODEL
+
+    cache = load_build_cache()
+    todo = []
+    hashes = {}
+
+    for page in PAGES:
+        name, script, output, render = page
+        if name not in pages:
+            continue
+
+        module = load_script(script)
+        with profile.span(f'hash.{name}'):
+            hashes[name] = page_input_hash(module, script, data)
+
+        if not force and cache.get(name) == hashes[name] and (HTML_DIR / output).exists():
+            print(f"[SKIP] Up to date: {output}")
+            continue
+
+        todo.append(page)
+
+    _MODEL = data
+    # Card renderers share one log_number index; build it before forking
+    with profile.span('index.build'):
+        log_index(data['logs'])
+    context = fork_context()
+
+    if jobs > 1 and len(todo) > 1 and context:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo)), mp_context=context,
+                                 initializer=profile.reset_worker) as executor:
+            results = list(executor.map(render_page, todo))
+    else:
+        results = [render_page(page) for page in todo]
+
+    for result in results:
+        profile.merge(result['profile'])
+        if result['status'] == 'failed':
+            print(f"[FAIL] {result['output']} ({result['seconds']:.2f}s)")
+            continue
+
+        cache[result['page']] = hashes[result['page']]
+        label = 'Generated' if result['status'] == 'generated' else 'Unchanged'
+        print(f"[OK] {label}: {result['output']} ({result['seconds']:.2f}s)")
+
+    save_build_cache(cache)
+    return results
+
+
+def build(args: argparse.Namespace):
+    """Parse once and render pages"""
+    pages = args.page or PAGE_NAMES
+
+    if args.profile:
+        profile.enable()
+
+    with profile.span('build'):
+        data = parse(args)
+
+        # Modal bodies for the kanban and timeline pages, loaded on demand
+        with profile.span('details.write'):
+            written = write_detail_shards(data['logs'])
+        print(f"[OK] Detail shards: {written} written")
+
+        print("\n[Generating] HTML pages...")
+        results = render_pages(data, pages, args.force, args.jobs)
+
+    if args.profile:
+        trace_file = Path(args.profile)
+        profile.print_summary(profile.write_trace(trace_file))
+        print(f"\n[Profile] {trace_file}")
+
+    failed = [result for result in results if result['status'] == 'failed']
+    if failed:
+        print(f"\n[ERROR] {len(failed)} of {len(results)} pages failed to build")
+        for result in failed:
+            print(f"\n--- {result['output']} ---")
+            print(result['error'].rstrip())
+        raise SystemExit(1)
+
+    print(f"\n[SUCCESS] Built {len(pages)} pages")
+    print(f"\n[Browser] Open in browser:")
+    print(f"   file://{HTML_DIR / 'index.html'}")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Dev log build tool')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Parse dev-logs and generate HTML pages')
+    build_parser.add_argument('--page', action='append', choices=PAGE_NAMES,
+                              help='Only generate this page (repeatable; default: all)')
+    build_parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                              help='Use N worker processes for parsing and page rendering (default: 1)')
+    build_parser.add_argument('--no-cache', action='store_true',
+                              help='Ignore the parse manifest and re-parse every file')
+    build_parser.add_argument('--force', action='store_true',
+                              help='Re-render pages even if their inputs did not change')
+    build_parser.add_argument('--profile', metavar='FILE', nargs='?',
+                              const=str(DATA_DIR / 'build-profile.json'),
+                              help='Record per-stage wall/CPU time and peak memory and write a '
+                                   'JSON trace (default: docs/html/data/build-profile.json)')
+    build_parser.set_defaults(func=build)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+"""
+Dev Log Charts
+Bar, line, trend, punch-card and doughnut charts rendered as static inline SVG at build time
+"""
+
+import math
+from html import escape
+from typing import List, Optional, Sequence, Tuple
+
+
+# Palette shared by the analysis pages (formerly passed to Chart.js)
+BLUE = '#3b82f6'
+GREEN = '#10b981'
+AMBER = '#f59e0b'
+PURPLE = '#8b5cf6'
+RED = '#ef4444'
+CYAN = '#06b6d4'
+GRAY = '#6b7280'
+
+# Plot geometry in SVG user units; the charts scale with their container
+WIDTH = 640
+HEIGHT = 320
+PAD_TOP = 12
+PAD_RIGHT = 12
+PAD_BOTTOM = 28
+PAD_LEFT = 36
+TICK_TARGET = 5
+FONT_WIDTH = 6.5
+
+# Chart.js defaults (#666 text, 10% grid lines) with dark-mode counterparts.
+# Pages include this in a <style> block next to styles.css.
+CHART_CSS = '''
+        .chart-svg { display: block; width: 100%; height: auto; }
+        .chart-svg text { font-size: 11px; fill: #666; }
+        .chart-svg.chart-round { max-width: 320px; margin: 0 auto; }
+        .chart-svg .chart-grid { stroke: rgba(0, 0, 0, 0.1); stroke-width: 1; }
+        .chart-svg .chart-axis { stroke: rgba(0, 0, 0, 0.25); stroke-width: 1; }
+        .chart-svg .chart-point { stroke-width: 0; }
+        .chart-svg .chart-point:hover, .chart-svg .chart-bar:hover, .chart-svg .chart-slice:hover,
+        .chart-svg .chart-punch:hover { opacity: 0.8; }
+        .chart-svg .chart-empty { fill: none; stroke: rgba(0, 0, 0, 0.1); }
+        .chart-svg-legend { display: flex; flex-wrap: wrap; justify-content: center; gap: 6px 14px;
+            margin: 10px 0 0; padding: 0; list-style: none; font-size: 12px; color: #666; }
+        .chart-svg-legend span { display: inline-block; width: 12px; height: 12px; margin-right: 6px;
+            border-radius: 2px; vertical-align: -1px; }
+        body.dark-mode .chart-svg text { fill: #a0a0a0; }
+        body.dark-mode .chart-svg .chart-grid { stroke: rgba(255, 255, 255, 0.1); }
+        body.dark-mode .chart-svg .chart-axis { stroke: rgba(255, 255, 255, 0.25); }
+        body.dark-mode .chart-svg .chart-empty { stroke: rgba(255, 255, 255, 0.1); }
+        body.dark-mode .chart-svg-legend { color: #a0a0a0; }
+'''
+
+
+def fmt(value: float) -> str:
+    """Format a coordinate compactly"""
+    return f'{value:.1f}'.rstrip('0').rstrip('.')
+
+
+def nice_step(maximum: float, target: int = TICK_TARGET) -> int:
+    """Whole-number tick step (1, 2, 5 x 10^k) giving about target ticks"""
+    if maximum <= target:
+        return 1
+    raw = maximum / target
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return int(factor * magnitude)
+    return int(10 * magnitude)
+
+
+def value_ticks(values: Sequence[float]) -> List[int]:
+    """Ticks from zero to just past the largest value"""
+    maximum = max(values, default=0)
+    step = nice_step(maximum)
+    top = max(step, math.ceil(maximum / step) * step)
+    return list(range(0, top + 1, step))
+
+
+def axis_left(ticks: Sequence[int]) -> float:
+    """Left padding wide enough for the largest value label"""
+    return max(PAD_LEFT, 12 + len(str(ticks[-1])) * FONT_WIDTH)
+
+
+def svg_open(label: str, width: int, height: int) -> str:
+    """Opening <svg> tag with an accessible label"""
+    return (f'<svg class="chart-svg" viewBox="0 0 {width} {height}" role="img" '
+            f'aria-label="{escape(label)}" xmlns="http://www.w3.org/2000/svg">')
+
+
+def legend_html(labels: Sequence[str], colors: Sequence[str]) -> str:
+    """HTML legend below a chart, like Chart.js with position 'bottom'"""
+    items = ''.join(f'<li><span style="background: {color};"></span>{escape(str(label))}</li>'
+                    for label, color in zip(labels, colors))
+    return f'<ul class="chart-svg-legend">{items}</ul>'
+
+
+def bar_chart(labels: Sequence[str], values: Sequence[float], color: str = BLUE,
+              horizontal: bool = False, title: str = 'Commits',
+              width: int = WIDTH, height: Optional[int] = None) -> str:
+    """Bar chart with a zero-based value axis
+
+    Horizontal charts grow with the number of bars and make room on the
+    left for the longest label.
+    """
+    labels = [str(label) for label in labels]
+    ticks = value_ticks(values)
+    top = ticks[-1]
+    parts = []
+
+    if horizontal:
+        band = 24
+        left = min(220, 12 + max((len(label) for label in labels), default=0) * FONT_WIDTH)
+        height = height or PAD_TOP + PAD_BOTTOM + band * max(len(labels), 1)
+        plot_w = width - left - PAD_RIGHT
+        plot_bottom = height - PAD_BOTTOM
+        parts.append(svg_open(title, width, height))
+        for tick in ticks:
+            x = left + plot_w * tick / top
+            parts.append(f'<line class="chart-grid" x1="{fmt(x)}" y1="{PAD_TOP}" x2="{fmt(x)}" y2="{plot_bottom}"/>')
+            parts.append(f'<text x="{fmt(x)}" y="{plot_bottom + 16}" text-anchor="middle">{tick}</text>')
+        for i, (label, value) in enumerate(zip(labels, values)):
+            y = PAD_TOP + band * i
+            bar_w = plot_w * value / top
+            parts.append(f'<text x="{fmt(left - 6)}" y="{fmt(y + band / 2 + 4)}" text-anchor="end">{escape(label)}</text>')
+            parts.append(f'<rect class="chart-bar" x="{fmt(left)}" y="{fmt(y + band * 0.15)}" '
+                         f'width="{fmt(bar_w)}" height="{fmt(band * 0.7)}" rx="4" fill="{color}">'
+                         f'<title>{escape(label)}: {value}</title></rect>')
+        parts.append(f'<line class="chart-axis" x1="{fmt(left)}" y1="{PAD_TOP}" x2="{fmt(left)}" y2="{plot_bottom}"/>')
+        parts.append('</svg>')
+        return ''.join(parts)
+
+    height = height or HEIGHT
+    left = axis_left(ticks)
+    plot_w = width - left - PAD_RIGHT
+    plot_h = height - PAD_TOP - PAD_BOTTOM
+    plot_bottom = height - PAD_BOTTOM
+    band = plot_w / max(len(labels), 1)
+    parts.append(svg_open(title, width, height))
+    for tick in ticks:
+        y = plot_bottom - plot_h * tick / top
+        parts.append(f'<line class="chart-grid" x1="{fmt(left)}" y1="{fmt(y)}" x2="{width - PAD_RIGHT}" y2="{fmt(y)}"/>')
+        parts.append(f'<text x="{fmt(left - 6)}" y="{fmt(y + 4)}" text-anchor="end">{tick}</text>')
+    for i, (label, value) in enumerate(zip(labels, values)):
+        x = left + band * i
+        bar_h = plot_h * value / top
+        parts.append(f'<rect class="chart-bar" x="{fmt(x + band * 0.1)}" y="{fmt(plot_bottom - bar_h)}" '
+                     f'width="{fmt(band * 0.8)}" height="{fmt(bar_h)}" rx="4" fill="{color}">'
+                     f'<title>{escape(label)}: {value}</title></rect>')
+        parts.append(f'<text x="{fmt(x + band / 2)}" y="{plot_bottom + 16}" text-anchor="middle">{escape(label)}</text>')
+    parts.append(f'<line class="chart-axis" x1="{fmt(left)}" y1="{plot_bottom}" x2="{width - PAD_RIGHT}" y2="{plot_bottom}"/>')
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def smooth_path(points: List[Tuple[float, float]], tension: float, floor: float) -> str:
+    """Cubic path through points with Catmull-Rom style control points
+
+    Control points are clamped to the plot, so curves never dip below the axis.
+    """
+    if not points:
+        return ''
+    path = [f'M{fmt(points[0][0])},{fmt(points[0][1])}']
+    for i in range(len(points) - 1):
+        x0, y0 = points[max(i - 1, 0)]
+        x1, y1 = points[i]
+        x2, y2 = points[i + 1]
+        x3, y3 = points[min(i + 2, len(points) - 1)]
+        c1x, c1y = x1 + (x2 - x0) * tension / 2, min(floor, y1 + (y2 - y0) * tension / 2)
+        c2x, c2y = x2 - (x3 - x1) * tension / 2, min(floor, y2 - (y3 - y1) * tension / 2)
+        path.append(f'C{fmt(c1x)},{fmt(c1y)} {fmt(c2x)},{fmt(c2y)} {fmt(x2)},{fmt(y2)}')
+    return ' '.join(path)
+
+
+def line_chart(labels: Sequence[str], values: Sequence[float], color: str = BLUE,
+               fill: Optional[str] = None, tension: float = 0.4, title: str = 'Commits',
+               label_every: int = 1, width: int = WIDTH, height: int = HEIGHT) -> str:
+    """Line chart with an optional area fill and a dot per point"""
+    labels = [str(label) for label in labels]
+    ticks = value_ticks(values)
+    top = ticks[-1]
+    left = axis_left(ticks)
+    plot_w = width - left - PAD_RIGHT
+    plot_h = height - PAD_TOP - PAD_BOTTOM
+    plot_bottom = height - PAD_BOTTOM
+    step = plot_w / max(len(values) - 1, 1)
+    points = [(left + step * i, plot_bottom - plot_h * value / top) for i, value in enumerate(values)]
+
+    parts = [svg_open(title, width, height)]
+    for tick in ticks:
+        y = plot_bottom - plot_h * tick / top
+        parts.append(f'<line class="chart-grid" x1="{fmt(left)}" y1="{fmt(y)}" x2="{width - PAD_RIGHT}" y2="{fmt(y)}"/>')
+        parts.append(f'<text x="{fmt(left - 6)}" y="{fmt(y + 4)}" text-anchor="end">{tick}</text>')
+    for i, label in enumerate(labels):
+        if i % label_every == 0:
+            parts.append(f'<text x="{fmt(points[i][0])}" y="{plot_bottom + 16}" text-anchor="middle">{escape(label)}</text>')
+
+    line = smooth_path(points, tension, plot_bottom)
+    if fill and points:
+        parts.append(f'<path d="{line} L{fmt(points[-1][0])},{plot_bottom} L{fmt(points[0][0])},{plot_bottom} Z" '
+                     f'fill="{fill}" stroke="none"/>')
+    parts.append(f'<path d="{line}" fill="none" stroke="{color}" stroke-width="3"/>')
+    for (x, y), label, value in zip(points, labels, values):
+        parts.append(f'<circle class="chart-point" cx="{fmt(x)}" cy="{fmt(y)}" r="4" fill="{color}">'
+                     f'<title>{escape(label)}: {value}</title></circle>')
+    parts.append(f'<line class="chart-axis" x1="{fmt(left)}" y1="{plot_bottom}" x2="{width - PAD_RIGHT}" y2="{plot_bottom}"/>')
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def trend_chart(labels: Sequence[str], series: Sequence[Tuple[str, Sequence[float], str]],
+                title: str = 'Trend', label_every: int = 1,
+                width: int = WIDTH, height: int = HEIGHT) -> str:
+    """Several straight-segment lines over shared labels, with a legend
+
+    Meant for dense daily series: no dots, one path per (name, values, color).
+    """
+    labels = [str(label) for label in labels]
+    ticks = value_ticks([value for _, values, _ in series for value in values])
+    top = ticks[-1]
+    left = axis_left(ticks)
+    plot_w = width - left - PAD_RIGHT
+    plot_h = height - PAD_TOP - PAD_BOTTOM
+    plot_bottom = height - PAD_BOTTOM
+    step = plot_w / max(len(labels) - 1, 1)
+
+    parts = [svg_open(title, width, height)]
+    for tick in ticks:
+        y = plot_bottom - plot_h * tick / top
+        parts.append(f'<line class="chart-grid" x1="{fmt(left)}" y1="{fmt(y)}" x2="{width - PAD_RIGHT}" y2="{fmt(y)}"/>')
+        parts.append(f'<text x="{fmt(left - 6)}" y="{fmt(y + 4)}" text-anchor="end">{tick}</text>')
+    for i, label in enumerate(labels):
+        if i % label_every == 0:
+            # Keep the outermost labels inside the viewBox
+            x = left + step * i
+            half = len(label) * FONT_WIDTH / 2
+            anchor = 'end' if x + half > width else 'start' if x - half < 0 else 'middle'
+            parts.append(f'<text x="{fmt(x)}" y="{plot_bottom + 16}" text-anchor="{anchor}">{escape(label)}</text>')
+    for name, values, color in series:
+        points = ' '.join(f'{fmt(left + step * i)},{fmt(plot_bottom - plot_h * value / top)}'
+                          for i, value in enumerate(values))
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="2" '
+                     f'stroke-linejoin="round"><title>{escape(name)}</title></polyline>')
+    parts.append(f'<line class="chart-axis" x1="{fmt(left)}" y1="{plot_bottom}" x2="{width - PAD_RIGHT}" y2="{plot_bottom}"/>')
+    parts.append('</svg>')
+    parts.append(legend_html([name for name, _, _ in series], [color for _, _, color in series]))
+    return ''.join(parts)
+
+
+def punch_card_chart(rows: Sequence[Sequence[float]], row_labels: Sequence[str],
+                     column_labels: Sequence[str], color: str = BLUE, title: str = 'Punch card',
+                     unit: str = 'commits', label_every: int = 1, width: int = WIDTH) -> str:
+    """Grid of circles whose area follows each cell's value, GitHub punch-card style"""
+    row_labels = [str(label) for label in row_labels]
+    column_labels = [str(label) for label in column_labels]
+    band = 32
+    left = 12 + max((len(label) for label in row_labels), default=0) * FONT_WIDTH
+    height = PAD_TOP + PAD_BOTTOM + band * max(len(rows), 1)
+    step = (width - left - PAD_RIGHT) / max(len(column_labels), 1)
+    radius = min(band, step) / 2 - 1
+    top = max((value for row in rows for value in row), default=0)
+    plot_bottom = height - PAD_BOTTOM
+
+    parts = [svg_open(title, width, height)]
+    for i, label in enumerate(column_labels):
+        if i % label_every == 0:
+            parts.append(f'<text x="{fmt(left + step * (i + 0.5))}" y="{plot_bottom + 16}" '
+                         f'text-anchor="middle">{escape(label)}</text>')
+    for r, (label, row) in enumerate(zip(row_labels, rows)):
+        y = PAD_TOP + band * (r + 0.5)
+        parts.append(f'<line class="chart-grid" x1="{fmt(left)}" y1="{fmt(y)}" x2="{width - PAD_RIGHT}" y2="{fmt(y)}"/>')
+        parts.append(f'<text x="{fmt(left - 6)}" y="{fmt(y + 4)}" text-anchor="end">{escape(label)}</text>')
+        for c, value in enumerate(row):
+            if value <= 0:
+                continue
+            # Area, not radius, is proportional to the value
+            r_cell = max(1.5, radius * math.sqrt(value / top))
+            parts.append(f'<circle class="chart-punch" cx="{fmt(left + step * (c + 0.5))}" cy="{fmt(y)}" '
+                         f'r="{fmt(r_cell)}" fill="{color}"><title>{escape(label)} '
+                         f'{escape(column_labels[c])}: {value:,} {escape(unit)}</title></circle>')
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def doughnut_chart(labels: Sequence[str], values: Sequence[float], colors: Sequence[str],
+                   cutout: float = 0.5, legend: bool = True, title: str = 'Distribution',
+                   size: int = 240) -> str:
+    """Doughnut chart (a pie when cutout is 0), starting at twelve o'clock
+
+    With legend=True an HTML legend follows the SVG, like Chart.js with the
+    legend at the bottom.
+    """
+    center = size / 2
+    outer = size / 2 - 2
+    inner = outer * cutout
+    total = sum(values)
+
+    parts = [svg_open(title, size, size).replace('class="chart-svg"', 'class="chart-svg chart-round"')]
+    if total <= 0:
+        parts.append(f'<circle class="chart-empty" cx="{fmt(center)}" cy="{fmt(center)}" '
+                     f'r="{fmt((outer + inner) / 2)}" stroke-width="{fmt(max(outer - inner, 1))}"/>')
+
+    angle = -math.pi / 2
+    for label, value, color in zip(labels, values, colors):
+        if value <= 0 or total <= 0:
+            continue
+        share = value / total
+        tooltip = f'<title>{escape(str(label))}: {value} ({share * 100:.1f}%)</title>'
+        if share >= 1:
+            # A single full slice: an arc cannot start and end on the same point
+            ring = (f'<circle cx="{fmt(center)}" cy="{fmt(center)}" r="{fmt((outer + inner) / 2)}" fill="none" '
+                    f'stroke="{color}" stroke-width="{fmt(outer - inner)}">' if inner else
+                    f'<circle cx="{fmt(center)}" cy="{fmt(center)}" r="{fmt(outer)}" fill="{color}">')
+            parts.append(f'<g class="chart-slice">{ring}{tooltip}</circle></g>')
+            break
+
+        end = angle + share * 2 * math.pi
+        large = 1 if share > 0.5 else 0
+        ox0, oy0 = center + outer * math.cos(angle), center + outer * math.sin(angle)
+        ox1, oy1 = center + outer * math.cos(end), center + outer * math.sin(end)
+        path = f'M{fmt(ox0)},{fmt(oy0)} A{fmt(outer)},{fmt(outer)} 0 {large} 1 {fmt(ox1)},{fmt(oy1)}'
+        if inner:
+            ix0, iy0 = center + inner * math.cos(angle), center + inner * math.sin(angle)
+            ix1, iy1 = center + inner * math.cos(end), center + inner * math.sin(end)
+            path += f' L{fmt(ix1)},{fmt(iy1)} A{fmt(inner)},{fmt(inner)} 0 {large} 0 {fmt(ix0)},{fmt(iy0)} Z'
+        else:
+            path += f' L{fmt(center)},{fmt(center)} Z'
+        parts.append(f'<path class="chart-slice" d="{path}" fill="{color}">{tooltip}</path>')
+        angle = end
+
+    parts.append('</svg>')
+    if legend:
+        parts.append(legend_html(labels, colors))
+    return ''.join(parts)
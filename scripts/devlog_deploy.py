@@ -0,0 +1,39 @@
+"""
+Dev Log Deployment Classification
+Decides at parse time whether a log is a deployment and which kind
+"""
+
+import re
+from typing import Dict, Optional
+
+
+DEPLOYMENT_CATEGORIES = ['hotfix', 'ci-config', 'infrastructure', 'release']
+
+# Lowercase keywords; none overlaps another, so one non-overlapping scan
+# finds every keyword present
+TITLE_KEYWORDS_RE = re.compile(r'fix|bug|workflow|docker|deploy|ci/cd')
+CONTENT_KEYWORDS_RE = re.compile(r'\.github/workflows|docker-compose')
+
+DEPLOYMENT_TITLE_KEYWORDS = {'deploy', 'workflow', 'docker', 'ci/cd'}
+
+
+def deployment_category(record: Dict, content: str) -> Optional[str]:
+    """Deployment category of a parsed log, or None when it is not a deployment
+
+    A log is a deployment when its type is 'ci', its title mentions
+    deploy/workflow/docker/ci-cd, or its body touches GitHub workflows or
+    docker-compose. Fix and bug titles are hotfixes, then workflow changes
+    are ci-config and docker changes infrastructure; the rest are releases.
+    """
+    title = set(TITLE_KEYWORDS_RE.findall(record.get('title', '').lower()))
+    body = set(CONTENT_KEYWORDS_RE.findall(content.lower()))
+
+    if not (record.get('type') == 'ci' or title & DEPLOYMENT_TITLE_KEYWORDS or body):
+        return None
+    if 'fix' in title or 'bug' in title:
+        return 'hotfix'
+    if 'workflow' in title or '.github/workflows' in body:
+        return 'ci-config'
+    if 'docker' in title or 'docker-compose' in body:
+        return 'infrastructure'
+    return 'release'
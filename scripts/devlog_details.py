@@ -0,0 +1,240 @@
+"""
+Dev Log Detail Shards
+Splits rendered log bodies into small script files that pages load when a modal opens
+"""
+
+import json
+import hashlib
+from html import escape
+from pathlib import Path
+from typing import Dict, List
+
+from devlog_store import full_content
+from devlog_markdown import RENDER_DIR, RENDERER_SIGNATURE, cached_render, open_render_cache, prune_render_cache
+
+
+DETAILS_DIR = Path(__file__).parent.parent / 'docs' / 'html' / 'data' / 'details'
+
+# Logs per shard. Shards are keyed by log number rather than list position,
+# so adding new logs leaves older shards (and their browser cache) alone.
+SHARD_SIZE = 50
+# Bump when the shard layout changes, so every shard gets a new version
+# and browsers drop bodies cached under the old layout
+SHARD_FORMAT = 2
+
+# Fields the card manifest carries inline; everything else stays in the shards.
+# file_rows is carried as its paths only, under 'files', for the path filter.
+MANIFEST_FIELDS = [
+    'log_number', 'type', 'title', 'date', 'author', 'commit',
+    'files_changed', 'lines_added', 'lines_deleted', 'details', 'content_sha', 'file_rows',
+]
+
+
+def shard_key(log: Dict) -> str:
+    """Get the shard a log's body lives in
+
+    Log numbers are parsed as zero-padded strings ('013'); logs without a
+    numeric one share the 'misc' shard.
+    """
+    number = str(log.get('log_number') or '')
+    if number.isascii() and number.isdigit():
+        return f'{int(number) // SHARD_SIZE:04d}'
+    return 'misc'
+
+
+def group_shards(logs: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group logs by shard key"""
+    shards = {}
+    for log in logs:
+        shards.setdefault(shard_key(log), []).append(log)
+    return shards
+
+
+def shard_versions(logs: List[Dict]) -> Dict[str, str]:
+    """Short hash per shard, derived from the content hashes it holds
+
+    Needs no blob reads, so pages can embed versions without loading bodies.
+    """
+    versions = {}
+    for key, shard_logs in group_shards(logs).items():
+        shas = [RENDERER_SIGNATURE, str(SHARD_FORMAT)] + sorted(log.get('content_sha') or '' for log in shard_logs)
+        versions[key] = hashlib.sha256('\n'.join(shas).encode('utf-8')).hexdigest()[:12]
+    return versions
+
+
+def card_manifest(logs: List[Dict]) -> List[Dict]:
+    """Compact per-log records for the page, pointing at their detail shard"""
+    manifest = []
+    for log in logs:
+        entry = {field: log[field] for field in MANIFEST_FIELDS if field in log and field != 'file_rows'}
+        paths = [row['path'] for row in log.get('file_rows', ())]
+        if paths:
+            entry['files'] = paths
+        entry['shard'] = shard_key(log)
+        manifest.append(entry)
+    return manifest
+
+
+def render_body(log: Dict, render_dir: Path) -> str:
+    """Rendered HTML body of one log
+
+    A log that cannot be rendered is shown as escaped source (or left empty
+    when its body cannot be read), so one bad file does not stop the build.
+    """
+    try:
+        return cached_render(render_dir, log['content_sha'], lambda: full_content(log))
+    except OSError as e:
+        print(f"[WARN] Could not read log {log.get('log_number', '?')}: {e}")
+        return ''
+    except Exception as e:
+        print(f"[WARN] Could not render log {log.get('log_number', '?')}: {e!r}")
+        return f'<pre>{escape(full_content(log), quote=False)}</pre>\n'
+
+
+def render_shard(key: str, version: str, shard_logs: List[Dict], render_dir: Path) -> str:
+    """Render one shard as a script that hands its HTML bodies to DevlogDetails
+
+    A script (rather than JSON fetched with fetch()) also loads when the
+    pages are opened straight from disk via file://. The first line records
+    the shard version so unchanged shards can be recognised without
+    rendering them.
+    """
+    bodies = {
+        log['content_sha']: render_body(log, render_dir)
+        for log in shard_logs if log.get('content_sha')
+    }
+    payload = json.dumps(bodies, ensure_ascii=False, sort_keys=True)
+    return f'// {version}\nDevlogDetails.receive({json.dumps(key)}, {payload});\n'
+
+
+def shard_version_on_disk(path: Path) -> str:
+    """Read the version line of an existing shard ('' if there is none)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.readline()[3:].strip()
+    except OSError:
+        return ''
+
+
+def write_detail_shards(logs: List[Dict], details_dir: Path = DETAILS_DIR,
+                        render_dir: Path = RENDER_DIR) -> int:
+    """Write shards whose version changed and remove stale ones
+
+    Bodies are rendered through the markdown render cache, so a rewritten
+    shard only renders the logs whose content is new.
+    Returns the number of shard files written.
+    """
+    details_dir.mkdir(parents=True, exist_ok=True)
+    render_dir = open_render_cache(render_dir)
+    shards = group_shards(logs)
+    versions = shard_versions(logs)
+
+    written = 0
+    for key, shard_logs in shards.items():
+        path = details_dir / f'{key}.js'
+        if shard_version_on_disk(path) == versions[key]:
+            continue
+        path.write_text(render_shard(key, versions[key], shard_logs, render_dir), encoding='utf-8')
+        written += 1
+
+    for path in details_dir.glob('*.js'):
+        if path.stem not in shards:
+            path.unlink()
+    prune_render_cache(render_dir, (log.get('content_sha') for log in logs))
+
+    return written
+
+
+# Shared by index.html and timeline.html. Bodies are cached in memory and in
+# sessionStorage, so a log opened on one page is not loaded again on the other.
+DETAILS_JS = '''
+const DevlogDetails = (function() {
+    const shards = {};
+    const pending = {};
+    let versions = {};
+
+    function storageKey(key) {
+        return `devlog-details:${key}:${versions[key] || ''}`;
+    }
+
+    function load(key) {
+        if (shards[key]) return Promise.resolve(shards[key]);
+
+        try {
+            const stored = sessionStorage.getItem(storageKey(key));
+            if (stored) {
+                shards[key] = JSON.parse(stored);
+                return Promise.resolve(shards[key]);
+            }
+        } catch (e) {}
+
+        if (!pending[key]) {
+            pending[key] = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = `data/details/${key}.js?v=${versions[key] || ''}`;
+                script.onload = () => {
+                    delete pending[key];
+                    shards[key] ? resolve(shards[key]) : reject(new Error(`Empty detail shard ${key}`));
+                };
+                script.onerror = () => {
+                    delete pending[key];
+                    reject(new Error(`Could not load detail shard ${key}`));
+                };
+                document.head.appendChild(script);
+            });
+        }
+        return pending[key];
+    }
+
+    return {
+        setVersions(shardVersions) {
+            versions = shardVersions;
+        },
+        receive(key, bodies) {
+            shards[key] = bodies;
+            try {
+                sessionStorage.setItem(storageKey(key), JSON.stringify(bodies));
+            } catch (e) {}
+        },
+        get(log) {
+            if (!log.content_sha) return Promise.resolve('');
+            return load(log.shard).then(bodies => bodies[log.content_sha] || '');
+        },
+    };
+})();
+
+let openModalIndex = null;
+
+function openModal(index) {
+    const log = logsData[index];
+    if (!log) return;
+
+    const modal = document.getElementById('detailModal');
+    const modalTitle = document.getElementById('modalTitle');
+    const modalBody = document.getElementById('modalBody');
+
+    openModalIndex = index;
+    modalTitle.textContent = `#${log.log_number} - ${log.title}`;
+    modalBody.textContent = 'Loading...';
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+
+    // Bodies are sanitized HTML rendered at build time (devlog_markdown.py)
+    DevlogDetails.get(log).then(html => {
+        if (openModalIndex !== index) return;
+        modalBody.innerHTML = html;
+    }).catch(() => {
+        if (openModalIndex === index) modalBody.textContent = 'Could not load details.';
+    });
+}
+'''
+
+
+def details_script(logs: List[Dict]) -> str:
+    """JavaScript defining logsData (the card manifest), DevlogDetails and openModal"""
+    # Inline in a <script> block, so "</" must not close it early
+    manifest = json.dumps(card_manifest(logs), ensure_ascii=False).replace('</', '<\\/')
+    versions = json.dumps(shard_versions(logs), sort_keys=True)
+    return (f'window.logsData = {manifest};\n'
+            f'{DETAILS_JS}\n'
+            f'DevlogDetails.setVersions({versions});\n')
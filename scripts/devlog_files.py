@@ -0,0 +1,153 @@
+"""
+Dev Log File Classification
+File-category rules compiled into single-pass matchers, and per-file change rows
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Category rules in priority order, as two tables that keep the historical
+# totals: CONTENT_CATEGORY_RULES counts references in each log body for the
+# stats page (case-sensitive, every occurrence of every pattern, so
+# 'page.tsx' counts as itself and as '.tsx'); PATH_CATEGORY_RULES classifies
+# file paths on the files page (lowercase, first category with a match).
+# A pattern may appear in only one category of a table.
+CONTENT_CATEGORY_RULES = [
+    ('frontend', ['frontend/', 'src/app/', 'src/components/', '.tsx', '.jsx', 'page.tsx']),
+    ('backend', ['server/', 'app/api/', 'app/models/', 'app/services/', '.py']),
+    ('docs', ['docs/', '.md', 'README']),
+    ('config', ['.yml', '.yaml', '.json', 'docker-compose', '.env', 'Dockerfile']),
+]
+PATH_CATEGORY_RULES = [
+    ('frontend', ['frontend/', 'src/app/', 'src/components/', '.tsx', '.jsx', 'styles/']),
+    ('backend', ['server/', 'app/', '.py', 'api/']),
+    ('docs', ['docs/', '.md', 'readme']),
+    ('config', ['.yml', '.yaml', '.json', '.toml', 'config', 'docker']),
+]
+
+CATEGORIES = [category for category, _ in CONTENT_CATEGORY_RULES]
+OTHER = 'other'
+
+
+def trie_pattern(patterns: Iterable[str]) -> str:
+    """Regex source matching any of patterns, factored as a trie
+
+    Shared prefixes are matched once, so each text position costs at most
+    the length of the longest pattern however many patterns there are;
+    the longest pattern starting at a position wins.
+    """
+    trie = {}
+    for pattern in patterns:
+        node = trie
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        alternatives = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{alternatives})?' if '' in node else alternatives
+
+    return build(trie)
+
+
+def compile_rules(rules: List) -> Tuple[re.Pattern, Dict[str, List[str]]]:
+    """Compile a rules table into one matcher: (regex, patterns per longest match)
+
+    The trie sits in a lookahead, so the scan reports the longest pattern
+    at every position, overlapping or not; the patterns that are prefixes
+    of it start there too. See occurrences. A leading first-character test
+    skips most positions before the trie is tried.
+    """
+    patterns = [pattern for _, category_patterns in rules for pattern in category_patterns]
+    first_chars = ''.join(sorted({re.escape(pattern[0]) for pattern in patterns}))
+    regex = re.compile(f'(?=[{first_chars}])(?=(' + trie_pattern(patterns) + '))')
+    prefixes = {pattern: [other for other in patterns if pattern.startswith(other)] for pattern in patterns}
+    return regex, prefixes
+
+
+def occurrences(matcher: Tuple[re.Pattern, Dict[str, List[str]]], text: str) -> Iterator[str]:
+    """Every pattern occurrence in text, in one scan
+
+    Yields a pattern once per position it starts at. No pattern overlaps
+    itself, so per pattern this is the same count as str.count.
+    """
+    regex, prefixes = matcher
+    for longest in regex.findall(text):
+        yield from prefixes[longest]
+
+
+CONTENT_CATEGORY_OF = {pattern: category for category, patterns in CONTENT_CATEGORY_RULES for pattern in patterns}
+PATH_CATEGORY_OF = {pattern: category for category, patterns in PATH_CATEGORY_RULES for pattern in patterns}
+PRIORITY = {category: rank for rank, category in enumerate(CATEGORIES)}
+CONTENT_MATCHER = compile_rules(CONTENT_CATEGORY_RULES)
+PATH_MATCHER = compile_rules(PATH_CATEGORY_RULES)
+
+
+def count_categories(text: str) -> Dict[str, int]:
+    """Occurrences of each category's content patterns in text, in one scan"""
+    counts = dict.fromkeys(CATEGORIES, 0)
+    for pattern in occurrences(CONTENT_MATCHER, text):
+        counts[CONTENT_CATEGORY_OF[pattern]] += 1
+    return counts
+
+
+def classify_path(path: str) -> str:
+    """Category of a file path: the highest-priority category it matches, else 'other'"""
+    best = None
+    for pattern in occurrences(PATH_MATCHER, path.lower()):
+        category = PATH_CATEGORY_OF[pattern]
+        if best is None or PRIORITY[category] < PRIORITY[best]:
+            best = category
+    return best or OTHER
+
+
+# Legacy 'Files Changed' table rows: | `~` | `path` | +12 | -3 |  (counts optional)
+FILE_TABLE_ROW_RE = re.compile(
+    r'^\|\s*`([~+\-])`\s*\|\s*`?([^`|\n]+?)`?\s*\|(?:\s*\+?(\d+)\s*\|)?(?:\s*-?(\d+)\s*\|)?',
+    re.MULTILINE,
+)
+# Current-layout lists: a '**Files Modified:**' / '### Files Created' label
+# followed by '- `path` - note' bullets, optionally '(+718 lines ...)'
+FILE_LIST_RE = re.compile(
+    r'^(?:\*\*|#{2,4}\s+)Files\s+(Modified|Created|Added|Deleted|Removed|Changed)\b[^\n]*\n'
+    r'((?:-\s+`[^`\n]+`[^\n]*(?:\n|$))+)',
+    re.MULTILINE | re.IGNORECASE,
+)
+FILE_LIST_ITEM_RE = re.compile(r'^-\s+`([^`\n]+)`(?:\s*\(\+(\d+)(?:\s*/\s*-(\d+))?)?', re.MULTILINE)
+
+TABLE_KINDS = {'~': 'modified', '+': 'added', '-': 'deleted'}
+LIST_KINDS = {'modified': 'modified', 'changed': 'modified', 'created': 'added', 'added': 'added',
+              'deleted': 'deleted', 'removed': 'deleted'}
+
+
+def extract_file_rows(content: str) -> List[Dict]:
+    """Per-file change rows of a log: {'path', 'kind', 'added', 'deleted'}
+
+    Reads the legacy Files Changed table and the current layout's
+    'Files Modified/Created' lists. A path listed more than once keeps its
+    first kind and the sum of its line counts; counts that are not given
+    are 0.
+    """
+    rows = {}
+
+    def add(path: str, kind: str, added: Optional[str], deleted: Optional[str]):
+        path = path.strip()
+        if not path or path == 'File':
+            return
+        row = rows.setdefault(path, {'path': path, 'kind': kind, 'added': 0, 'deleted': 0})
+        row['added'] += int(added or 0)
+        row['deleted'] += int(deleted or 0)
+
+    for marker, path, added, deleted in FILE_TABLE_ROW_RE.findall(content):
+        add(path, TABLE_KINDS[marker], added, deleted)
+
+    for label, items in FILE_LIST_RE.findall(content):
+        kind = LIST_KINDS[label.lower()]
+        for path, added, deleted in FILE_LIST_ITEM_RE.findall(items):
+            add(path, kind, added, deleted)
+
+    return list(rows.values())
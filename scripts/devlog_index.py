@@ -0,0 +1,34 @@
+"""
+Dev Log Index
+Constant-time lookups from log number to a position in data['logs']
+"""
+
+from typing import Dict, List
+
+
+# (logs list, index) of the last build, so every generator rendering the
+# same model shares one index instead of building its own
+_last = None
+
+
+def build_log_index(logs: List[Dict]) -> Dict[str, Dict]:
+    """Map log numbers to their first position in logs"""
+    by_number = {}
+    for position, log in enumerate(logs):
+        by_number.setdefault(log.get('log_number'), position)
+
+    return {'by_number': by_number}
+
+
+def log_index(logs: List[Dict]) -> Dict[str, Dict]:
+    """Get the index for logs, building it on first use"""
+    global _last
+    if _last is None or _last[0] is not logs:
+        _last = (logs, build_log_index(logs))
+    return _last[1]
+
+
+def position_of(logs: List[Dict], log: Dict) -> int:
+    """Position of log in logs (by log number), or 0 when it is not there"""
+    return log_index(logs)['by_number'].get(log.get('log_number'), 0)
+
@@ -0,0 +1,377 @@
+"""
+Dev Log Markdown Renderer
+Renders dev-log markdown to sanitized HTML at build time, with a render cache
+
+Covers the GitHub-flavoured subset the dev-logs use: headings, paragraphs
+(single newlines become <br>), nested lists, fenced code, tables,
+blockquotes, rules, emphasis, strikethrough, code spans, links, images and
+bare URLs. Raw HTML in the source is escaped, and links or images with a
+scheme other than http, https or mailto are dropped. Block quotes, lists
+and inline markup nested deeper than MAX_NESTING are shown as escaped text.
+"""
+
+import os
+import re
+import hashlib
+from html import escape
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+
+RENDER_DIR = Path(__file__).parent.parent / 'docs' / 'html' / 'data' / 'rendered'
+
+# Cached fragments are only valid for the renderer that produced them
+RENDERER_SIGNATURE = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})\s*([^`\s]*)')
+HEADING_RE = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+HR_RE = re.compile(r'^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+LIST_RE = re.compile(r'^([ \t]*)([-*+]|(\d{1,9})[.)])(?:[ \t]+(.*)|$)')
+QUOTE_RE = re.compile(r'^ {0,3}> ?(.*)$')
+TABLE_DELIMITER_RE = re.compile(r'^[ \t]*\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$')
+CELL_SPLIT_RE = re.compile(r'(?<!\\)\|')
+SCHEME_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9+.\-]*):')
+
+SAFE_SCHEMES = {'http', 'https', 'mailto'}
+
+# Deepest nesting of block quotes and lists (and, separately, of inline
+# markup) that is rendered; anything deeper is escaped text, so a hostile
+# log cannot exhaust the recursion limit
+MAX_NESTING = 16
+
+# Emphasis bodies cannot contain their own delimiter run, so a failed
+# opener only scans to the next delimiter; with '.+?' every unmatched
+# opener rescanned the rest of the text (quadratic on '_a _a _a ...').
+INLINE_RE = re.compile(
+    r'(?P<escape>\\[\\`*_{}\[\]()#+\-.!|~>])'
+    r'|(?P<code>(?P<ticks>`+)(?P<code_text>.+?)(?<!`)(?P=ticks)(?!`))'
+    r'|!\[(?P<alt>[^\[\]]*)\]\(\s*<?(?P<src>(?:[^()\s>]|\([^()\s]*\))*)>?(?:\s+"(?P<img_title>[^"]*)")?\s*\)'
+    r'|\[(?P<text>(?:[^\[\]]|\[[^\[\]]*\])+)\]\(\s*<?(?P<href>(?:[^()\s>]|\([^()\s]*\))*)>?(?:\s+"(?P<link_title>[^"]*)")?\s*\)'
+    r'|<(?P<angle_url>https?://[^>\s]+)>'
+    r'|(?P<url>(?<![\w/])https?://[^\s<]*[^\s<.,:;"\')\]!?])'
+    r'|\*\*(?P<strong>[^*\s](?:(?:[^*]|\*(?!\*))*?[^*\s])?)\*\*'
+    r'|(?<![A-Za-z0-9_])__(?P<strong_u>[^_\s](?:(?:[^_]|_(?!_))*?[^_\s])?)__(?![A-Za-z0-9_])'
+    r'|~~(?P<del>[^~\s](?:(?:[^~]|~(?!~))*?[^~\s])?)~~'
+    r'|\*(?P<em>[^*\s](?:[^*]*?[^*\s])?)\*'
+    r'|(?<![A-Za-z0-9_])_(?P<em_u>[^_\s](?:[^_]*?[^_\s])?)_(?![A-Za-z0-9_])'
+)
+
+
+def safe_url(url: str) -> str:
+    """Return url if it is relative or uses an allowed scheme, else ''"""
+    url = ''.join(ch for ch in url if ch > ' ')
+    scheme = SCHEME_RE.match(url)
+    if scheme and scheme.group(1).lower() not in SAFE_SCHEMES:
+        return ''
+    return url
+
+
+def render_inline(text: str, depth: int = 0) -> str:
+    """Render inline markdown, escaping everything else"""
+    if depth > MAX_NESTING:
+        return escape(text, quote=False)
+
+    out = []
+    position = 0
+    for match in INLINE_RE.finditer(text):
+        out.append(escape(text[position:match.start()], quote=False))
+        position = match.end()
+        kind = match.lastgroup
+
+        if match.group('escape'):
+            out.append(escape(match.group('escape')[1], quote=False))
+        elif match.group('code'):
+            out.append(f"<code>{escape(match.group('code_text').strip(), quote=False)}</code>")
+        elif match.group('src') is not None:
+            src = safe_url(match.group('src'))
+            alt = escape(match.group('alt'))
+            if src:
+                title = match.group('img_title')
+                title_attr = f' title="{escape(title)}"' if title else ''
+                out.append(f'<img src="{escape(src)}" alt="{alt}"{title_attr}>')
+            else:
+                out.append(alt)
+        elif match.group('href') is not None:
+            href = safe_url(match.group('href'))
+            label = render_inline(match.group('text'), depth + 1)
+            if href:
+                title = match.group('link_title')
+                title_attr = f' title="{escape(title)}"' if title else ''
+                out.append(f'<a href="{escape(href)}"{title_attr}>{label}</a>')
+            else:
+                out.append(label)
+        elif match.group('angle_url') or match.group('url'):
+            url = match.group('angle_url') or match.group('url')
+            out.append(f'<a href="{escape(url)}">{escape(url, quote=False)}</a>')
+        elif kind in ('strong', 'strong_u'):
+            out.append(f'<strong>{render_inline(match.group(kind), depth + 1)}</strong>')
+        elif kind == 'del':
+            out.append(f"<del>{render_inline(match.group('del'), depth + 1)}</del>")
+        else:
+            out.append(f'<em>{render_inline(match.group(kind), depth + 1)}</em>')
+
+    out.append(escape(text[position:], quote=False))
+    return ''.join(out)
+
+
+def indent_width(line: str) -> int:
+    """Leading whitespace width, counting tabs as four spaces"""
+    width = 0
+    for ch in line:
+        if ch == ' ':
+            width += 1
+        elif ch == '\t':
+            width += 4 - width % 4
+        else:
+            break
+    return width
+
+
+def dedent(lines: List[str], width: int) -> List[str]:
+    """Remove up to width columns of leading whitespace from each line"""
+    out = []
+    for line in lines:
+        expanded = line.expandtabs(4)
+        strip = min(width, indent_width(expanded))
+        out.append(expanded[strip:])
+    return out
+
+
+def is_table_start(lines: List[str], i: int) -> bool:
+    """Check for a header row followed by a delimiter row"""
+    return ('|' in lines[i] and i + 1 < len(lines)
+            and '-' in lines[i + 1] and TABLE_DELIMITER_RE.match(lines[i + 1]) is not None)
+
+
+def starts_block(lines: List[str], i: int) -> bool:
+    """Check whether line i interrupts a paragraph"""
+    line = lines[i]
+    if FENCE_RE.match(line) or HEADING_RE.match(line) or HR_RE.match(line) or QUOTE_RE.match(line):
+        return True
+    item = LIST_RE.match(line)
+    if item and item.group(4) and (item.group(3) is None or item.group(3) == '1'):
+        return True
+    return is_table_start(lines, i)
+
+
+def split_row(line: str) -> List[str]:
+    """Split a table row into cell texts"""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in CELL_SPLIT_RE.split(line)]
+
+
+def render_table(lines: List[str], i: int) -> Tuple[str, int]:
+    """Render a pipe table starting at line i"""
+    header = split_row(lines[i])
+    aligns = []
+    for cell in split_row(lines[i + 1]):
+        left, right = cell.startswith(':'), cell.endswith(':')
+        aligns.append('center' if left and right else 'right' if right else 'left' if left else '')
+
+    def cells(row: List[str], tag: str) -> str:
+        out = []
+        for column in range(len(header)):
+            text = row[column] if column < len(row) else ''
+            align = aligns[column] if column < len(aligns) else ''
+            align_attr = f' align="{align}"' if align else ''
+            out.append(f'<{tag}{align_attr}>{render_inline(text)}</{tag}>')
+        return ''.join(out)
+
+    html = [f'<table>\n<thead>\n<tr>{cells(header, "th")}</tr>\n</thead>\n']
+    i += 2
+    body = []
+    while i < len(lines) and lines[i].strip() and '|' in lines[i] and not starts_block(lines, i):
+        body.append(f'<tr>{cells(split_row(lines[i]), "td")}</tr>\n')
+        i += 1
+    if body:
+        html.append('<tbody>\n' + ''.join(body) + '</tbody>\n')
+    html.append('</table>\n')
+    return ''.join(html), i
+
+
+def render_list(lines: List[str], i: int, depth: int = 0) -> Tuple[str, int]:
+    """Render a (possibly nested) list starting at line i, depth levels down"""
+    first = LIST_RE.match(lines[i])
+    indent = indent_width(first.group(1))
+    ordered = first.group(3) is not None
+
+    items = []
+    loose = False
+    while i < len(lines):
+        item = LIST_RE.match(lines[i])
+        if not item or indent_width(item.group(1)) != indent or (item.group(3) is not None) != ordered:
+            break
+
+        content_indent = indent + len(item.group(2)) + 1
+        body = [item.group(4) or '']
+        i += 1
+        while i < len(lines):
+            line = lines[i]
+            if not line.strip():
+                following = next((j for j in range(i + 1, len(lines)) if lines[j].strip()), None)
+                if following is not None and indent_width(lines[following]) > indent:
+                    body.append('')
+                    i += 1
+                    continue
+                break
+            if indent_width(line) > indent:
+                body.append(line)
+            elif LIST_RE.match(line) or starts_block(lines, i):
+                break
+            else:
+                body.append(line.strip())
+            i += 1
+
+        # A blank line between items (or inside one) makes the list loose
+        if i < len(lines) and not lines[i].strip():
+            following = next((j for j in range(i + 1, len(lines)) if lines[j].strip()), None)
+            if following is not None:
+                next_item = LIST_RE.match(lines[following])
+                if (next_item and indent_width(next_item.group(1)) == indent
+                        and (next_item.group(3) is not None) == ordered):
+                    loose = True
+                    i = following
+        if '' in body[1:]:
+            loose = True
+
+        items.append([body[0]] + dedent(body[1:], content_indent))
+
+    rendered = ''.join(f'<li>{render_blocks(body, tight=not loose, depth=depth + 1).strip()}</li>\n' for body in items)
+    if ordered:
+        start = int(first.group(3))
+        start_attr = f' start="{start}"' if start != 1 else ''
+        return f'<ol{start_attr}>\n{rendered}</ol>\n', i
+    return f'<ul>\n{rendered}</ul>\n', i
+
+
+def render_blocks(lines: List[str], tight: bool = False, depth: int = 0) -> str:
+    """Render a sequence of block-level lines
+
+    tight drops the <p> around paragraphs, as inside tight list items.
+    depth counts the enclosing block quotes and list items; past
+    MAX_NESTING the lines are escaped text.
+    """
+    if depth > MAX_NESTING:
+        text = '<br>\n'.join(escape(line.strip(), quote=False) for line in lines if line.strip())
+        return f'{text}\n' if tight else f'<p>{text}</p>\n'
+
+    out = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if not line.strip():
+            i += 1
+            continue
+
+        fence = FENCE_RE.match(line)
+        if fence:
+            marker = fence.group(1)
+            language = fence.group(2)
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith(marker):
+                code.append(lines[i])
+                i += 1
+            i += 1
+            class_attr = f' class="language-{escape(language)}"' if language else ''
+            code_text = escape('\n'.join(code), quote=False)
+            out.append(f'<pre><code{class_attr}>{code_text}\n</code></pre>\n')
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            level = len(heading.group(1))
+            out.append(f'<h{level}>{render_inline(heading.group(2) or "")}</h{level}>\n')
+            i += 1
+            continue
+
+        if HR_RE.match(line):
+            out.append('<hr>\n')
+            i += 1
+            continue
+
+        if QUOTE_RE.match(line):
+            quoted = []
+            while i < len(lines) and lines[i].strip():
+                quote = QUOTE_RE.match(lines[i])
+                quoted.append(quote.group(1) if quote else lines[i])
+                i += 1
+            out.append(f'<blockquote>\n{render_blocks(quoted, depth=depth + 1)}</blockquote>\n')
+            continue
+
+        if LIST_RE.match(line) and LIST_RE.match(line).group(4) is not None:
+            html, i = render_list(lines, i, depth)
+            out.append(html)
+            continue
+
+        if is_table_start(lines, i):
+            html, i = render_table(lines, i)
+            out.append(html)
+            continue
+
+        paragraph = [line.strip()]
+        i += 1
+        while i < len(lines) and lines[i].strip() and not starts_block(lines, i):
+            paragraph.append(lines[i].strip())
+            i += 1
+        text = '<br>\n'.join(render_inline(part) for part in paragraph)
+        out.append(f'{text}\n' if tight else f'<p>{text}</p>\n')
+
+    return ''.join(out)
+
+
+def render_markdown(text: str) -> str:
+    """Render markdown text to sanitized HTML"""
+    return render_blocks(text.replace('\r\n', '\n').replace('\r', '\n').split('\n'))
+
+
+def open_render_cache(render_dir: Path = RENDER_DIR) -> Path:
+    """Get the render cache directory, emptying it if another renderer filled it"""
+    stamp = render_dir / '.renderer'
+    try:
+        current = stamp.read_text(encoding='utf-8').strip()
+    except OSError:
+        current = None
+
+    if current != RENDERER_SIGNATURE:
+        render_dir.mkdir(parents=True, exist_ok=True)
+        for path in render_dir.glob('*.html'):
+            path.unlink()
+        stamp.write_text(RENDERER_SIGNATURE + '\n', encoding='utf-8')
+
+    return render_dir
+
+
+def cached_render(render_dir: Path, sha: str, text_loader) -> str:
+    """Get the rendered HTML for content sha, rendering and storing it on a miss
+
+    text_loader is only called on a miss, so cached entries never read the
+    markdown body.
+    """
+    path = render_dir / f'{sha}.html'
+    try:
+        return path.read_text(encoding='utf-8')
+    except OSError:
+        pass
+
+    html = render_markdown(text_loader())
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.write_text(html, encoding='utf-8')
+    os.replace(tmp_path, path)
+    return html
+
+
+def prune_render_cache(render_dir: Path, keep: Iterable[str]) -> int:
+    """Delete rendered fragments for content that is gone, returning how many"""
+    keep = set(keep)
+    removed = 0
+    for path in render_dir.glob('*.html'):
+        if path.stem not in keep:
+            path.unlink()
+            removed += 1
+    return removed
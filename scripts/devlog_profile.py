@@ -0,0 +1,176 @@
+"""
+Dev Log Build Profiler
+Records wall time, CPU time and tracemalloc peak per build stage
+"""
+
+import os
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+
+_enabled = False
+_events: List[Dict] = []
+_stack: List[Dict] = []
+
+
+class _NullSpan:
+    """Span used while profiling is off; costs one attribute lookup"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Timed region; nested spans report their own peak without hiding it from the parent"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if _stack:
+            parent = _stack[-1]
+            parent['peak'] = max(parent['peak'], peak)
+        tracemalloc.reset_peak()
+
+        self.frame = {'peak': current, 'start_mem': current}
+        _stack.append(self.frame)
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        _stack.pop()
+
+        peak = max(self.frame['peak'], tracemalloc.get_traced_memory()[1])
+        if _stack:
+            _stack[-1]['peak'] = max(_stack[-1]['peak'], peak)
+
+        _events.append({
+            'name': self.name,
+            'pid': os.getpid(),
+            'start': self.wall,
+            'wall': wall,
+            'cpu': cpu,
+            'peak': peak - self.frame['start_mem'],
+        })
+        return False
+
+
+def enable():
+    """Start recording spans"""
+    global _enabled
+    _enabled = True
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def enabled() -> bool:
+    """Check whether spans are being recorded"""
+    return _enabled
+
+
+def span(name: str):
+    """Context manager timing the enclosed block under name"""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def reset_worker():
+    """Forget the events and open spans a forked worker inherited from its parent
+
+    Used as the process-pool initializer, so drain() in a worker returns
+    only that worker's own spans.
+    """
+    _events.clear()
+    _stack.clear()
+
+
+def drain() -> List[Dict]:
+    """Take the events recorded so far (used to ship them out of workers)"""
+    events = _events[:]
+    _events.clear()
+    return events
+
+
+def merge(events: List[Dict]):
+    """Add events recorded in another process"""
+    _events.extend(events)
+
+
+def summarize(events: List[Dict]) -> List[Dict]:
+    """Aggregate events by name, sorted by total wall time"""
+    totals = {}
+    for event in events:
+        row = totals.setdefault(event['name'], {
+            'name': event['name'], 'count': 0, 'wall': 0.0, 'cpu': 0.0, 'peak': 0,
+        })
+        row['count'] += 1
+        row['wall'] += event['wall']
+        row['cpu'] += event['cpu']
+        row['peak'] = max(row['peak'], event['peak'])
+
+    return sorted(totals.values(), key=lambda row: row['wall'], reverse=True)
+
+
+def write_trace(output_file: Path) -> List[Dict]:
+    """Write recorded events as a Chrome trace (chrome://tracing, Perfetto)
+
+    The file also carries the aggregated summary under "summary".
+    Returns the summary rows.
+    """
+    events = drain()
+    origin = min((event['start'] for event in events), default=0.0)
+    summary = summarize(events)
+
+    trace = {
+        'traceEvents': [
+            {
+                'name': event['name'],
+                'ph': 'X',
+                'pid': event['pid'],
+                'tid': event['pid'],
+                'ts': round((event['start'] - origin) * 1e6, 1),
+                'dur': round(event['wall'] * 1e6, 1),
+                'args': {
+                    'cpu_ms': round(event['cpu'] * 1000, 3),
+                    'peak_kb': round(event['peak'] / 1024, 1),
+                },
+            }
+            for event in events
+        ],
+        'summary': [
+            {
+                'name': row['name'],
+                'count': row['count'],
+                'wall_ms': round(row['wall'] * 1000, 3),
+                'cpu_ms': round(row['cpu'] * 1000, 3),
+                'peak_kb': round(row['peak'] / 1024, 1),
+            }
+            for row in summary
+        ],
+    }
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(trace, f, indent=1)
+
+    return summary
+
+
+def print_summary(summary: List[Dict], limit: int = 40):
+    """Print the aggregated spans as a table"""
+    print(f"\n{'Stage':<36} {'Count':>7} {'Wall ms':>10} {'CPU ms':>10} {'Peak KB':>10}")
+    print('-' * 77)
+    for row in summary[:limit]:
+        print(f"{row['name']:<36} {row['count']:>7} {row['wall'] * 1000:>10.2f} "
+              f"{row['cpu'] * 1000:>10.2f} {row['peak'] / 1024:>10.1f}")
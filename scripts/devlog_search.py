@@ -0,0 +1,312 @@
+"""
+Dev Log Search Index
+Inverted index over log metadata for the kanban search box, sharded by term range
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+SEARCH_DIR = Path(__file__).parent.parent / 'docs' / 'html' / 'data' / 'search'
+
+_search_dir = SEARCH_DIR
+
+# A first-character shard with more postings than this is split by its
+# second character (or, for Hangul, by its first syllable)
+SHARD_POSTINGS = 20000
+
+SEARCH_FIELDS = ['title', 'summary', 'details', 'author', 'type']
+
+# Runs of Latin letters/digits, or of Hangul syllables
+TOKEN_RE = re.compile(r'[a-z0-9]+|[가-힣]+')
+
+# Backticked paths such as `apps/web/src/page.tsx` or `Dockerfile.dev`
+PATH_RE = re.compile(r'`([\w@.\-]+(?:/[\w@.\-]+)+|[\w\-]+\.[A-Za-z0-9]{1,6})`')
+
+HANGUL_FIRST = 0xAC00
+HANGUL_LAST = 0xD7A3
+# Syllables per initial consonant in the Unicode Hangul block
+SYLLABLES_PER_INITIAL = 588
+
+
+def set_search_dir(search_dir: Path):
+    """Point the index writer and search_script() at another directory (e.g. a benchmark corpus)"""
+    global _search_dir
+    _search_dir = search_dir
+
+
+def is_hangul(ch: str) -> bool:
+    """Check for a precomposed Hangul syllable"""
+    return HANGUL_FIRST <= ord(ch) <= HANGUL_LAST
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index terms
+
+    Latin words of two or more characters are kept whole (queries match them
+    by prefix). Hangul runs carry particles and compounds without spaces, so
+    they are indexed as syllable bigrams, or as the single syllable when the
+    run is one syllable long.
+    """
+    terms = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if not is_hangul(token[0]):
+            if len(token) > 1:
+                terms.append(token)
+        elif len(token) == 1:
+            terms.append(token)
+        else:
+            terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return terms
+
+
+def search_terms(record: Dict, content: str) -> List[str]:
+    """Distinct index terms for a parsed log and its markdown body"""
+    parts = []
+    for field in SEARCH_FIELDS:
+        value = record.get(field)
+        if isinstance(value, list):
+            parts.extend(str(item) for item in value)
+        elif value:
+            parts.append(str(value))
+    parts.extend(PATH_RE.findall(content))
+    return sorted(set(tokenize(' '.join(parts))))
+
+
+def shard_prefix(term: str) -> str:
+    """First-level shard: the first letter/digit, or the Hangul initial consonant"""
+    first = term[0]
+    if is_hangul(first):
+        return 'h%02d' % ((ord(first) - HANGUL_FIRST) // SYLLABLES_PER_INITIAL)
+    if first.isascii() and first.isalnum():
+        return first
+    return '_'
+
+
+def shard_split_key(term: str) -> str:
+    """Second-level shard used once a first-level shard grows too large"""
+    second = term[0] if is_hangul(term[0]) else term[1:2]
+    return f"{shard_prefix(term)}.{ord(second):x}" if second else f"{shard_prefix(term)}."
+
+
+def build_postings(logs: List[Dict]) -> Dict[str, List[int]]:
+    """Map each term to the ascending ids of the logs containing it
+
+    Ids count from the oldest log (id = len(logs) - 1 - position), so they
+    stay put when newer logs are added at the front of the list.
+    """
+    postings = {}
+    total = len(logs)
+    for position in range(total - 1, -1, -1):
+        doc = total - 1 - position
+        for term in logs[position].get('search_terms', ()):
+            postings.setdefault(term, []).append(doc)
+    return postings
+
+
+def shard_postings(postings: Dict[str, List[int]]) -> Dict[str, Dict[str, List[int]]]:
+    """Group terms into shards by range, splitting oversized shards"""
+    first_level = {}
+    for term in sorted(postings):
+        first_level.setdefault(shard_prefix(term), {})[term] = postings[term]
+
+    shards = {}
+    for prefix, terms in first_level.items():
+        if sum(len(docs) for docs in terms.values()) <= SHARD_POSTINGS:
+            shards[prefix] = terms
+            continue
+        for term, docs in terms.items():
+            shards.setdefault(shard_split_key(term), {})[term] = docs
+    return shards
+
+
+def render_index_shard(key: str, terms: Dict[str, List[int]]) -> str:
+    """Render a shard as a script; postings are delta-encoded"""
+    encoded = {}
+    for term, docs in terms.items():
+        previous = 0
+        deltas = []
+        for doc in docs:
+            deltas.append(doc - previous)
+            previous = doc
+        encoded[term] = deltas
+    payload = json.dumps(encoded, ensure_ascii=False, separators=(',', ':'))
+    return f'DevlogSearch.receive({json.dumps(key)}, {payload});\n'
+
+
+def write_search_index(logs: List[Dict], search_dir: Optional[Path] = None) -> Dict[str, str]:
+    """Write changed index shards, remove stale ones and return {shard: version}
+
+    Per-log terms come from the parse cache, so only new or edited logs are
+    tokenized; shards whose bytes did not change are left untouched.
+    """
+    search_dir = search_dir or _search_dir
+    search_dir.mkdir(parents=True, exist_ok=True)
+    shards = shard_postings(build_postings(logs))
+
+    versions = {}
+    for key, terms in shards.items():
+        encoded = render_index_shard(key, terms).encode('utf-8')
+        versions[key] = hashlib.sha256(encoded).hexdigest()[:12]
+        path = search_dir / f'{key}.js'
+        try:
+            if path.read_bytes() == encoded:
+                continue
+        except OSError:
+            pass
+        path.write_bytes(encoded)
+
+    for path in search_dir.glob('*.js'):
+        if path.stem not in shards:
+            path.unlink()
+
+    manifest = {'total': len(logs), 'shards': versions}
+    with open(search_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return versions
+
+
+def load_search_manifest(search_dir: Optional[Path] = None) -> Dict:
+    """Load the shard manifest written by write_search_index"""
+    search_dir = search_dir or _search_dir
+    try:
+        with open(search_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'total': 0, 'shards': {}}
+
+
+# Query side of the index, kept in step with tokenize() and the shard keys above
+SEARCH_JS = '''
+const DevlogSearch = (function() {
+    const HANGUL_FIRST = 0xAC00, HANGUL_LAST = 0xD7A3;
+    const shards = {};
+    const pending = {};
+    let manifest = {total: 0, shards: {}};
+
+    const isHangul = ch => {
+        const code = ch.charCodeAt(0);
+        return code >= HANGUL_FIRST && code <= HANGUL_LAST;
+    };
+
+    // One query token -> list of [term, exact] lookups that must all match
+    function queryTerms(text) {
+        const groups = [];
+        for (const token of text.toLowerCase().match(/[a-z0-9]+|[\\uac00-\\ud7a3]+/g) || []) {
+            if (!isHangul(token[0]) || token.length === 1) {
+                groups.push([[token, false]]);
+            } else {
+                const bigrams = [];
+                for (let i = 0; i < token.length - 1; i++) bigrams.push([token.slice(i, i + 2), true]);
+                groups.push(bigrams);
+            }
+        }
+        return groups;
+    }
+
+    function shardPrefix(term) {
+        const first = term[0];
+        if (isHangul(first)) {
+            return 'h' + String(Math.floor((first.charCodeAt(0) - HANGUL_FIRST) / 588)).padStart(2, '0');
+        }
+        return /[a-z0-9]/.test(first) ? first : '_';
+    }
+
+    // Shards that may hold terms starting with term
+    function shardsFor(term) {
+        const prefix = shardPrefix(term);
+        if (manifest.shards[prefix]) return [prefix];
+
+        const second = isHangul(term[0]) ? term[0] : term.slice(1, 2);
+        if (second) {
+            const key = `${prefix}.${second.charCodeAt(0).toString(16)}`;
+            return manifest.shards[key] ? [key] : [];
+        }
+        return Object.keys(manifest.shards).filter(key => key.startsWith(prefix + '.'));
+    }
+
+    function load(key) {
+        if (shards[key]) return Promise.resolve(shards[key]);
+        if (!pending[key]) {
+            pending[key] = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = `data/search/${key}.js?v=${manifest.shards[key]}`;
+                script.onload = () => {
+                    delete pending[key];
+                    resolve(shards[key] || {});
+                };
+                script.onerror = () => {
+                    delete pending[key];
+                    reject(new Error(`Could not load search shard ${key}`));
+                };
+                document.head.appendChild(script);
+            });
+        }
+        return pending[key];
+    }
+
+    function decode(deltas) {
+        const docs = [];
+        let doc = 0;
+        for (const delta of deltas) {
+            doc += delta;
+            docs.push(doc);
+        }
+        return docs;
+    }
+
+    // Log positions (indexes into logsData) containing term, or a prefix of it
+    async function lookup(term, exact) {
+        const found = new Set();
+        for (const key of shardsFor(term)) {
+            const terms = await load(key);
+            if (exact) {
+                if (terms[term]) decode(terms[term]).forEach(doc => found.add(doc));
+                continue;
+            }
+            for (const candidate in terms) {
+                if (candidate.startsWith(term)) decode(terms[candidate]).forEach(doc => found.add(doc));
+            }
+        }
+        return new Set([...found].map(doc => manifest.total - 1 - doc));
+    }
+
+    function intersect(a, b) {
+        return new Set([...a].filter(value => b.has(value)));
+    }
+
+    return {
+        setManifest(searchManifest) {
+            manifest = searchManifest;
+        },
+        receive(key, terms) {
+            shards[key] = terms;
+        },
+        // Resolves to a Set of logsData indexes, or null for an empty query
+        async search(text) {
+            const groups = queryTerms(text);
+            if (!groups.length) return null;
+
+            let result = null;
+            for (const group of groups) {
+                for (const [term, exact] of group) {
+                    const matches = await lookup(term, exact);
+                    result = result ? intersect(result, matches) : matches;
+                    if (!result.size) return result;
+                }
+            }
+            return result;
+        },
+    };
+})();
+'''
+
+
+def search_script(search_dir: Optional[Path] = None) -> str:
+    """JavaScript defining DevlogSearch, primed with the current shard manifest"""
+    manifest = json.dumps(load_search_manifest(search_dir), sort_keys=True)
+    return f'{SEARCH_JS}\nDevlogSearch.setManifest({manifest});\n'
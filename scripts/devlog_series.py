@@ -0,0 +1,120 @@
+"""
+Dev Log Activity Series
+Dense per-day activity arrays with prefix-sum moving windows
+"""
+
+from datetime import date
+from itertools import accumulate
+from typing import Dict, Iterable, List
+
+
+SERIES_METRICS = ['commits', 'lines_added', 'lines_deleted', 'files_changed']
+MOVING_WINDOWS = [7, 28, 90]
+# Days of history the trend charts show
+TREND_DAYS = 365
+
+
+def empty_series() -> Dict:
+    """A series covering no days yet"""
+    series = {'start_day': None}
+    for metric in SERIES_METRICS:
+        series[metric] = []
+    return series
+
+
+def extend_series(series: Dict, logs: Iterable[Dict]) -> Dict:
+    """Add logs to a series in place and return it
+
+    Only the given logs are visited. The day range grows to cover them,
+    padding with zero days at either end; logs without a parsed date are
+    skipped. Entry i of every metric is day start_day + i.
+    """
+    logs = [log for log in logs if 'day' in log]
+    if not logs:
+        return series
+
+    first = min(log['day'] for log in logs)
+    last = max(log['day'] for log in logs)
+    start = series['start_day']
+    length = len(series['commits'])
+
+    if start is None:
+        start = first
+    elif first < start:
+        for metric in SERIES_METRICS:
+            series[metric][:0] = [0] * (start - first)
+        length += start - first
+        start = first
+    if last >= start + length:
+        for metric in SERIES_METRICS:
+            series[metric].extend([0] * (last + 1 - start - length))
+    series['start_day'] = start
+
+    commits, added, deleted, files = (series[metric] for metric in SERIES_METRICS)
+    for log in logs:
+        i = log['day'] - start
+        commits[i] += 1
+        added[i] += log.get('lines_added', 0)
+        deleted[i] += log.get('lines_deleted', 0)
+        files[i] += log.get('files_changed', 0)
+    return series
+
+
+def retract_series(series: Dict, logs: Iterable[Dict]) -> Dict:
+    """Remove logs previously added to a series, in place, and return it
+
+    For logs that were deleted or edited since the series was built. Days
+    left without commits at either end are trimmed, so the result matches a
+    series built from the remaining logs.
+    """
+    start = series['start_day']
+    commits, added, deleted, files = (series[metric] for metric in SERIES_METRICS)
+    for log in logs:
+        if 'day' not in log:
+            continue
+        i = log['day'] - start
+        commits[i] -= 1
+        added[i] -= log.get('lines_added', 0)
+        deleted[i] -= log.get('lines_deleted', 0)
+        files[i] -= log.get('files_changed', 0)
+
+    first = next((i for i, count in enumerate(commits) if count), None)
+    if first is None:
+        return empty_series()
+    last = max(i for i, count in enumerate(commits) if count)
+    for metric in SERIES_METRICS:
+        series[metric] = series[metric][first:last + 1]
+    series['start_day'] = start + first
+    return series
+
+
+def build_series(logs: Iterable[Dict]) -> Dict:
+    """Per-day commits, lines added/deleted and files changed over the whole history"""
+    return extend_series(empty_series(), logs)
+
+
+def series_days(series: Dict) -> List[str]:
+    """ISO date of every entry in a series"""
+    start = series['start_day']
+    if start is None:
+        return []
+    return [date.fromordinal(start + i).isoformat() for i in range(len(series['commits']))]
+
+
+def moving_sums(values: List[int], window: int) -> List[int]:
+    """Trailing sums over the last window days, entry by entry
+
+    One prefix-sum pass makes every window a single subtraction, so the
+    cost does not depend on the window size.
+    """
+    prefix = [0, *accumulate(values)]
+    return [prefix[i + 1] - prefix[max(0, i + 1 - window)] for i in range(len(values))]
+
+
+def moving_averages(values: List[int], window: int) -> List[float]:
+    """Trailing per-day averages over the last window days
+
+    Days before the first log count as idle, so early averages ramp up
+    instead of overstating a short history.
+    """
+    return [round(total / window, 2) for total in moving_sums(values, window)]
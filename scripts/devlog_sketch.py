@@ -0,0 +1,128 @@
+"""
+Dev Log Quantile Sketch
+Mergeable log-bucketed sketch for approximate quantiles of non-negative sizes
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Buckets per doubling. Bucket i holds values in (2^((i-1)/32), 2^(i/32)],
+# so every bucket is within about 1.1% of its values, and runs of 32
+# buckets line up exactly with the power-of-two histogram bins.
+SUBBINS = 32
+GAMMA = 2 ** (1 / SUBBINS)
+RELATIVE_ACCURACY = (GAMMA - 1) / (GAMMA + 1)
+
+
+def new_sketch() -> Dict:
+    """An empty sketch"""
+    return {'count': 0, 'zeros': 0, 'bins': {}}
+
+
+def bucket_index(value: float) -> int:
+    """Bucket holding a positive value"""
+    return math.ceil(math.log2(value) * SUBBINS)
+
+
+def sketch_add(sketch: Dict, value: float) -> Dict:
+    """Add one non-negative value to a sketch in place and return it"""
+    sketch['count'] += 1
+    if value <= 0:
+        sketch['zeros'] += 1
+    else:
+        index = bucket_index(value)
+        sketch['bins'][index] = sketch['bins'].get(index, 0) + 1
+    return sketch
+
+
+def build_sketch(values: Iterable[float]) -> Dict:
+    """Sketch of all values"""
+    sketch = new_sketch()
+    for value in values:
+        sketch_add(sketch, value)
+    return sketch
+
+
+def merge_sketches(sketches: Iterable[Dict]) -> Dict:
+    """Sketch of the union of the sketched values, without revisiting them
+
+    Bucket boundaries are fixed, so merging adds counts bucket by bucket and
+    the result is the same as sketching every value at once.
+    """
+    merged = new_sketch()
+    bins = merged['bins']
+    for sketch in sketches:
+        merged['count'] += sketch['count']
+        merged['zeros'] += sketch['zeros']
+        for index, count in sketch['bins'].items():
+            bins[index] = bins.get(index, 0) + count
+    return merged
+
+
+def bucket_value(index: int) -> float:
+    """Representative value of a bucket, equally close in relative terms to both ends"""
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+def value_bucket(value: float) -> float:
+    """Bucket of any value; zero and below share a bucket under every positive one"""
+    return bucket_index(value) if value > 0 else -math.inf
+
+
+def bucket_upper(bucket: float) -> int:
+    """Largest integer in a bucket from value_bucket"""
+    return 0 if bucket == -math.inf else math.floor(2 ** (bucket / SUBBINS))
+
+
+def quantile_buckets(sketch: Dict, qs: List[float]) -> List[Optional[float]]:
+    """Buckets (as from value_bucket) holding the quantiles qs, in one walk
+
+    Comparing value_bucket(x) with these is exact: x is at or below the
+    quantile's bucket whatever its position inside it. An empty sketch gives
+    None for every quantile.
+    """
+    if not sketch['count']:
+        return [None] * len(qs)
+
+    order = sorted(range(len(qs)), key=lambda i: qs[i])
+    results = [None] * len(qs)
+    buckets = iter(sorted(sketch['bins'].items()))
+    seen = sketch['zeros']
+    bucket = -math.inf
+    for i in order:
+        rank = qs[i] * (sketch['count'] - 1)
+        while seen <= rank:
+            bucket, count = next(buckets)
+            seen += count
+        results[i] = bucket
+    return results
+
+
+def sketch_quantiles(sketch: Dict, qs: List[float]) -> List[Optional[float]]:
+    """Approximate values at the quantiles qs (each within 0..1), in one walk
+
+    Each result is within RELATIVE_ACCURACY of the exact value at rank
+    q * (count - 1); an empty sketch gives None for every quantile.
+    """
+    return [None if bucket is None else 0.0 if bucket == -math.inf else bucket_value(bucket)
+            for bucket in quantile_buckets(sketch, qs)]
+
+
+def log2_histogram(sketch: Dict) -> List[Tuple[str, int]]:
+    """Counts per power-of-two size range: '0', '1', '2', '3-4', '5-8', ...
+
+    Ranges run up to the largest non-empty one; integer labels assume
+    integer values.
+    """
+    counts = {}
+    for index, count in sketch['bins'].items():
+        power = -(-index // SUBBINS)
+        counts[power] = counts.get(power, 0) + count
+
+    histogram = [('0', sketch['zeros'])]
+    for power in range(0, max(counts, default=-1) + 1):
+        low, high = 2 ** (power - 1) + 1 if power else 1, 2 ** power
+        label = str(high) if low >= high else f'{low}-{high}'
+        histogram.append((label, counts.get(power, 0)))
+    return histogram
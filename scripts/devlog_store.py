@@ -0,0 +1,77 @@
+"""
+Dev Log Blob Store
+Content-addressed storage for dev-log markdown bodies
+"""
+
+import os
+import hashlib
+from pathlib import Path
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+
+DEFAULT_BLOB_DIR = Path(__file__).parent.parent / 'docs' / 'html' / 'data' / 'blobs'
+
+# Where full_content() looks when no blob_dir is passed
+_blob_dir = DEFAULT_BLOB_DIR
+
+
+def set_blob_dir(blob_dir: Path):
+    """Point full_content() at another blob store (e.g. a benchmark corpus)"""
+    global _blob_dir
+    _blob_dir = blob_dir
+
+
+def blob_path(blob_dir: Path, sha: str) -> Path:
+    """Get the path of a blob"""
+    return blob_dir / f'{sha}.md'
+
+
+def put_blob(blob_dir: Path, data: bytes, sha: Optional[str] = None) -> str:
+    """Store data under its SHA-256 and return the hash
+
+    Existing blobs are left untouched, so storing unchanged content is a
+    single stat call.
+    """
+    if sha is None:
+        sha = hashlib.sha256(data).hexdigest()
+
+    path = blob_path(blob_dir, sha)
+    if not path.exists():
+        blob_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    return sha
+
+
+@lru_cache(maxsize=256)
+def get_blob(blob_dir: Path, sha: str) -> str:
+    """Read a blob as text"""
+    return blob_path(blob_dir, sha).read_text(encoding='utf-8')
+
+
+def prune_blobs(blob_dir: Path, keep: Iterable[str]) -> int:
+    """Delete blobs that are no longer referenced, returning how many"""
+    if not blob_dir.exists():
+        return 0
+
+    keep = set(keep)
+    removed = 0
+    for path in blob_dir.glob('*.md'):
+        if path.stem not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def full_content(log: Dict, blob_dir: Optional[Path] = None) -> str:
+    """Get the markdown body of a log, loading it from the blob store"""
+    if 'full_content' in log:
+        return log['full_content']
+
+    sha = log.get('content_sha')
+    if not sha:
+        return ''
+    return get_blob(blob_dir or _blob_dir, sha)
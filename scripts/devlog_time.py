@@ -0,0 +1,59 @@
+"""
+Dev Log Time Fields
+Normalizes a log's date once at parse time into the fields the generators group by
+"""
+
+import calendar
+from datetime import datetime
+from typing import Dict
+
+
+WEEKDAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+WEEKDAY_NAMES_KO = ['월', '화', '수', '목', '금', '토', '일']
+
+# Added to every record whose date parses; hour only when the date has a time
+TEMPORAL_FIELDS = ['epoch', 'day', 'iso_week', 'weekday', 'hour']
+
+
+def temporal_fields(date_str: str) -> Dict:
+    """Epoch seconds, day ordinal, ISO week, weekday and hour of a log date
+
+    Accepts ISO dates with or without a time ('2026-01-06 14:03:27',
+    '2026-01-06T14:03', '2026-01-06'). Dates without an offset are the
+    committer's wall-clock time and are converted as if they were UTC, so
+    epoch values do not depend on the machine running the build.
+    Returns {} when the date cannot be parsed.
+    """
+    text = (date_str or '').strip()
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        return {}
+
+    epoch = int(dt.timestamp()) if dt.tzinfo else calendar.timegm(dt.timetuple())
+    year, week, _ = dt.isocalendar()
+    fields = {
+        'timestamp': dt.isoformat(),
+        'epoch': epoch,
+        'day': dt.toordinal(),
+        'iso_week': f'{year}-W{week:02d}',
+        'weekday': dt.weekday(),
+    }
+    if len(text) > 10:
+        fields['hour'] = dt.hour
+    return fields
+
+
+def display_time(log: Dict) -> str:
+    """'YYYY-MM-DD HH:MM' for a log with a parsed time, else its raw date"""
+    if 'hour' in log:
+        return log['date'].strip()[:16].replace('T', ' ')
+    return log.get('date', '')
+
+
+def display_day(log: Dict) -> str:
+    """'YYYY-MM-DD' for a log with a parsed date, else its raw date's first word"""
+    if 'day' in log:
+        return log['date'].strip()[:10]
+    date_str = log.get('date', '')
+    return date_str.split()[0] if ' ' in date_str else date_str
@@ -5,8 +5,24 @@ Analyzes commit sizes and patterns
 """
 
 import json
+import heapq
+from bisect import bisect_left
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from devlog_charts import CHART_CSS, GREEN, BLUE, AMBER, RED, PURPLE, bar_chart, doughnut_chart
+from devlog_sketch import (RELATIVE_ACCURACY, bucket_upper, log2_histogram, merge_sketches, new_sketch,
+                           quantile_buckets, sketch_add, sketch_quantiles, value_bucket)
+from devlog_time import display_day
+
+
+# Build inputs (see devlog.py build)
+LOG_FIELDS = ['log_number', 'title', 'type', 'lines_added', 'lines_deleted', 'files_changed',
+              'date', 'day', 'commit']
+STAT_FIELDS = []
+
+# Quantiles bounding the data-driven size buckets
+ADAPTIVE_QUANTILES = [('Q1', 0.25), ('Median', 0.5), ('Q3', 0.75), ('p90', 0.9), ('p99', 0.99)]
 
 
 def categorize_commit_size(lines_changed: int) -> str:
@@ -21,30 +37,68 @@ def categorize_commit_size(lines_changed: int) -> str:
         return 'xlarge'
 
 
-def analyze_commit_sizes(logs: List[Dict]) -> Dict:
-    """Analyze commit size distribution"""
+def commit_lines(log: Dict) -> int:
+    """Lines added plus lines deleted"""
+    return log.get('lines_added', 0) + log.get('lines_deleted', 0)
+
+
+def analyze_commit_sizes(logs: List[Dict]) -> Dict[str, List[int]]:
+    """Positions in logs of the commits in each fixed size category"""
     sizes = {'small': [], 'medium': [], 'large': [], 'xlarge': []}
 
-    for log in logs:
-        lines_added = log.get('lines_added', 0)
-        lines_deleted = log.get('lines_deleted', 0)
-        total_lines = lines_added + lines_deleted
-
-        size_cat = categorize_commit_size(total_lines)
-        sizes[size_cat].append({
-            'log_number': log.get('log_number', '?'),
-            'title': log.get('title', ''),
-            'lines_added': lines_added,
-            'lines_deleted': lines_deleted,
-            'total_lines': total_lines,
-            'files_changed': log.get('files_changed', 0),
-            'date': log.get('date', ''),
-            'commit': log.get('commit', 'N/A')[:7]
-        })
+    for position, log in enumerate(logs):
+        sizes[categorize_commit_size(commit_lines(log))].append(position)
 
     return sizes
 
 
+def size_sketches(logs: List[Dict]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Commit-size sketches per month ('YYYY-MM') and per type, in one pass
+
+    Any combination of months or types is a merge of these sketches; the
+    logs are not scanned again.
+    """
+    by_month = {}
+    by_type = {}
+
+    for log in logs:
+        lines = commit_lines(log)
+        month = display_day(log)[:7] if 'day' in log else 'undated'
+        sketch_add(by_month.setdefault(month, new_sketch()), lines)
+        sketch_add(by_type.setdefault(log.get('type', 'unknown'), new_sketch()), lines)
+
+    return by_month, by_type
+
+
+def adaptive_buckets(logs: List[Dict], bounds: List[float]) -> List[List[int]]:
+    """Positions in logs per data-driven bucket
+
+    bounds are the sketch buckets holding each quantile (see
+    quantile_buckets). Bucket 0 holds sizes up to bounds[0]'s sketch bucket,
+    bucket j sizes above bounds[j - 1]'s up to bounds[j]'s, and the last
+    bucket everything above bounds[-1]'s. Comparing sketch buckets rather
+    than approximate values keeps a size in the bucket its quantile came from.
+    """
+    buckets = [[] for _ in range(len(bounds) + 1)]
+    for position, log in enumerate(logs):
+        buckets[bisect_left(bounds, value_bucket(commit_lines(log)))].append(position)
+    return buckets
+
+
+def bucket_ranges(bounds: List[float]) -> List[Tuple[str, Optional[str]]]:
+    """(label, line range) of each adaptive bucket; the range is None when the bucket is empty"""
+    if not bounds:
+        return []
+    names = [name for name, _ in ADAPTIVE_QUANTILES]
+    uppers = [bucket_upper(bound) for bound in bounds]
+    ranges = [(f'≤ {names[0]}', f'0 – {uppers[0]:,}')]
+    for j in range(1, len(bounds)):
+        lines_range = f'{uppers[j - 1] + 1:,} – {uppers[j]:,}' if bounds[j] > bounds[j - 1] else None
+        ranges.append((f'{names[j - 1]} – {names[j]}', lines_range))
+    ranges.append((f'&gt; {names[-1]}', f'&gt; {uppers[-1]:,}'))
+    return ranges
+
+
 def generate_html(data: Dict) -> str:
     """Generate commit size analysis HTML page"""
     stats = data['statistics']
@@ -54,15 +108,52 @@ def generate_html(data: Dict) -> str:
     # Analyze commit sizes
     sizes = analyze_commit_sizes(logs)
 
+    # Data-driven buckets from the merged monthly sketches
+    by_month, by_type = size_sketches(logs)
+    overall = merge_sketches(by_month.values())
+    bounds = quantile_buckets(overall, [q for _, q in ADAPTIVE_QUANTILES]) if overall['count'] else []
+    buckets = adaptive_buckets(logs, bounds)
+
     # Calculate statistics
     size_counts = {cat: len(commits) for cat, commits in sizes.items()}
     total = sum(size_counts.values())
     size_percentages = {cat: round(count / total * 100, 1) if total > 0 else 0
                        for cat, count in size_counts.items()}
 
-    # Prepare data for JavaScript
-    import json as json_module
-    size_counts_json = json_module.dumps(size_counts, ensure_ascii=False)
+    size_chart = doughnut_chart(
+        ['Small (<50)', 'Medium (50-200)', 'Large (200-500)', 'X-Large (>500)'],
+        [size_counts['small'], size_counts['medium'], size_counts['large'], size_counts['xlarge']],
+        [GREEN, BLUE, AMBER, RED], cutout=0, title='Commit size distribution')
+
+    histogram = log2_histogram(overall)
+    histogram_chart = bar_chart([label for label, _ in histogram], [count for _, count in histogram],
+                                PURPLE, horizontal=True, title='Commits by size, log scale')
+
+    bucket_rows = []
+    for (label, lines_range), positions in zip(bucket_ranges(bounds), buckets):
+        if lines_range is None:
+            continue  # Equal quantiles leave this bucket empty
+        share = round(len(positions) / len(logs) * 100, 1) if logs else 0
+        bucket_rows.append(f'''
+                        <tr>
+                            <td>{label}</td>
+                            <td class="count-cell">{lines_range}</td>
+                            <td class="count-cell">{len(positions)}</td>
+                            <td class="count-cell">{share}%</td>
+                        </tr>''')
+    bucket_rows = ''.join(bucket_rows)
+
+    type_rows = []
+    for log_type, sketch in sorted(by_type.items(), key=lambda item: -item[1]['count']):
+        median, p90 = sketch_quantiles(sketch, [0.5, 0.9])
+        type_rows.append(f'''
+                        <tr>
+                            <td>{log_type}</td>
+                            <td class="count-cell">{sketch['count']}</td>
+                            <td class="count-cell">{round(median):,}</td>
+                            <td class="count-cell">{round(p90):,}</td>
+                        </tr>''')
+    type_rows = ''.join(type_rows)
 
     html = f'''<!DOCTYPE html>
 <html lang="ko">
@@ -71,7 +162,7 @@ def generate_html(data: Dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Commit Size Analysis - PamOut</title>
     <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>{CHART_CSS}    </style>
 </head>
 <body>
     <!-- Dark Mode Toggle -->
@@ -137,7 +228,7 @@ def generate_html(data: Dict) -> str:
             <div class="chart-card">
                 <h3 class="chart-title">Size Distribution</h3>
                 <p class="chart-subtitle">커밋 크기 분포</p>
-                <canvas id="sizeChart"></canvas>
+                {size_chart}
             </div>
 
             <div class="chart-card">
@@ -166,6 +257,55 @@ def generate_html(data: Dict) -> str:
             </div>
         </section>
 
+        <!-- Data-Driven Buckets -->
+        <section class="charts-grid">
+            <div class="chart-card">
+                <h3 class="chart-title">Adaptive Size Buckets</h3>
+                <p class="chart-subtitle">분위수 기반 커밋 크기 구간 (±{RELATIVE_ACCURACY * 100:.1f}%)</p>
+                <div class="file-table">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Bucket</th>
+                                <th>Lines</th>
+                                <th>Commits</th>
+                                <th>Share</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                        {bucket_rows}
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+
+            <div class="chart-card">
+                <h3 class="chart-title">Size Histogram</h3>
+                <p class="chart-subtitle">변경 라인 수 분포 (로그 스케일)</p>
+                {histogram_chart}
+            </div>
+
+            <div class="chart-card full-width">
+                <h3 class="chart-title">Size by Type</h3>
+                <p class="chart-subtitle">타입별 커밋 크기 (중앙값 / p90)</p>
+                <div class="file-table">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Type</th>
+                                <th>Commits</th>
+                                <th>Median Lines</th>
+                                <th>p90 Lines</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                        {type_rows}
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </section>
+
         <!-- Commit Lists by Size -->
         <section class="commit-lists">
     '''
@@ -179,37 +319,36 @@ def generate_html(data: Dict) -> str:
     }
 
     for size_cat, info in size_labels.items():
-        commits = sizes[size_cat]
-        if commits:
-            # Sort by total lines descending
-            commits.sort(key=lambda x: x['total_lines'], reverse=True)
-
+        positions = sizes[size_cat]
+        if positions:
             html += f'''
             <div class="commit-list-section">
-                <h3 class="commit-list-title">{info['title']} ({len(commits)})</h3>
+                <h3 class="commit-list-title">{info['title']} ({len(positions)})</h3>
                 <div class="commit-list">
             '''
 
-            for commit in commits[:10]:  # Show top 10
+            # Largest 10 by total lines; ties keep log order
+            for position in heapq.nlargest(10, positions, key=lambda i: commit_lines(logs[i])):
+                log = logs[position]
                 html += f'''
                     <div class="commit-size-item">
                         <div class="commit-size-header">
-                            <span class="commit-size-number">#{commit['log_number']}</span>
-                            <span class="commit-size-hash">{commit['commit']}</span>
+                            <span class="commit-size-number">#{log.get('log_number', '?')}</span>
+                            <span class="commit-size-hash">{log.get('commit', 'N/A')[:7]}</span>
                         </div>
-                        <div class="commit-size-title">{commit['title']}</div>
+                        <div class="commit-size-title">{log.get('title', '')}</div>
                         <div class="commit-size-stats">
                             <span class="stat-item">
-                                <span class="stat-label">Files:</span> {commit['files_changed']}
+                                <span class="stat-label">Files:</span> {log.get('files_changed', 0)}
                             </span>
                             <span class="stat-item">
-                                <span class="stat-label text-green">+{commit['lines_added']}</span>
+                                <span class="stat-label text-green">+{log.get('lines_added', 0)}</span>
                             </span>
                             <span class="stat-item">
-                                <span class="stat-label text-red">-{commit['lines_deleted']}</span>
+                                <span class="stat-label text-red">-{log.get('lines_deleted', 0)}</span>
                             </span>
                             <span class="stat-item">
-                                <span class="stat-label">Total:</span> {commit['total_lines']} lines
+                                <span class="stat-label">Total:</span> {commit_lines(log)} lines
                             </span>
                         </div>
                     </div>
@@ -230,30 +369,6 @@ def generate_html(data: Dict) -> str:
     </footer>
 
     <script>
-        const sizeCounts = {size_counts_json};
-
-        // Size Distribution Pie Chart
-        new Chart(document.getElementById('sizeChart'), {{
-            type: 'pie',
-            data: {{
-                labels: ['Small (<50)', 'Medium (50-200)', 'Large (200-500)', 'X-Large (>500)'],
-                datasets: [{{
-                    data: [sizeCounts.small, sizeCounts.medium, sizeCounts.large, sizeCounts.xlarge],
-                    backgroundColor: ['#10b981', '#3b82f6', '#f59e0b', '#ef4444'],
-                    borderWidth: 0
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        position: 'bottom'
-                    }}
-                }}
-            }}
-        }});
-
         // Dark Mode Toggle
         function toggleDarkMode() {{
             document.body.classList.toggle('dark-mode');
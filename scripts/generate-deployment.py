@@ -5,61 +5,36 @@ Generates deployment history and CI/CD analysis from parsed dev-logs JSON
 """
 
 import json
+import math
+from bisect import bisect_left
+from datetime import date
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, List
+from statistics import median
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
+from devlog_charts import CHART_CSS, RED, CYAN, PURPLE, GREEN, BLUE, doughnut_chart, trend_chart
+from devlog_series import TREND_DAYS, moving_sums
+from devlog_time import display_time
+
+
+# Build inputs (see devlog.py build)
+LOG_FIELDS = ['deployment', 'type', 'title', 'date', 'epoch', 'hour', 'commit', 'log_number']
+STAT_FIELDS = []
+
+# Log types that count as changes waiting to be deployed
+CHANGE_TYPES = {'feat', 'fix'}
+# Trailing windows (days) ending at the newest log; None is the whole history
+DORA_WINDOWS = [('All Time', None), ('Last 30 Days', 30), ('Last 7 Days', 7)]
+# Rolling windows (days) recomputed for every day of the history
+ROLLING_WINDOWS = [7, 30]
+DAY_SECONDS = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 
 def get_deployment_logs(logs: List[Dict]) -> List[Dict]:
-    """Get deployment-related logs (CI/CD commits)"""
-    deployment_logs = []
-
-    for log in logs:
-        log_type = log.get('type', '')
-        full_content = log.get('full_content', '').lower()
-        title = log.get('title', '').lower()
-
-        # Check if it's deployment related
-        is_deployment = (
-            log_type == 'ci' or
-            'deploy' in title or
-            'workflow' in title or
-            'docker' in title or
-            'ci/cd' in title or
-            '.github/workflows' in full_content or
-            'docker-compose' in full_content
-        )
-
-        if is_deployment:
-            deployment_logs.append(log)
-
-    return deployment_logs
-
-
-def categorize_deployment(log: Dict) -> str:
-    """Categorize deployment by type"""
-    title = log.get('title', '').lower()
-    full_content = log.get('full_content', '').lower()
-
-    if 'fix' in title or 'bug' in title:
-        return 'hotfix'
-    elif 'workflow' in title or '.github/workflows' in full_content:
-        return 'ci-config'
-    elif 'docker' in title or 'docker-compose' in full_content:
-        return 'infrastructure'
-    else:
-        return 'release'
-
-
-def parse_date(date_str: str) -> datetime:
-    """Parse date string with flexible format"""
-    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M']:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except:
-            continue
-    return datetime.now()
+    """Get deployment-related logs (CI/CD commits), as classified at parse time"""
+    return [log for log in logs if log.get('deployment')]
 
 
 def analyze_deployment_frequency(logs: List[Dict]) -> Dict:
@@ -67,16 +42,12 @@ def analyze_deployment_frequency(logs: List[Dict]) -> Dict:
     if not logs:
         return {'daily': 0, 'weekly': 0, 'monthly': 0}
 
-    # Sort by date
-    sorted_logs = sorted(logs, key=lambda x: x.get('date', ''))
+    epochs = sorted(log['epoch'] for log in logs if 'epoch' in log)
 
-    if len(sorted_logs) < 2:
+    if len(epochs) < 2:
         return {'daily': 0, 'weekly': 0, 'monthly': 0}
 
-    first_date = parse_date(sorted_logs[0]['date'])
-    last_date = parse_date(sorted_logs[-1]['date'])
-
-    total_days = (last_date - first_date).days + 1
+    total_days = (epochs[-1] - epochs[0]) // 86400 + 1
     total_weeks = total_days / 7
     total_months = total_days / 30
 
@@ -87,10 +58,148 @@ def analyze_deployment_frequency(logs: List[Dict]) -> Dict:
     }
 
 
-def format_date(date_str: str) -> str:
-    """Format date string"""
-    dt = parse_date(date_str)
-    return dt.strftime('%Y-%m-%d %H:%M')
+def link_lead_times(change_epochs: List[int], deploy_epochs: List[int]) -> List[Tuple[int, int]]:
+    """Pair each change with the first deployment strictly after it
+
+    A merge join over two ascending epoch lists: the deployment cursor only
+    moves forward, so this is linear after sorting. Returns
+    (deploy epoch, lead seconds) pairs in deploy order; changes made after
+    the last deployment are not yet shipped and are left out.
+    """
+    pairs = []
+    cursor = 0
+    for change in change_epochs:
+        while cursor < len(deploy_epochs) and deploy_epochs[cursor] <= change:
+            cursor += 1
+        if cursor == len(deploy_epochs):
+            break
+        pairs.append((deploy_epochs[cursor], deploy_epochs[cursor] - change))
+    return pairs
+
+
+def link_restores(deployments: List[Tuple[int, bool]]) -> List[Tuple[int, int]]:
+    """Pair each failed deployment with the first hotfix after it
+
+    deployments are (epoch, is_hotfix) in ascending order, merged from
+    releases and hotfixes. The first hotfix after a release (non-hotfix
+    deployment) marks that release failed and restored; further hotfixes
+    before the next release add nothing. Returns (failed release epoch,
+    restore seconds) pairs in release order.
+    """
+    failures = []
+    last_release = None
+    for epoch, is_hotfix in deployments:
+        if not is_hotfix:
+            last_release = epoch
+        elif last_release is not None:
+            failures.append((last_release, epoch - last_release))
+            last_release = None
+    return failures
+
+
+def window_summary(start: float, deploy_epochs: List[int], releases: List[int],
+                   lead_times: List[Tuple[int, int]], failures: List[Tuple[int, int]]) -> Dict:
+    """DORA metrics over the events at or after start
+
+    Every list is ascending by epoch, so each window is a suffix found by
+    bisection.
+    """
+    release_count = len(releases) - bisect_left(releases, start)
+    leads = [lead for _, lead in lead_times[bisect_left(lead_times, (start,)):]]
+    restores = [restore for _, restore in failures[bisect_left(failures, (start,)):]]
+    return {
+        'deployments': len(deploy_epochs) - bisect_left(deploy_epochs, start),
+        'lead_time': median(leads) if leads else None,
+        'failure_rate': round(len(restores) / release_count * 100, 1) if release_count else None,
+        'time_to_restore': median(restores) if restores else None,
+    }
+
+
+def analyze_dora_metrics(logs: List[Dict], deployment_logs: List[Dict]) -> Tuple[List[Tuple[str, Dict]], Dict]:
+    """Lead time for changes, change failure rate and time to restore
+
+    Lead time runs from a feat/fix log to the first deployment after it; a
+    feat/fix log that is itself a deployment ships with itself and counts
+    only as a deployment. A release (non-hotfix deployment) followed by a
+    hotfix has failed, and that hotfix restores it. Returns a snapshot per
+    DORA_WINDOWS entry, each trailing the newest log so the figures depend
+    only on the history, plus the per-day rolling series. Sorting
+    dominates: O(n log n) overall.
+    """
+    change_epochs = sorted(log['epoch'] for log in logs
+                           if log.get('type') in CHANGE_TYPES and not log.get('deployment')
+                           and 'epoch' in log)
+    deployments = sorted((log['epoch'], log['deployment'] == 'hotfix')
+                         for log in deployment_logs if 'epoch' in log)
+    deploy_epochs = [epoch for epoch, _ in deployments]
+    releases = [epoch for epoch, is_hotfix in deployments if not is_hotfix]
+
+    lead_times = link_lead_times(change_epochs, deploy_epochs)
+    failures = link_restores(deployments)
+    newest = max((log['epoch'] for log in logs if 'epoch' in log), default=0)
+
+    windows = []
+    for label, days in DORA_WINDOWS:
+        start = -math.inf if days is None else newest - days * DAY_SECONDS
+        windows.append((label, window_summary(start, deploy_epochs, releases, lead_times, failures)))
+    return windows, rolling_dora_series(newest, releases, lead_times, failures)
+
+
+def rolling_dora_series(newest: int, releases: List[int], lead_times: List[Tuple[int, int]],
+                        failures: List[Tuple[int, int]]) -> Dict:
+    """Per-day lead time and change failure rate over each rolling window
+
+    Events are bucketed into dense per-day totals from the first deployment
+    to the newest log, then every window is a prefix-sum difference, so the
+    whole series is linear in days plus events. Rolling figures use the mean
+    lead time, since a median does not fall out of prefix sums; days whose
+    window holds no deployment (or no release) read as 0.
+    """
+    first = min([epoch for epoch, _ in lead_times[:1]] + releases[:1], default=None)
+    if first is None:
+        empty = {window: [] for window in ROLLING_WINDOWS}
+        return {'days': [], 'lead_time': empty, 'failure_rate': empty}
+    start = first // DAY_SECONDS
+    length = newest // DAY_SECONDS - start + 1
+
+    lead_sum, lead_count, release_count, failure_count = ([0] * length for _ in range(4))
+    for epoch, lead in lead_times:
+        lead_sum[epoch // DAY_SECONDS - start] += lead
+        lead_count[epoch // DAY_SECONDS - start] += 1
+    for epoch in releases:
+        release_count[epoch // DAY_SECONDS - start] += 1
+    for epoch, _ in failures:
+        failure_count[epoch // DAY_SECONDS - start] += 1
+
+    series = {
+        'days': [date.fromordinal(EPOCH_ORDINAL + start + i).isoformat() for i in range(length)],
+        'lead_time': {},
+        'failure_rate': {},
+    }
+    for window in ROLLING_WINDOWS:
+        sums, counts = moving_sums(lead_sum, window), moving_sums(lead_count, window)
+        series['lead_time'][window] = [round(total / count / 3600, 1) if count else 0
+                                       for total, count in zip(sums, counts)]
+        failed, released = moving_sums(failure_count, window), moving_sums(release_count, window)
+        series['failure_rate'][window] = [round(bad / total * 100, 1) if total else 0
+                                          for bad, total in zip(failed, released)]
+    return series
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Human-readable duration: minutes, hours up to two days, then days"""
+    if seconds is None:
+        return '-'
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 2 * DAY_SECONDS:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / DAY_SECONDS:.1f}d"
+
+
+def format_percent(value: Optional[float]) -> str:
+    """Percentage, or a dash when there is nothing to divide by"""
+    return '-' if value is None else f"{value}%"
 
 
 def generate_html(data: Dict) -> str:
@@ -105,21 +214,39 @@ def generate_html(data: Dict) -> str:
     # Categorize deployments
     deployment_categories = defaultdict(list)
     for log in deployment_logs:
-        category = categorize_deployment(log)
-        deployment_categories[category].append(log)
+        deployment_categories[log['deployment']].append(log)
 
     # Analyze frequency
     frequency = analyze_deployment_frequency(deployment_logs)
-
-    # Prepare data for JavaScript
-    import json as json_module
-    deployment_logs_json = json_module.dumps(deployment_logs, ensure_ascii=False)
-    categories_json = json_module.dumps({
-        'hotfix': len(deployment_categories['hotfix']),
-        'ci-config': len(deployment_categories['ci-config']),
-        'infrastructure': len(deployment_categories['infrastructure']),
-        'release': len(deployment_categories['release'])
-    })
+    dora, rolling = analyze_dora_metrics(logs, deployment_logs)
+
+    category_chart = doughnut_chart(
+        ['Hotfix', 'CI Config', 'Infrastructure', 'Release'],
+        [len(deployment_categories[key]) for key in ('hotfix', 'ci-config', 'infrastructure', 'release')],
+        [RED, CYAN, PURPLE, GREEN], title='Deployment categories')
+
+    # Rolling DORA series for the last year, one line per window
+    trend_days = rolling['days'][-TREND_DAYS:]
+    label_every = max(1, len(trend_days) // 6)
+    lead_time_chart = trend_chart(
+        trend_days,
+        [(f'{window}-day mean', rolling['lead_time'][window][-TREND_DAYS:], color)
+         for window, color in zip(ROLLING_WINDOWS, (BLUE, PURPLE))],
+        title='Lead time (hours)', label_every=label_every)
+    failure_rate_chart = trend_chart(
+        trend_days,
+        [(f'{window}-day', rolling['failure_rate'][window][-TREND_DAYS:], color)
+         for window, color in zip(ROLLING_WINDOWS, (RED, CYAN))],
+        title='Change failure rate (%)', label_every=label_every)
+
+    dora_rows = ''.join(f'''
+                        <tr>
+                            <td>{label}</td>
+                            <td class="count-cell">{metrics['deployments']}</td>
+                            <td class="count-cell">{format_duration(metrics['lead_time'])}</td>
+                            <td class="count-cell">{format_percent(metrics['failure_rate'])}</td>
+                            <td class="count-cell">{format_duration(metrics['time_to_restore'])}</td>
+                        </tr>''' for label, metrics in dora)
 
     html = f'''<!DOCTYPE html>
 <html lang="ko">
@@ -128,8 +255,7 @@ def generate_html(data: Dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Deployment History - PamOut</title>
     <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
+    <style>{CHART_CSS}    </style>
 </head>
 <body>
     <!-- Dark Mode Toggle -->
@@ -225,7 +351,7 @@ def generate_html(data: Dict) -> str:
             <div class="chart-card">
                 <h3 class="chart-title">Deployment Types</h3>
                 <p class="chart-subtitle">배포 타입별 분포</p>
-                <canvas id="categoryChart"></canvas>
+                {category_chart}
             </div>
 
             <!-- Deployment Frequency -->
@@ -249,6 +375,42 @@ def generate_html(data: Dict) -> str:
             </div>
         </section>
 
+        <!-- DORA Metrics -->
+        <section class="dora-metrics">
+            <h2 class="section-title">DORA Metrics</h2>
+            <p class="chart-subtitle">변경 리드 타임, 변경 실패율, 복구 시간</p>
+            <div class="file-table">
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Snapshot</th>
+                            <th>Deployments</th>
+                            <th>Lead Time (median)</th>
+                            <th>Change Failure Rate</th>
+                            <th>Time to Restore (median)</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {dora_rows}
+                    </tbody>
+                </table>
+            </div>
+        </section>
+
+        <!-- Rolling DORA Metrics -->
+        <section class="charts-grid">
+            <div class="chart-card">
+                <h3 class="chart-title">Rolling Lead Time</h3>
+                <p class="chart-subtitle">일별 이동 평균 리드 타임 (7일 / 30일)</p>
+                {lead_time_chart}
+            </div>
+            <div class="chart-card">
+                <h3 class="chart-title">Rolling Change Failure Rate</h3>
+                <p class="chart-subtitle">일별 이동 변경 실패율 (7일 / 30일)</p>
+                {failure_rate_chart}
+            </div>
+        </section>
+
         <!-- Deployment Timeline -->
         <section class="deployment-timeline">
             <h2 class="section-title">Deployment Timeline</h2>
@@ -257,7 +419,7 @@ def generate_html(data: Dict) -> str:
 
     # Add deployment timeline items
     for log in sorted(deployment_logs, key=lambda x: x.get('date', ''), reverse=True):
-        category = categorize_deployment(log)
+        category = log['deployment']
         category_colors = {
             'hotfix': '#ef4444',
             'ci-config': '#06b6d4',
@@ -267,7 +429,7 @@ def generate_html(data: Dict) -> str:
         color = category_colors.get(category, '#6b7280')
 
         title = log.get('title', 'Untitled')
-        date = format_date(log.get('date', ''))
+        date = display_time(log)
         commit = log.get('commit', 'N/A')[:7]
         log_number = log.get('log_number', '?')
 
@@ -327,35 +489,6 @@ def generate_html(data: Dict) -> str:
     </footer>
 
     <script>
-        const categories = {categories_json};
-
-        // Category Doughnut Chart
-        new Chart(document.getElementById('categoryChart'), {{
-            type: 'doughnut',
-            data: {{
-                labels: ['Hotfix', 'CI Config', 'Infrastructure', 'Release'],
-                datasets: [{{
-                    data: [
-                        categories.hotfix,
-                        categories['ci-config'],
-                        categories.infrastructure,
-                        categories.release
-                    ],
-                    backgroundColor: ['#ef4444', '#06b6d4', '#8b5cf6', '#10b981'],
-                    borderWidth: 0
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        position: 'bottom'
-                    }}
-                }}
-            }}
-        }});
-
         // Dark Mode Toggle
         function toggleDarkMode() {{
             document.body.classList.toggle('dark-mode');
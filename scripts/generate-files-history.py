@@ -9,67 +9,39 @@ from pathlib import Path
 from collections import defaultdict, Counter
 from typing import Dict, List
 
+from devlog_files import CATEGORIES, OTHER, classify_path
+from devlog_charts import CHART_CSS, GREEN, BLUE, AMBER, PURPLE, GRAY, bar_chart, doughnut_chart
+
+
+# Build inputs (see devlog.py build)
+LOG_FIELDS = ['file_rows']
+STAT_FIELDS = []
+
 
 def analyze_file_changes(logs: List[Dict]) -> Dict:
-    """Analyze file changes across all commits"""
+    """Analyze file changes across all commits from the parsed file rows"""
     file_changes = defaultdict(int)
     file_lines = defaultdict(lambda: {'added': 0, 'deleted': 0})
-    file_commits = defaultdict(list)
 
     for log in logs:
-        commit_hash = log.get('commit', 'N/A')[:7]
-        log_number = log.get('log_number', '?')
-        date = log.get('date', '')
-        title = log.get('title', '')
-
-        # Parse full content for file changes
-        full_content = log.get('full_content', '')
-        lines = full_content.split('\n')
-
-        current_file = None
-        for line in lines:
-            # Detect file paths in markdown tables
-            if '`~`' in line or '`+`' in line or '`-`' in line:
-                parts = line.split('|')
-                if len(parts) >= 3:
-                    file_path = parts[2].strip().replace('`', '')
-                    if file_path and file_path != 'File':
-                        current_file = file_path
-                        file_changes[current_file] += 1
-                        file_commits[current_file].append({
-                            'commit': commit_hash,
-                            'log_number': log_number,
-                            'date': date,
-                            'title': title
-                        })
+        for row in log.get('file_rows', ()):
+            path = row['path']
+            file_changes[path] += 1
+            file_lines[path]['added'] += row['added']
+            file_lines[path]['deleted'] += row['deleted']
 
     return {
         'file_changes': dict(file_changes),
-        'file_commits': dict(file_commits)
+        'file_lines': dict(file_lines)
     }
 
 
 def categorize_files(file_changes: Dict[str, int]) -> Dict:
-    """Categorize files by type"""
-    categories = {
-        'frontend': [],
-        'backend': [],
-        'docs': [],
-        'config': [],
-        'other': []
-    }
+    """Categorize files by type (rules shared with the parser, see devlog_files.py)"""
+    categories = {category: [] for category in CATEGORIES + [OTHER]}
 
     for file_path, count in file_changes.items():
-        if any(x in file_path.lower() for x in ['frontend/', 'src/app/', 'src/components/', '.tsx', '.jsx', 'styles/']):
-            categories['frontend'].append((file_path, count))
-        elif any(x in file_path.lower() for x in ['server/', 'app/', '.py', 'api/']):
-            categories['backend'].append((file_path, count))
-        elif any(x in file_path.lower() for x in ['docs/', '.md', 'readme']):
-            categories['docs'].append((file_path, count))
-        elif any(x in file_path.lower() for x in ['.yml', '.yaml', '.json', '.toml', 'config', 'docker']):
-            categories['config'].append((file_path, count))
-        else:
-            categories['other'].append((file_path, count))
+        categories[classify_path(file_path)].append((file_path, count))
 
     # Sort each category by count
     for cat in categories:
@@ -87,7 +59,7 @@ def generate_html(data: Dict) -> str:
     # Analyze file changes
     analysis = analyze_file_changes(logs)
     file_changes = analysis['file_changes']
-    file_commits = analysis['file_commits']
+    file_lines = analysis['file_lines']
 
     # Get top changed files
     top_files = sorted(file_changes.items(), key=lambda x: x[1], reverse=True)[:20]
@@ -95,12 +67,17 @@ def generate_html(data: Dict) -> str:
     # Categorize files
     categories = categorize_files(file_changes)
 
-    # Prepare data for JavaScript
-    import json as json_module
-    top_files_data = {file: count for file, count in top_files}
-    top_files_json = json_module.dumps(top_files_data, ensure_ascii=False)
-    categories_count = {cat: len(files) for cat, files in categories.items()}
-    categories_json = json_module.dumps(categories_count, ensure_ascii=False)
+    top_files_chart = bar_chart([path.split('/')[-1] for path, _ in top_files],
+                                [count for _, count in top_files], BLUE, horizontal=True,
+                                title='Most changed files')
+    churn = {path: lines['added'] + lines['deleted'] for path, lines in file_lines.items()}
+    top_churn = sorted(churn.items(), key=lambda x: x[1], reverse=True)[:20]
+    churn_chart = bar_chart([path.split('/')[-1] for path, _ in top_churn],
+                            [lines for _, lines in top_churn], AMBER, horizontal=True,
+                            title='Highest churn files')
+    category_chart = doughnut_chart(['Frontend', 'Backend', 'Docs', 'Config', 'Other'],
+                                    [len(files) for files in categories.values()],
+                                    [GREEN, BLUE, AMBER, PURPLE, GRAY], title='Files by category')
 
     html = f'''<!DOCTYPE html>
 <html lang="ko">
@@ -109,7 +86,7 @@ def generate_html(data: Dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>File Changes History - PamOut</title>
     <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>{CHART_CSS}    </style>
 </head>
 <body>
     <!-- Dark Mode Toggle -->
@@ -161,14 +138,21 @@ def generate_html(data: Dict) -> str:
             <div class="chart-card full-width">
                 <h3 class="chart-title">Most Changed Files</h3>
                 <p class="chart-subtitle">파일별 변경 횟수 TOP 20</p>
-                <canvas id="topFilesChart"></canvas>
+                {top_files_chart}
+            </div>
+
+            <!-- Line Churn Chart -->
+            <div class="chart-card full-width">
+                <h3 class="chart-title">Highest Churn</h3>
+                <p class="chart-subtitle">파일별 추가 + 삭제 라인 TOP 20</p>
+                {churn_chart}
             </div>
 
             <!-- Category Distribution -->
             <div class="chart-card">
                 <h3 class="chart-title">Files by Category</h3>
                 <p class="chart-subtitle">카테고리별 파일 분포</p>
-                <canvas id="categoryChart"></canvas>
+                {category_chart}
             </div>
 
             <!-- Hot Files Table -->
@@ -181,8 +165,7 @@ def generate_html(data: Dict) -> str:
     # Add top 10 hot files
     for i, (file_path, count) in enumerate(top_files[:10], 1):
         file_name = file_path.split('/')[-1]
-        commits_list = file_commits.get(file_path, [])
-        commits_count = len(commits_list)
+        lines = file_lines[file_path]
 
         html += f'''
                     <div class="hot-file-item">
@@ -191,7 +174,10 @@ def generate_html(data: Dict) -> str:
                             <div class="hot-file-name">{file_name}</div>
                             <div class="hot-file-path">{file_path}</div>
                         </div>
-                        <div class="hot-file-count">{count} changes</div>
+                        <div class="hot-file-count">{count} changes
+                            <span class="text-green">+{lines['added']:,}</span>
+                            <span class="text-red">-{lines['deleted']:,}</span>
+                        </div>
                     </div>
         '''
 
@@ -225,16 +211,19 @@ def generate_html(data: Dict) -> str:
                             <tr>
                                 <th>File</th>
                                 <th>Changes</th>
+                                <th>Lines</th>
                             </tr>
                         </thead>
                         <tbody>
             '''
 
             for file_path, count in categories[cat][:15]:  # Show top 15 per category
+                lines = file_lines[file_path]
                 html += f'''
                             <tr>
                                 <td class="file-cell">{file_path}</td>
                                 <td class="count-cell">{count}</td>
+                                <td class="count-cell"><span class="text-green">+{lines['added']:,}</span> <span class="text-red">-{lines['deleted']:,}</span></td>
                             </tr>
                 '''
 
@@ -255,69 +244,6 @@ def generate_html(data: Dict) -> str:
     </footer>
 
     <script>
-        const topFilesData = {top_files_json};
-        const categoriesData = {categories_json};
-
-        // Top Files Bar Chart
-        const topFilesLabels = Object.keys(topFilesData).map(path => {{
-            const parts = path.split('/');
-            return parts[parts.length - 1];
-        }});
-        const topFilesValues = Object.values(topFilesData);
-
-        new Chart(document.getElementById('topFilesChart'), {{
-            type: 'bar',
-            data: {{
-                labels: topFilesLabels,
-                datasets: [{{
-                    label: 'Changes',
-                    data: topFilesValues,
-                    backgroundColor: '#3b82f6',
-                    borderRadius: 4
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                indexAxis: 'y',
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    x: {{
-                        beginAtZero: true,
-                        ticks: {{
-                            stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
-        // Category Doughnut Chart
-        new Chart(document.getElementById('categoryChart'), {{
-            type: 'doughnut',
-            data: {{
-                labels: ['Frontend', 'Backend', 'Docs', 'Config', 'Other'],
-                datasets: [{{
-                    data: Object.values(categoriesData),
-                    backgroundColor: ['#10b981', '#3b82f6', '#f59e0b', '#8b5cf6', '#6b7280'],
-                    borderWidth: 0
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        position: 'bottom'
-                    }}
-                }}
-            }}
-        }});
-
         // Dark Mode Toggle
         function toggleDarkMode() {{
             document.body.classList.toggle('dark-mode');
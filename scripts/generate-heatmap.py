@@ -5,126 +5,251 @@ Generates GitHub-style activity heatmap from parsed dev-logs JSON
 """
 
 import json
+import argparse
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, List
-from collections import defaultdict
-
-
-def get_date_only(date_str: str) -> str:
-    """Get date only (YYYY-MM-DD)"""
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        return dt.strftime('%Y-%m-%d')
-    except:
-        return date_str.split()[0] if ' ' in date_str else date_str
-
-
-def count_commits_by_date(logs: List[Dict]) -> Dict[str, int]:
-    """Count commits by date"""
-    counts = defaultdict(int)
-    for log in logs:
-        date = get_date_only(log.get('date', ''))
-        if date:
-            counts[date] += 1
-    return dict(counts)
-
-
-def get_date_range(logs: List[Dict]) -> tuple:
-    """Get min and max dates from logs"""
-    dates = []
-    for log in logs:
-        date_str = get_date_only(log.get('date', ''))
-        if date_str:
-            try:
-                dates.append(datetime.strptime(date_str, '%Y-%m-%d'))
-            except:
-                pass
-
-    if not dates:
-        return datetime.now(), datetime.now()
-
-    return min(dates), max(dates)
-
-
-def generate_heatmap_grid(commits_by_date: Dict[str, int], start_date: datetime, end_date: datetime) -> str:
-    """Generate heatmap grid HTML"""
-
-    # Calculate weeks needed
-    days_diff = (end_date - start_date).days + 1
-    weeks_needed = (days_diff + start_date.weekday()) // 7 + 1
-
-    # Determine color intensity levels
-    max_commits = max(commits_by_date.values()) if commits_by_date else 1
-
-    def get_intensity_class(count: int) -> str:
-        if count == 0:
-            return 'intensity-0'
-        elif count <= max_commits * 0.25:
-            return 'intensity-1'
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from devlog_time import WEEKDAY_NAMES
+
+
+# Build inputs (see devlog.py build)
+LOG_FIELDS = ['day']
+STAT_FIELDS = ['total_logs']
+
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+DAY_LABELS = ['', 'Mon', '', 'Wed', '', 'Fri', '']
+
+# Histories longer than this render as SVG under renderer='auto'
+SVG_THRESHOLD_DAYS = 2 * 366
+
+# SVG cell geometry: cell size, gap, and the room left for day/month labels
+SVG_CELL = 11
+SVG_GAP = 2
+SVG_STEP = SVG_CELL + SVG_GAP
+SVG_LEFT = 28
+SVG_TOP = 16
+
+
+def count_commits_by_day(logs: List[Dict]) -> Tuple[int, List[int]]:
+    """Count commits per day as a dense array
+
+    Returns (first day ordinal, counts) where counts[i] is the number of
+    commits on day first + i, covering the first to the last active day.
+    """
+    ordinals = [log['day'] for log in logs if 'day' in log]
+    if not ordinals:
+        return date.today().toordinal(), [0]
+
+    first = min(ordinals)
+    counts = [0] * (max(ordinals) - first + 1)
+    for ordinal in ordinals:
+        counts[ordinal - first] += 1
+    return first, counts
+
+
+def calculate_streak(active_days: List[int]) -> Dict:
+    """Calculate current and longest streak over the whole history
+
+    active_days are the sorted ordinals of days with commits. One pass;
+    the current streak is the run that ends on the last active day.
+    """
+    longest = 0
+    run = 0
+    previous = None
+    for ordinal in active_days:
+        run = run + 1 if previous is not None and ordinal == previous + 1 else 1
+        if run > longest:
+            longest = run
+        previous = ordinal
+
+    return {
+        'current': run,
+        'longest': longest
+    }
+
+
+def intensity_levels(max_commits: int) -> List[int]:
+    """Intensity level (0-4) for every count from 0 to max_commits"""
+    levels = [0]
+    for count in range(1, max_commits + 1):
+        if count <= max_commits * 0.25:
+            levels.append(1)
         elif count <= max_commits * 0.5:
-            return 'intensity-2'
+            levels.append(2)
         elif count <= max_commits * 0.75:
-            return 'intensity-3'
+            levels.append(3)
         else:
-            return 'intensity-4'
+            levels.append(4)
+    return levels
 
-    # Generate grid by weeks and days
-    grid_html = '<div class="heatmap-grid">'
 
-    # Month labels
-    grid_html += '<div class="heatmap-months">'
-    current_date = start_date
+def year_layout(year: int) -> Tuple[int, int, int, int]:
+    """Get (first day, last day, grid start, weeks) for a calendar year
+
+    Weeks run Monday to Sunday, starting with the week holding January 1st.
+    """
+    year_start = date(year, 1, 1).toordinal()
+    year_end = date(year, 12, 31).toordinal()
+    grid_start = year_start - date.fromordinal(year_start).weekday()
+    return year_start, year_end, grid_start, (year_end - grid_start) // 7 + 1
+
+
+def month_labels(year_start: int, grid_start: int, weeks_needed: int) -> List[str]:
+    """Month name for the first week starting in each month, '' for the others"""
+    labels = []
+    previous = None
     for week in range(weeks_needed):
-        week_start = start_date + timedelta(days=week * 7)
-        if week == 0 or week_start.day <= 7:
-            month_name = week_start.strftime('%b')
-            grid_html += f'<div class="month-label">{month_name}</div>'
-        else:
-            grid_html += '<div class="month-label"></div>'
-    grid_html += '</div>'
+        month = date.fromordinal(max(grid_start + week * 7, year_start)).month
+        labels.append(MONTH_NAMES[month - 1] if month != previous else '')
+        previous = month
+    return labels
 
-    # Day labels (Mon, Wed, Fri)
-    grid_html += '<div class="heatmap-days">'
-    day_labels = ['', 'Mon', '', 'Wed', '', 'Fri', '']
-    for label in day_labels:
-        grid_html += f'<div class="day-label">{label}</div>'
-    grid_html += '</div>'
 
-    # Heatmap cells
-    grid_html += '<div class="heatmap-cells">'
+def year_cells(year: int, first: int, counts: List[int]) -> List[Optional[int]]:
+    """Commit count per grid cell in week-major order; None outside the year or the history"""
+    last = first + len(counts) - 1
+    year_start, year_end, grid_start, weeks_needed = year_layout(year)
+    low = max(year_start, first)
+    high = min(year_end, last)
 
-    # Start from the first Monday before or on start_date
-    current_date = start_date - timedelta(days=start_date.weekday())
+    cells = []
+    for ordinal in range(grid_start, grid_start + weeks_needed * 7):
+        cells.append(counts[ordinal - first] if low <= ordinal <= high else None)
+    return cells
 
-    for week in range(weeks_needed):
-        grid_html += '<div class="heatmap-week">'
 
-        for day in range(7):
-            cell_date = current_date + timedelta(days=week * 7 + day)
-            date_str = cell_date.strftime('%Y-%m-%d')
+def generate_year_grid(year: int, first: int, counts: List[int], levels: List[int]) -> str:
+    """Generate the heatmap grid for one calendar year as HTML cells
 
-            # Check if date is within range
-            if cell_date < start_date or cell_date > end_date:
-                grid_html += '<div class="heatmap-cell empty"></div>'
-            else:
-                count = commits_by_date.get(date_str, 0)
-                intensity = get_intensity_class(count)
-                weekday = cell_date.strftime('%a')
-                formatted_date = cell_date.strftime('%Y-%m-%d (%a)')
+    Days before the first or after the last active day render as empty cells.
+    """
+    year_start, year_end, grid_start, weeks_needed = year_layout(year)
+    cells = year_cells(year, first, counts)
 
-                grid_html += f'''<div class="heatmap-cell {intensity}"
-                    data-date="{date_str}"
-                    data-count="{count}"
-                    title="{formatted_date}: {count} commits">
-                </div>'''
+    parts = ['<div class="heatmap-grid">']
 
-        grid_html += '</div>'
+    # Month labels
+    parts.append('<div class="heatmap-months">')
+    for label in month_labels(year_start, grid_start, weeks_needed):
+        parts.append(f'<div class="month-label">{label}</div>')
+    parts.append('</div>')
 
-    grid_html += '</div>'
-    grid_html += '</div>'
+    # Day labels (Mon, Wed, Fri)
+    parts.append('<div class="heatmap-days">')
+    for label in DAY_LABELS:
+        parts.append(f'<div class="day-label">{label}</div>')
+    parts.append('</div>')
 
-    return grid_html
+    # Heatmap cells
+    parts.append('<div class="heatmap-cells">')
+    for week in range(weeks_needed):
+        parts.append('<div class="heatmap-week">')
+        for day in range(7):
+            count = cells[week * 7 + day]
+            if count is None:
+                parts.append('<div class="heatmap-cell empty"></div>')
+                continue
+
+            date_str = date.fromordinal(grid_start + week * 7 + day).isoformat()
+            parts.append(f'<div class="heatmap-cell intensity-{levels[count]}" '
+                         f'data-date="{date_str}" data-count="{count}"></div>')
+        parts.append('</div>')
+    parts.append('</div>')
+
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+def generate_year_svg(year: int, first: int, counts: List[int], levels: List[int]) -> str:
+    """Generate the heatmap grid for one calendar year as a single SVG
+
+    Cells are not separate elements. Each run of same-intensity days within
+    a week column becomes one dashed vertical stroke (one dash per day), and
+    all runs of one intensity share a <path>. So a year is five paths plus
+    labels, whatever its activity. The tooltip handler maps pointer
+    coordinates back to a day using data-start and data-counts.
+    """
+    year_start, year_end, grid_start, weeks_needed = year_layout(year)
+    cells = year_cells(year, first, counts)
+
+    runs = {level: [] for level in range(5)}
+    for week in range(weeks_needed):
+        x = SVG_LEFT + week * SVG_STEP + SVG_CELL / 2
+        day = 0
+        while day < 7:
+            count = cells[week * 7 + day]
+            if count is None:
+                day += 1
+                continue
+            level = levels[count]
+            length = 1
+            while (day + length < 7 and cells[week * 7 + day + length] is not None
+                   and levels[cells[week * 7 + day + length]] == level):
+                length += 1
+            y = SVG_TOP + day * SVG_STEP
+            runs[level].append(f'M{x:g} {y}v{length * SVG_STEP - SVG_GAP}')
+            day += length
+
+    width = SVG_LEFT + weeks_needed * SVG_STEP
+    height = SVG_TOP + 7 * SVG_STEP
+    encoded = ','.join('' if count is None else str(count) for count in cells).rstrip(',')
+
+    parts = [f'<svg class="heatmap-svg" viewBox="0 0 {width} {height}" width="{width}" height="{height}" '
+             f'data-start="{date.fromordinal(grid_start).isoformat()}" data-counts="{encoded}" '
+             f'role="img" aria-label="{year} commit activity">']
+
+    for week, label in enumerate(month_labels(year_start, grid_start, weeks_needed)):
+        if label:
+            parts.append(f'<text class="heatmap-label" x="{SVG_LEFT + week * SVG_STEP}" y="{SVG_TOP - 5}">{label}</text>')
+    for day, label in enumerate(DAY_LABELS):
+        if label:
+            parts.append(f'<text class="heatmap-label" x="0" y="{SVG_TOP + day * SVG_STEP + SVG_CELL - 2}">{label}</text>')
+
+    for level, subpaths in runs.items():
+        if subpaths:
+            parts.append(f'<path class="intensity-{level}" d="{"".join(subpaths)}"/>')
+
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def generate_calendar_html(first: int, counts: List[int], renderer: str = 'auto') -> str:
+    """Generate one grid per year with year navigation (latest year shown)
+
+    renderer is 'html', 'svg' or 'auto' (SVG once the history spans more
+    than SVG_THRESHOLD_DAYS days).
+    """
+    if renderer == 'auto':
+        renderer = 'svg' if len(counts) > SVG_THRESHOLD_DAYS else 'html'
+    render_year = generate_year_svg if renderer == 'svg' else generate_year_grid
+
+    levels = intensity_levels(max(counts) or 1)
+    first_year = date.fromordinal(first).year
+    last_year = date.fromordinal(first + len(counts) - 1).year
+    years = list(range(last_year, first_year - 1, -1))
+
+    parts = []
+    if len(years) > 1:
+        parts.append('<div class="heatmap-years">')
+        for year in years:
+            active = ' active' if year == last_year else ''
+            parts.append(f'<button class="heatmap-year-btn{active}" data-year="{year}" '
+                         f'onclick="showYear({year})">{year}</button>')
+        parts.append('</div>')
+
+    for year in years:
+        year_counts = sum(counts[max(0, date(year, 1, 1).toordinal() - first):
+                                 max(0, date(year, 12, 31).toordinal() - first + 1)])
+        hidden = '' if year == last_year else ' style="display: none"'
+        parts.append(f'<div class="heatmap-year" data-year="{year}"{hidden}>')
+        parts.append(f'<h3 class="heatmap-year-title">{year} <span class="heatmap-year-count">'
+                     f'{year_counts} commits</span></h3>')
+        parts.append(render_year(year, first, counts, levels))
+        parts.append('</div>')
+
+    return ''.join(parts)
 
 
 def generate_legend_html() -> str:
@@ -144,56 +269,26 @@ def generate_legend_html() -> str:
     '''
 
 
-def calculate_streak(commits_by_date: Dict[str, int], end_date: datetime) -> Dict:
-    """Calculate current and longest streak"""
-    current_streak = 0
-    longest_streak = 0
-    temp_streak = 0
-
-    # Check last 365 days
-    for i in range(365):
-        check_date = end_date - timedelta(days=i)
-        date_str = check_date.strftime('%Y-%m-%d')
-
-        if commits_by_date.get(date_str, 0) > 0:
-            temp_streak += 1
-            if i == 0 or current_streak > 0:
-                current_streak = temp_streak
-        else:
-            if temp_streak > longest_streak:
-                longest_streak = temp_streak
-            if current_streak > 0:
-                temp_streak = 0
-
-    if temp_streak > longest_streak:
-        longest_streak = temp_streak
-
-    return {
-        'current': current_streak,
-        'longest': longest_streak
-    }
-
-
-def generate_html(data: Dict) -> str:
-    """Generate complete heatmap HTML page"""
+def generate_html(data: Dict, renderer: str = 'auto') -> str:
+    """Generate complete heatmap HTML page (renderer: 'auto', 'html' or 'svg')"""
     stats = data['statistics']
     logs = data['logs']
     generated_at = data.get('generated_at', '')
 
-    # Get date range
-    start_date, end_date = get_date_range(logs)
-
-    # Count commits by date
-    commits_by_date = count_commits_by_date(logs)
+    # Count commits per day (dense array from the first to the last active day)
+    first, counts = count_commits_by_day(logs)
+    start_date = date.fromordinal(first)
+    end_date = date.fromordinal(first + len(counts) - 1)
+    active_days = [first + offset for offset, count in enumerate(counts) if count]
 
     # Calculate streaks
-    streaks = calculate_streak(commits_by_date, end_date)
+    streaks = calculate_streak(active_days)
 
     # Calculate total active days
-    total_active_days = len([d for d, c in commits_by_date.items() if c > 0])
+    total_active_days = len(active_days)
 
-    # Generate heatmap grid
-    heatmap_html = generate_heatmap_grid(commits_by_date, start_date, end_date)
+    # Generate one heatmap grid per year
+    heatmap_html = generate_calendar_html(first, counts, renderer)
     legend_html = generate_legend_html()
 
     html = f'''<!DOCTYPE html>
@@ -203,6 +298,26 @@ def generate_html(data: Dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Activity Heatmap - PamOut</title>
     <link rel="stylesheet" href="styles.css">
+    <style>
+        .heatmap-svg {{ display: block; max-width: 100%; height: auto; }}
+        .heatmap-svg path {{ fill: none; stroke-width: {SVG_CELL}px; stroke-dasharray: {SVG_CELL} {SVG_GAP}; }}
+        .heatmap-svg .intensity-0 {{ stroke: #ebedf0; }}
+        .heatmap-svg .intensity-1 {{ stroke: #9be9a8; }}
+        .heatmap-svg .intensity-2 {{ stroke: #40c463; }}
+        .heatmap-svg .intensity-3 {{ stroke: #30a14e; }}
+        .heatmap-svg .intensity-4 {{ stroke: #216e39; }}
+        .heatmap-svg .heatmap-label {{ font-size: 9px; fill: #767676; }}
+        body.dark-mode .heatmap-svg .intensity-0 {{ stroke: #161b22; }}
+        body.dark-mode .heatmap-svg .intensity-1 {{ stroke: #0e4429; }}
+        body.dark-mode .heatmap-svg .intensity-2 {{ stroke: #006d32; }}
+        body.dark-mode .heatmap-svg .intensity-3 {{ stroke: #26a641; }}
+        body.dark-mode .heatmap-svg .intensity-4 {{ stroke: #39d353; }}
+        .heatmap-tooltip {{
+            position: absolute; display: none; pointer-events: none; z-index: 100;
+            padding: 4px 8px; border-radius: 4px; font-size: 12px;
+            background: #24292f; color: #fff; white-space: nowrap;
+        }}
+    </style>
 </head>
 <body>
     <!-- Dark Mode Toggle -->
@@ -252,10 +367,13 @@ def generate_html(data: Dict) -> str:
         <section class="heatmap-section">
             <div class="heatmap-header">
                 <h2>Commit Activity</h2>
-                <p class="heatmap-period">{start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}</p>
+                <p class="heatmap-period">{start_date.isoformat()} - {end_date.isoformat()}</p>
             </div>
 
-            {heatmap_html}
+            <div class="heatmap-calendar" id="heatmapCalendar">
+                {heatmap_html}
+            </div>
+            <div class="heatmap-tooltip" id="heatmapTooltip"></div>
 
             {legend_html}
         </section>
@@ -267,23 +385,19 @@ def generate_html(data: Dict) -> str:
     '''
 
     # Top 10 most active days
-    sorted_dates = sorted(commits_by_date.items(), key=lambda x: x[1], reverse=True)[:10]
-    for date_str, count in sorted_dates:
-        try:
-            dt = datetime.strptime(date_str, '%Y-%m-%d')
-            weekday = dt.strftime('%a')
-            formatted = dt.strftime('%Y-%m-%d')
-            html += f'''
+    top_days = sorted(active_days, key=lambda ordinal: counts[ordinal - first], reverse=True)[:10]
+    for ordinal in top_days:
+        count = counts[ordinal - first]
+        day = date.fromordinal(ordinal)
+        html += f'''
                 <div class="top-day-item">
-                    <div class="top-day-date">{formatted} ({weekday})</div>
+                    <div class="top-day-date">{day.isoformat()} ({WEEKDAY_NAMES[day.weekday()]})</div>
                     <div class="top-day-bar">
-                        <div class="top-day-fill" style="width: {(count / sorted_dates[0][1]) * 100}%"></div>
+                        <div class="top-day-fill" style="width: {(count / counts[top_days[0] - first]) * 100}%"></div>
                     </div>
                     <div class="top-day-count">{count} commits</div>
                 </div>
             '''
-        except:
-            pass
 
     html += f'''
             </div>
@@ -296,18 +410,67 @@ def generate_html(data: Dict) -> str:
     </footer>
 
     <script>
-        // Tooltip for heatmap cells
-        document.querySelectorAll('.heatmap-cell:not(.empty)').forEach(cell => {{
-            cell.addEventListener('mouseenter', function(e) {{
-                const date = this.dataset.date;
-                const count = this.dataset.count;
-                const title = this.getAttribute('title');
-
-                // You can add custom tooltip here if needed
-                console.log(title);
-            }});
+        // One delegated tooltip handler for both HTML cells and SVG grids
+        const WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'];
+        const SVG_LEFT = {SVG_LEFT}, SVG_TOP = {SVG_TOP}, SVG_CELL = {SVG_CELL}, SVG_STEP = {SVG_STEP};
+        const calendar = document.getElementById('heatmapCalendar');
+        const tooltip = document.getElementById('heatmapTooltip');
+
+        function heatmapDayAt(event) {{
+            const cell = event.target.closest('.heatmap-cell:not(.empty)');
+            if (cell) {{
+                const day = new Date(cell.dataset.date + 'T00:00:00');
+                return {{date: cell.dataset.date, weekday: WEEKDAYS[(day.getDay() + 6) % 7], count: cell.dataset.count}};
+            }}
+
+            const svg = event.target.closest('svg.heatmap-svg');
+            if (!svg) return null;
+
+            const point = svg.createSVGPoint();
+            point.x = event.clientX;
+            point.y = event.clientY;
+            const local = point.matrixTransform(svg.getScreenCTM().inverse());
+            const x = local.x - SVG_LEFT, y = local.y - SVG_TOP;
+            const week = Math.floor(x / SVG_STEP), weekday = Math.floor(y / SVG_STEP);
+            if (x < 0 || y < 0 || weekday > 6 || x % SVG_STEP > SVG_CELL || y % SVG_STEP > SVG_CELL) return null;
+
+            svg.countsCache = svg.countsCache || svg.dataset.counts.split(',');
+            const count = svg.countsCache[week * 7 + weekday];
+            if (count === undefined || count === '') return null;
+
+            const day = new Date(svg.dataset.start + 'T00:00:00');
+            day.setDate(day.getDate() + week * 7 + weekday);
+            const pad = value => String(value).padStart(2, '0');
+            const date = `${{day.getFullYear()}}-${{pad(day.getMonth() + 1)}}-${{pad(day.getDate())}}`;
+            return {{date, weekday: WEEKDAYS[weekday], count}};
+        }}
+
+        calendar.addEventListener('mousemove', function(event) {{
+            const day = heatmapDayAt(event);
+            if (!day) {{
+                tooltip.style.display = 'none';
+                return;
+            }}
+            tooltip.textContent = `${{day.date}} (${{day.weekday}}): ${{day.count}} commits`;
+            tooltip.style.left = `${{event.pageX + 12}}px`;
+            tooltip.style.top = `${{event.pageY + 12}}px`;
+            tooltip.style.display = 'block';
         }});
 
+        calendar.addEventListener('mouseleave', function() {{
+            tooltip.style.display = 'none';
+        }});
+
+        // Year navigation
+        function showYear(year) {{
+            document.querySelectorAll('.heatmap-year').forEach(grid => {{
+                grid.style.display = grid.dataset.year === String(year) ? '' : 'none';
+            }});
+            document.querySelectorAll('.heatmap-year-btn').forEach(btn => {{
+                btn.classList.toggle('active', btn.dataset.year === String(year));
+            }});
+        }}
+
         // Dark Mode Toggle
         function toggleDarkMode() {{
             document.body.classList.toggle('dark-mode');
@@ -334,6 +497,12 @@ def generate_html(data: Dict) -> str:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description='Generate the activity heatmap page')
+    parser.add_argument('--renderer', choices=['auto', 'html', 'svg'], default='auto',
+                        help=f'Heatmap cells as HTML elements or one SVG per year '
+                             f'(auto: SVG above {SVG_THRESHOLD_DAYS} days of history)')
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     data_file = project_root / 'docs' / 'html' / 'data' / 'dev-logs.json'
@@ -348,7 +517,7 @@ def main():
 
     # Generate HTML
     print("\n[Generating] Heatmap HTML...")
-    html = generate_html(data)
+    html = generate_html(data, args.renderer)
 
     # Save HTML
     with open(output_file, 'w', encoding='utf-8') as f:
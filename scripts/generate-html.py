@@ -6,9 +6,19 @@ Generates static HTML kanban board from parsed dev-logs JSON
 
 import json
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List
 
+from devlog_index import position_of
+from devlog_details import MANIFEST_FIELDS, details_script, write_detail_shards
+from devlog_time import display_time
+from devlog_search import search_script
+
+
+# Build inputs (see devlog.py build)
+# Bodies live in detail shards; search_terms decide the search shard versions
+LOG_FIELDS = MANIFEST_FIELDS + ['search_terms', 'hour']
+STAT_FIELDS = ['total_logs', 'total_files_changed', 'total_lines_added', 'total_lines_deleted']
+
 
 TYPE_LABELS = {
     'feat': {'en': 'Features', 'ko': '기능 추가', 'color': '#10b981', 'icon': 'NEW'},
@@ -32,22 +42,13 @@ def get_type_info(log_type: str) -> Dict:
     })
 
 
-def format_date(date_str: str) -> str:
-    """Format date string"""
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        return dt.strftime('%Y-%m-%d %H:%M')
-    except:
-        return date_str
-
-
 def generate_card_html(log: Dict, index: int) -> str:
     """Generate HTML for a single card"""
     log_type = log.get('type', 'unknown')
     type_info = get_type_info(log_type)
 
     title = log.get('title', 'Untitled')
-    date = format_date(log.get('date', ''))
+    date = display_time(log)
     commit = log.get('commit', 'N/A')[:7]
     log_number = log.get('log_number', '?')
 
@@ -102,13 +103,8 @@ def generate_column_html(column_type: str, logs: List[Dict], all_logs: List[Dict
     """Generate HTML for a kanban column"""
     type_info = get_type_info(column_type)
 
-    # Find indices in the main logs list
-    cards_html_list = []
-    for log in logs:
-        log_number = log.get('log_number')
-        # Find index in all_logs
-        index = next((i for i, l in enumerate(all_logs) if l.get('log_number') == log_number), 0)
-        cards_html_list.append(generate_card_html(log, index))
+    # Cards open the modal by their index in the main logs list
+    cards_html_list = [generate_card_html(log, position_of(all_logs, log)) for log in logs]
 
     cards_html = '\n'.join(cards_html_list)
 
@@ -157,9 +153,9 @@ def generate_html(data: Dict) -> str:
     if other_logs:
         columns_html += generate_column_html('chore', other_logs, logs)
 
-    # Prepare logs data for JavaScript
-    import json as json_module
-    logs_json = json_module.dumps(logs, ensure_ascii=False)
+    # Card manifest plus the detail loader; bodies are fetched per shard on demand
+    logs_script = details_script(logs)
+    search_js = search_script()
 
     html = f'''<!DOCTYPE html>
 <html lang="ko">
@@ -168,7 +164,6 @@ def generate_html(data: Dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>PamOut Development Progress</title>
     <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
     <script src="scripts.js"></script>
 </head>
 <body>
@@ -289,22 +284,38 @@ def generate_html(data: Dict) -> str:
     </div>
 
     <script>
-        // Set global logsData for modal
-        window.logsData = {logs_json};
+        // Card manifest (logsData) and the lazily loading modal
+        {logs_script}
+
+        // Search index (DevlogSearch), loaded shard by shard as terms are typed
+        {search_js}
 
         // Search functionality
         const searchInput = document.getElementById('searchInput');
         const allCards = document.querySelectorAll('.card');
 
-        searchInput.addEventListener('input', function(e) {{
-            const searchTerm = e.target.value.toLowerCase();
+        // logsData indexes matching the search box, or null when it is empty
+        let searchMatches = null;
+        let searchSequence = 0;
 
-            allCards.forEach(card => {{
-                const title = card.querySelector('.card-title').textContent.toLowerCase();
-                const details = card.querySelector('.card-details')?.textContent.toLowerCase() || '';
-                const matches = title.includes(searchTerm) || details.includes(searchTerm);
+        function cardMatchesSearch(card) {{
+            return !searchMatches || searchMatches.has(parseInt(card.dataset.logIndex));
+        }}
+
+        searchInput.addEventListener('input', async function(e) {{
+            const sequence = ++searchSequence;
+            let matches = null;
+            try {{
+                matches = await DevlogSearch.search(e.target.value);
+            }} catch (error) {{
+                console.error(error);
+            }}
+            // A later keystroke already started a newer search
+            if (sequence !== searchSequence) return;
+            searchMatches = matches;
 
-                card.style.display = matches ? 'block' : 'none';
+            allCards.forEach(card => {{
+                card.style.display = cardMatchesSearch(card) ? 'block' : 'none';
             }});
 
             updateEmptyColumns();
@@ -325,12 +336,9 @@ def generate_html(data: Dict) -> str:
                 // Filter cards
                 allCards.forEach(card => {{
                     const cardType = card.dataset.type;
-                    const searchTerm = searchInput.value.toLowerCase();
-                    const title = card.querySelector('.card-title').textContent.toLowerCase();
-                    const details = card.querySelector('.card-details')?.textContent.toLowerCase() || '';
 
                     const matchesType = activeFilter === 'all' || cardType === activeFilter;
-                    const matchesSearch = title.includes(searchTerm) || details.includes(searchTerm);
+                    const matchesSearch = cardMatchesSearch(card);
 
                     card.style.display = (matchesType && matchesSearch) ? 'block' : 'none';
                 }});
@@ -391,8 +399,7 @@ def generate_html(data: Dict) -> str:
                 // File path filter
                 let matchesFilePath = true;
                 if (filePathFilter) {{
-                    const fullContent = (log.full_content || '').toLowerCase();
-                    matchesFilePath = fullContent.includes(filePathFilter);
+                    matchesFilePath = (log.files || []).some(path => path.toLowerCase().includes(filePathFilter));
                 }}
 
                 // Commit hash filter
@@ -407,10 +414,7 @@ def generate_html(data: Dict) -> str:
                 const matchesLines = linesChanged >= linesMin && linesChanged <= linesMax;
 
                 // Basic search
-                const searchTerm = searchInput.value.toLowerCase();
-                const title = (log.title || '').toLowerCase();
-                const details = (log.details || []).join(' ').toLowerCase();
-                const matchesSearch = !searchTerm || title.includes(searchTerm) || details.includes(searchTerm);
+                const matchesSearch = cardMatchesSearch(card);
 
                 // Type filter
                 const cardType = card.dataset.type;
@@ -436,13 +440,10 @@ def generate_html(data: Dict) -> str:
 
             // Re-apply basic filters only
             allCards.forEach(card => {{
-                const searchTerm = searchInput.value.toLowerCase();
-                const title = card.querySelector('.card-title').textContent.toLowerCase();
-                const details = card.querySelector('.card-details')?.textContent.toLowerCase() || '';
                 const cardType = card.dataset.type;
 
                 const matchesType = activeFilter === 'all' || cardType === activeFilter;
-                const matchesSearch = !searchTerm || title.includes(searchTerm) || details.includes(searchTerm);
+                const matchesSearch = cardMatchesSearch(card);
 
                 card.style.display = (matchesType && matchesSearch) ? 'block' : 'none';
             }});
@@ -562,6 +563,10 @@ def main():
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(html)
 
+    # Log bodies for the modal
+    written = write_detail_shards(data['logs'])
+    print(f"[OK] Wrote {written} detail shards")
+
     print(f"[SUCCESS] HTML generated successfully!")
     print(f"[Output] {output_file}")
     print(f"\n[Browser] Open in browser:")
@@ -8,6 +8,18 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from devlog_charts import CHART_CSS, BLUE, GREEN, AMBER, PURPLE, RED, bar_chart, doughnut_chart, trend_chart
+from devlog_series import TREND_DAYS, moving_sums, series_days
+
+
+# Build inputs (see devlog.py build)
+LOG_FIELDS = []
+STAT_FIELDS = ['total_logs', 'total_files_changed', 'total_lines_added', 'total_lines_deleted', 'categories', 'by_type',
+               'activity']
+
+# Trailing window of the churn trend, in days
+CHURN_WINDOW = 28
+
 
 def generate_stats_html(data: dict) -> str:
     """Generate statistics HTML page"""
@@ -31,10 +43,22 @@ def generate_stats_html(data: dict) -> str:
         'v2.0.0 - Next Gen': {'completed': 0, 'total': 5},
     }
 
-    categories_json = json.dumps(categories)
-    by_type_json = json.dumps(by_type)
+    category_chart = doughnut_chart(
+        ['Frontend', 'Backend', 'Docs', 'Config'],
+        [categories.get(key, 0) for key in ('frontend', 'backend', 'docs', 'config')],
+        [GREEN, BLUE, AMBER, PURPLE], legend=False, title='Code distribution')
+    type_chart = bar_chart(list(by_type), list(by_type.values()), BLUE, title='Commits by type')
     features_json = json.dumps(features_status)
 
+    # Lines and files changed over trailing four weeks, for the last year
+    activity = stats['activity']
+    trend_days = series_days(activity)[-TREND_DAYS:]
+    churn_chart = trend_chart(
+        trend_days,
+        [('Lines added', moving_sums(activity['lines_added'], CHURN_WINDOW)[-TREND_DAYS:], GREEN),
+         ('Lines deleted', moving_sums(activity['lines_deleted'], CHURN_WINDOW)[-TREND_DAYS:], RED)],
+        title=f'Lines changed, {CHURN_WINDOW}-day sum', label_every=max(1, len(trend_days) // 6))
+
     html = f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -42,7 +66,7 @@ def generate_stats_html(data: dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Development Statistics - PamOut</title>
     <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>{CHART_CSS}    </style>
 </head>
 <body>
     <!-- Dark Mode Toggle -->
@@ -94,7 +118,7 @@ def generate_stats_html(data: dict) -> str:
             <div class="chart-card">
                 <h3 class="chart-title">Code Distribution</h3>
                 <p class="chart-subtitle">프론트엔드 / 백엔드 / 문서 / 설정 비율</p>
-                <canvas id="categoryChart"></canvas>
+                {category_chart}
                 <div class="chart-legend">
                     <div class="legend-item">
                         <span class="legend-dot" style="background: #10b981;"></span>
@@ -119,7 +143,14 @@ def generate_stats_html(data: dict) -> str:
             <div class="chart-card">
                 <h3 class="chart-title">Commit Types</h3>
                 <p class="chart-subtitle">커밋 타입별 분포</p>
-                <canvas id="typeChart"></canvas>
+                {type_chart}
+            </div>
+
+            <!-- Churn Trend -->
+            <div class="chart-card full-width">
+                <h3 class="chart-title">Code Churn Trend</h3>
+                <p class="chart-subtitle">최근 {CHURN_WINDOW}일 추가/삭제 라인 (최근 {TREND_DAYS}일)</p>
+                {churn_chart}
             </div>
 
             <!-- Feature Completion -->
@@ -177,63 +208,8 @@ def generate_stats_html(data: dict) -> str:
     </footer>
 
     <script>
-        const categories = {categories_json};
-        const byType = {by_type_json};
         const features = {features_json};
 
-        // Category Doughnut Chart
-        new Chart(document.getElementById('categoryChart'), {{
-            type: 'doughnut',
-            data: {{
-                labels: ['Frontend', 'Backend', 'Docs', 'Config'],
-                datasets: [{{
-                    data: [categories.frontend, categories.backend, categories.docs, categories.config],
-                    backgroundColor: ['#10b981', '#3b82f6', '#f59e0b', '#8b5cf6'],
-                    borderWidth: 0
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }}
-            }}
-        }});
-
-        // Type Bar Chart
-        new Chart(document.getElementById('typeChart'), {{
-            type: 'bar',
-            data: {{
-                labels: Object.keys(byType),
-                datasets: [{{
-                    label: 'Commits',
-                    data: Object.values(byType),
-                    backgroundColor: '#3b82f6',
-                    borderRadius: 4
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        ticks: {{
-                            stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
         // Feature Progress Bars
         const progressContainer = document.getElementById('featureProgress');
         Object.entries(features).forEach(([version, status]) => {{
@@ -6,43 +6,68 @@ Analyzes commit patterns by hour, day of week, etc.
 
 import json
 from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # punch_cards falls back to plain Python with the same result
+    np = None
 
-def analyze_by_hour(logs: List[Dict]) -> Dict[int, int]:
-    """Analyze commits by hour of day"""
-    hours = defaultdict(int)
+from devlog_charts import CHART_CSS, BLUE, GREEN, AMBER, bar_chart, line_chart, punch_card_chart
+from devlog_time import WEEKDAY_NAMES
 
-    for log in logs:
-        date_str = log.get('date', '')
-        try:
-            dt = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-            hours[dt.hour] += 1
-        except:
-            pass
 
-    return dict(hours)
+# Build inputs (see devlog.py build)
+LOG_FIELDS = ['hour', 'weekday', 'lines_added', 'lines_deleted']
+STAT_FIELDS = []
 
+# Punch-card columns: hours 0-23, then logs dated without a time
+NO_HOUR = 24
+PUNCH_COLUMNS = NO_HOUR + 1
 
-def analyze_by_weekday(logs: List[Dict]) -> Dict[str, int]:
-    """Analyze commits by day of week"""
-    weekdays = defaultdict(int)
-    weekday_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
 
-    for log in logs:
-        date_str = log.get('date', '')
-        try:
-            dt = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-            day_name = weekday_names[dt.weekday()]
-            weekdays[day_name] += 1
-        except:
-            pass
+def punch_cards(logs: List[Dict]) -> Tuple[List[List[int]], List[List[int]]]:
+    """Weekday x hour matrices of commits and of lines changed (added + deleted)
 
-    # Ensure all weekdays are present
-    result = {day: weekdays.get(day, 0) for day in weekday_names}
-    return result
+    Row w is weekday w (Monday first); columns 0-23 are hours and column 24
+    counts logs dated without a time. Each log maps to one flat cell,
+    weekday * 25 + hour. With NumPy the cell and weight columns are
+    aggregated by bincount; otherwise one loop accumulates both matrices.
+    """
+    size = len(WEEKDAY_NAMES) * PUNCH_COLUMNS
+
+    if np is not None:
+        dated = [log for log in logs if 'weekday' in log]
+        cells = np.fromiter((log['weekday'] * PUNCH_COLUMNS + log.get('hour', NO_HOUR) for log in dated),
+                            dtype=np.intp, count=len(dated))
+        weights = np.fromiter((log.get('lines_added', 0) + log.get('lines_deleted', 0) for log in dated),
+                              dtype=np.float64, count=len(dated))
+        commits = np.bincount(cells, minlength=size).tolist()
+        lines = np.bincount(cells, weights, minlength=size).astype(np.int64).tolist()
+    else:
+        commits = [0] * size
+        lines = [0] * size
+        for log in logs:
+            if 'weekday' in log:
+                cell = log['weekday'] * PUNCH_COLUMNS + log.get('hour', NO_HOUR)
+                commits[cell] += 1
+                lines[cell] += log.get('lines_added', 0) + log.get('lines_deleted', 0)
+
+    def rows(totals: List[int]) -> List[List[int]]:
+        return [totals[start:start + PUNCH_COLUMNS] for start in range(0, size, PUNCH_COLUMNS)]
+
+    return rows(commits), rows(lines)
+
+
+def analyze_by_hour(matrix: List[List[int]]) -> Dict[int, int]:
+    """Commits by hour of day: the punch card's column sums, for hours with commits"""
+    counts = [sum(column) for column in zip(*matrix)][:NO_HOUR]
+    return {hour: count for hour, count in enumerate(counts) if count}
+
+
+def analyze_by_weekday(matrix: List[List[int]]) -> Dict[str, int]:
+    """Commits by day of week: the punch card's row sums, including logs without a time"""
+    return {name: sum(row) for name, row in zip(WEEKDAY_NAMES, matrix)}
 
 
 def find_most_productive_time(hours: Dict[int, int]) -> str:
@@ -71,8 +96,9 @@ def generate_html(data: Dict) -> str:
     generated_at = data.get('generated_at', '')
 
     # Analyze time patterns
-    hours = analyze_by_hour(logs)
-    weekdays = analyze_by_weekday(logs)
+    commit_matrix, lines_matrix = punch_cards(logs)
+    hours = analyze_by_hour(commit_matrix)
+    weekdays = analyze_by_weekday(commit_matrix)
 
     # Fill missing hours with 0
     hours_filled = {h: hours.get(h, 0) for h in range(24)}
@@ -86,10 +112,17 @@ def generate_html(data: Dict) -> str:
     weekend_commits = weekdays.get('Sat', 0) + weekdays.get('Sun', 0)
     weekday_commits = sum(weekdays.values()) - weekend_commits
 
-    # Prepare data for JavaScript
-    import json as json_module
-    hours_json = json_module.dumps([hours_filled[h] for h in range(24)], ensure_ascii=False)
-    weekdays_json = json_module.dumps(list(weekdays.values()), ensure_ascii=False)
+    hour_chart = line_chart([f'{h:02d}:00' for h in range(24)], [hours_filled[h] for h in range(24)],
+                            BLUE, fill='rgba(59, 130, 246, 0.1)', label_every=3, title='Commits by hour')
+    weekday_chart = bar_chart(list(weekdays), list(weekdays.values()),
+                              GREEN, title='Commits by weekday')
+    hour_labels = [f'{h:02d}' for h in range(NO_HOUR)]
+    commit_punch_chart = punch_card_chart([row[:NO_HOUR] for row in commit_matrix], WEEKDAY_NAMES,
+                                          hour_labels, BLUE, title='Commits by weekday and hour',
+                                          label_every=2)
+    lines_punch_chart = punch_card_chart([row[:NO_HOUR] for row in lines_matrix], WEEKDAY_NAMES,
+                                         hour_labels, AMBER, title='Lines changed by weekday and hour',
+                                         unit='lines', label_every=2)
 
     html = f'''<!DOCTYPE html>
 <html lang="ko">
@@ -98,7 +131,7 @@ def generate_html(data: Dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Time Analysis - PamOut</title>
     <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>{CHART_CSS}    </style>
 </head>
 <body>
     <!-- Dark Mode Toggle -->
@@ -165,13 +198,25 @@ def generate_html(data: Dict) -> str:
             <div class="chart-card full-width">
                 <h3 class="chart-title">Commits by Hour</h3>
                 <p class="chart-subtitle">시간대별 커밋 분포 (24시간)</p>
-                <canvas id="hourChart"></canvas>
+                {hour_chart}
+            </div>
+
+            <div class="chart-card full-width">
+                <h3 class="chart-title">Punch Card</h3>
+                <p class="chart-subtitle">요일 × 시간대별 커밋 수</p>
+                {commit_punch_chart}
+            </div>
+
+            <div class="chart-card full-width">
+                <h3 class="chart-title">Punch Card by Lines Changed</h3>
+                <p class="chart-subtitle">요일 × 시간대별 변경 라인 수 (추가 + 삭제)</p>
+                {lines_punch_chart}
             </div>
 
             <div class="chart-card">
                 <h3 class="chart-title">Commits by Day of Week</h3>
                 <p class="chart-subtitle">요일별 커밋 분포</p>
-                <canvas id="weekdayChart"></canvas>
+                {weekday_chart}
             </div>
 
             <div class="chart-card">
@@ -207,75 +252,6 @@ def generate_html(data: Dict) -> str:
     </footer>
 
     <script>
-        const hoursData = {hours_json};
-        const weekdaysData = {weekdays_json};
-
-        // Hour Chart
-        new Chart(document.getElementById('hourChart'), {{
-            type: 'line',
-            data: {{
-                labels: Array.from({{length: 24}}, (_, i) => `${{i.toString().padStart(2, '0')}}:00`),
-                datasets: [{{
-                    label: 'Commits',
-                    data: hoursData,
-                    borderColor: '#3b82f6',
-                    backgroundColor: 'rgba(59, 130, 246, 0.1)',
-                    fill: true,
-                    tension: 0.4,
-                    pointRadius: 4,
-                    pointHoverRadius: 6
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        ticks: {{
-                            stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
-        // Weekday Chart
-        new Chart(document.getElementById('weekdayChart'), {{
-            type: 'bar',
-            data: {{
-                labels: ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
-                datasets: [{{
-                    label: 'Commits',
-                    data: weekdaysData,
-                    backgroundColor: '#10b981',
-                    borderRadius: 4
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        ticks: {{
-                            stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
         // Dark Mode Toggle
         function toggleDarkMode() {{
             document.body.classList.toggle('dark-mode');
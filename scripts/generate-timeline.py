@@ -6,11 +6,21 @@ Generates chronological timeline view from parsed dev-logs JSON
 
 import json
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List
+
+from devlog_index import position_of
+from devlog_details import MANIFEST_FIELDS, details_script, write_detail_shards
+from devlog_time import WEEKDAY_NAMES_KO, display_day, display_time
+from devlog_series import MOVING_WINDOWS, TREND_DAYS, moving_averages, series_days
+from devlog_charts import CHART_CSS, BLUE, GREEN, PURPLE, trend_chart
 from collections import defaultdict
 
 
+# Build inputs (see devlog.py build)
+LOG_FIELDS = MANIFEST_FIELDS + ['day', 'weekday', 'hour']  # bodies live in detail shards, not in the page
+STAT_FIELDS = ['total_logs', 'total_files_changed', 'total_lines_added', 'total_lines_deleted', 'activity']
+
+
 TYPE_LABELS = {
     'feat': {'en': 'Features', 'ko': '기능 추가', 'color': '#10b981', 'icon': 'NEW'},
     'fix': {'en': 'Fixes', 'ko': '버그 수정', 'color': '#ef4444', 'icon': 'FIX'},
@@ -33,39 +43,16 @@ def get_type_info(log_type: str) -> Dict:
     })
 
 
-def format_date(date_str: str) -> str:
-    """Format date string"""
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        return dt.strftime('%Y-%m-%d %H:%M')
-    except:
-        return date_str
-
-
-def get_date_only(date_str: str) -> str:
-    """Get date only (YYYY-MM-DD)"""
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        return dt.strftime('%Y-%m-%d')
-    except:
-        return date_str.split()[0] if ' ' in date_str else date_str
-
-
-def get_weekday(date_str: str) -> str:
+def get_weekday(log: Dict) -> str:
     """Get weekday in Korean"""
-    weekdays = ['월', '화', '수', '목', '금', '토', '일']
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d')
-        return weekdays[dt.weekday()]
-    except:
-        return ''
+    return WEEKDAY_NAMES_KO[log['weekday']] if 'weekday' in log else ''
 
 
 def group_logs_by_date(logs: List[Dict]) -> Dict[str, List[Dict]]:
     """Group logs by date"""
     grouped = defaultdict(list)
     for log in logs:
-        date = get_date_only(log.get('date', ''))
+        date = display_day(log)
         grouped[date].append(log)
     return dict(grouped)
 
@@ -76,7 +63,7 @@ def generate_timeline_item_html(log: Dict, index: int) -> str:
     type_info = get_type_info(log_type)
 
     title = log.get('title', 'Untitled')
-    time = format_date(log.get('date', ''))
+    time = display_time(log)
     commit = log.get('commit', 'N/A')[:7]
     log_number = log.get('log_number', '?')
 
@@ -123,36 +110,44 @@ def generate_html(data: Dict) -> str:
     # Group by date
     logs_by_date = group_logs_by_date(sorted_logs)
 
-    # Generate timeline HTML
-    timeline_html = ''
+    # Generate timeline HTML (collected in a list; repeated += copies the page so far)
+    parts = []
     for date in sorted(logs_by_date.keys(), reverse=True):
         date_logs = logs_by_date[date]
-        weekday = get_weekday(date)
+        weekday = get_weekday(date_logs[0])
         count = len(date_logs)
 
-        timeline_html += f'''
+        parts.append(f'''
         <div class="timeline-date-group">
             <div class="timeline-date-header">
                 <h2 class="timeline-date">{date} ({weekday})</h2>
                 <span class="timeline-count">{count} commits</span>
             </div>
             <div class="timeline-items">
-        '''
+        ''')
 
         for log in date_logs:
-            # Find index in original logs list
-            log_number = log.get('log_number')
-            index = next((i for i, l in enumerate(logs) if l.get('log_number') == log_number), 0)
-            timeline_html += generate_timeline_item_html(log, index)
+            # Index in the original logs list, which the modal payload follows
+            parts.append(generate_timeline_item_html(log, position_of(logs, log)))
 
-        timeline_html += '''
+        parts.append('''
             </div>
         </div>
-        '''
+        ''')
+
+    timeline_html = ''.join(parts)
 
-    # Prepare logs data for JavaScript
-    import json as json_module
-    logs_json = json_module.dumps(logs, ensure_ascii=False)
+    # Commits per day, smoothed over each moving window, for the last year
+    activity = stats['activity']
+    trend_days = series_days(activity)[-TREND_DAYS:]
+    activity_chart = trend_chart(
+        trend_days,
+        [(f'{window}-day average', moving_averages(activity['commits'], window)[-TREND_DAYS:], color)
+         for window, color in zip(MOVING_WINDOWS, (BLUE, GREEN, PURPLE))],
+        title='Commits per day', label_every=max(1, len(trend_days) // 6))
+
+    # Card manifest plus the detail loader; bodies are fetched per shard on demand
+    logs_script = details_script(logs)
 
     html = f'''<!DOCTYPE html>
 <html lang="ko">
@@ -161,7 +156,7 @@ def generate_html(data: Dict) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Development Timeline - PamOut</title>
     <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
+    <style>{CHART_CSS}    </style>
     <script src="scripts.js"></script>
 </head>
 <body>
@@ -207,6 +202,11 @@ def generate_html(data: Dict) -> str:
     </header>
 
     <main class="timeline-container">
+        <section class="chart-card">
+            <h3 class="chart-title">Activity Trend</h3>
+            <p class="chart-subtitle">일별 커밋 이동 평균 (최근 {TREND_DAYS}일)</p>
+            {activity_chart}
+        </section>
         {timeline_html}
     </main>
 
@@ -229,40 +229,8 @@ def generate_html(data: Dict) -> str:
     </div>
 
     <script>
-        const logsData = {logs_json};
-
-        // Configure marked options
-        marked.setOptions({{
-            breaks: true,
-            gfm: true,
-            headerIds: false,
-            mangle: false
-        }});
-
-        function openModal(index) {{
-            const log = logsData[index];
-            if (!log) return;
-
-            const modal = document.getElementById('detailModal');
-            const modalTitle = document.getElementById('modalTitle');
-            const modalBody = document.getElementById('modalBody');
-
-            // Set title
-            modalTitle.textContent = `#${{log.log_number}} - ${{log.title}}`;
-
-            // Parse and render markdown
-            const content = log.full_content || '';
-            const html = marked.parse(content);
-
-            // Safe rendering: Create temporary div, set innerHTML, then move to modal
-            const tempDiv = document.createElement('div');
-            tempDiv.innerHTML = html;
-            modalBody.innerHTML = '';
-            modalBody.appendChild(tempDiv);
-
-            modal.style.display = 'flex';
-            document.body.style.overflow = 'hidden';
-        }}
+        // Card manifest (logsData) and the lazily loading modal
+        {logs_script}
 
         function closeModal(event) {{
             if (event && event.target.classList.contains('modal-content')) {{
@@ -326,6 +294,10 @@ def main():
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(html)
 
+    # Log bodies for the modal
+    written = write_detail_shards(data['logs'])
+    print(f"[OK] Wrote {written} detail shards")
+
     print(f"[SUCCESS] Timeline HTML generated successfully!")
     print(f"[Output] {output_file}")
     print(f"\n[Browser] Open in browser:")
@@ -7,9 +7,35 @@ Parse markdown dev-log files and convert to JSON format
 import os
 import re
 import json
+import hashlib
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import devlog_profile as profile
+from devlog_store import DEFAULT_BLOB_DIR, put_blob, prune_blobs
+from devlog_search import search_terms, write_search_index
+from devlog_time import temporal_fields
+from devlog_files import count_categories, extract_file_rows
+from devlog_deploy import deployment_category
+from devlog_series import build_series, extend_series, retract_series
+
+
+# Bump when the cached record layout changes; edits to the parser or to the
+# helpers that fill record fields are detected through PARSER_SIGNATURE.
+CACHE_VERSION = 9
+PARSER_SOURCES = [Path(__file__)] + [Path(__file__).with_name(f'{name}.py')
+                                     for name in ('devlog_search', 'devlog_time', 'devlog_files',
+                                                  'devlog_deploy', 'devlog_series')]
+PARSER_SIGNATURE = hashlib.sha256(b''.join(path.read_bytes() for path in PARSER_SOURCES)).hexdigest()
+
+# Record fields kept in the parse cache and in memory but not in dev-logs.json
+BUILD_ONLY_FIELDS = {'search_terms'}
 
 
 def parse_devlog_file(filepath: Path) -> Optional[Dict]:
@@ -17,7 +43,177 @@ def parse_devlog_file(filepath: Path) -> Optional[Dict]:
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
+    except Exception as e:
+        print(f"Error parsing {filepath}: {e}")
+        return None
+
+    return parse_devlog_content(filepath, content)
+
+
+# Single-pass tokenizer. TOKEN_RE finds every place a field or section can
+# start in one forward scan (the leading character class keeps the regex
+# engine on its fast path); the field's own pattern is then matched anchored
+# at that position, so results are identical to a whole-document search.
+TOKEN_RE = re.compile(
+    r'[*#FL](?:'
+    r'\*(?P<field>Date|Author|Commit|Type)\*\*:'
+    r'|(?P<title>\s+Development Log)'
+    r'|(?P<summary>#\s+Summary)'
+    r'|(?P<details>##\s+Details)'
+    r'|(?P<table>iles Changed \(|ines Added \(|ines Deleted \()'
+    r')'
+)
+
+FIELD_PATTERNS = {
+    'Date': ('date', re.compile(r'\*\*Date\*\*:\s+(.+)'), str.strip),
+    'Author': ('author', re.compile(r'\*\*Author\*\*:\s+(.+)'), str.strip),
+    'Commit': ('commit', re.compile(r'\*\*Commit\*\*:\s+`(.+?)`'), str.strip),
+    'Type': ('type', re.compile(r'\*\*Type\*\*:\s+(\w+)'), str.strip),
+    'iles Changed (': ('files_changed', re.compile(r'Files Changed \(변경된 파일\)\s+\|\s+(\d+)'), int),
+    'ines Added (': ('lines_added', re.compile(r'Lines Added \(추가된 라인\)\s+\|\s+\+(\d+)'), int),
+    'ines Deleted (': ('lines_deleted', re.compile(r'Lines Deleted \(삭제된 라인\)\s+\|\s+-(\d+)'), int),
+}
+
+TITLE_RE = re.compile(r'#\s+Development Log\s+#(\d+)\s+-\s+(.+?)\s+\((.+?)\)')
+SUMMARY_HEADING_RE = re.compile(r'##\s+Summary\s+\(요약\)\s+')
+DETAILS_HEADING_RE = re.compile(r'###\s+Details\s+\(상세 내용\)\s+')
+SUMMARY_END_RE = re.compile(r'\n##')
+DETAILS_END_RE = re.compile(r'\n##|🤖')
+
+# Everything parse_devlog_content looks for; scanning stops once all are found.
+TOKEN_TARGETS = 3 + len(FIELD_PATTERNS)
+
+# Canonical record key order, so the JSON output does not depend on where
+# in the document each field happened to appear.
+RECORD_KEYS = [
+    'filename', 'filepath', 'number', 'log_number', 'title', 'type_korean',
+    'date', 'author', 'phase', 'commit', 'type', 'summary', 'details',
+    'files_changed', 'lines_added', 'lines_deleted', 'timestamp',
+    'epoch', 'day', 'iso_week', 'weekday', 'hour', 'full_content',
+]
+
+
+def read_section(content: str, heading_end: int, end_re: re.Pattern) -> str:
+    """Return the section body starting at heading_end, up to the first end_re match"""
+    # The heading pattern swallows trailing whitespace; give one character
+    # back when that runs to the end of the document, as the regex would.
+    start = min(heading_end, len(content) - 1)
+    end_match = end_re.search(content, start + 1)
+    return content[start:end_match.start() if end_match else len(content)]
+
+
+def set_temporal_fields(data: Dict, filepath: Path):
+    """Normalize data['date'] once: timestamp for sorting, plus the
+    epoch/day/week/weekday/hour fields the generators group by"""
+    with profile.span('parse.timestamp'):
+        data['timestamp'] = data['date']
+        fields = temporal_fields(data['date'])
+        if not fields:
+            print(f"[WARN] Unrecognized date in {filepath.name}: {data['date']!r}")
+        data.update(fields)
+
+
+def parse_legacy_content(filepath: Path, content: str) -> Optional[Dict]:
+    """Parse a dev-log in the legacy '# Development Log #NN - title (type)' layout
+
+    Single forward pass over the document; produces the same record as
+    parse_legacy_content_regex.
+    """
+    try:
+        data = {
+            'filename': filepath.name,
+            'filepath': str(filepath),
+        }
+
+        # Extract number from filename (e.g., "03-2026-01-06..." -> "03")
+        filename_match = re.match(r'^(\d+)-', filepath.name)
+        if filename_match:
+            data['number'] = filename_match.group(1)
+
+        summary = details = None
+        found = 0
+
+        # Span names are only built when profiling; this loop runs per token
+        profiling = profile.enabled()
+        with profile.span('parse.tokenize'):
+            for token in TOKEN_RE.finditer(content):
+                kind = token.lastgroup
+                pos = token.start()
+
+                if kind == 'field' or kind == 'table':
+                    key, pattern, convert = FIELD_PATTERNS[token.group(kind)]
+                    if key in data:
+                        continue
+                    with profile.span(f'parse.field.{key}' if profiling else ''):
+                        field_match = pattern.match(content, pos)
+                        if field_match:
+                            data[key] = convert(field_match.group(1))
+                            found += 1
+
+                elif kind == 'title':
+                    if 'title' in data or (pos > 0 and content[pos - 1] != '\n'):
+                        continue
+                    with profile.span('parse.field.title'):
+                        title_match = TITLE_RE.match(content, pos)
+                        if title_match:
+                            data['log_number'], data['title'], data['type_korean'] = title_match.groups()
+                            found += 1
+
+                elif kind == 'summary':
+                    if summary is not None:
+                        continue
+                    with profile.span('parse.field.summary'):
+                        heading = SUMMARY_HEADING_RE.match(content, pos)
+                        if heading:
+                            summary = read_section(content, heading.end(), SUMMARY_END_RE)
+                            found += 1
+
+                elif kind == 'details':
+                    if details is not None:
+                        continue
+                    with profile.span('parse.field.details'):
+                        heading = DETAILS_HEADING_RE.match(content, pos)
+                        if heading:
+                            details = read_section(content, heading.end(), DETAILS_END_RE)
+                            found += 1
+
+                if found == TOKEN_TARGETS:
+                    break
+
+        with profile.span('parse.sections'):
+            if summary is not None:
+                summary = summary.strip()
+                # Get first line as main summary
+                lines = [line.strip() for line in summary.split('\n') if line.strip() and not line.startswith('#')]
+                if lines:
+                    data['summary'] = lines[0]
+
+            if details is not None:
+                details = details.strip()
+                # Parse bullet points
+                detail_lines = [line.strip('- ').strip() for line in details.split('\n') if line.strip().startswith('-')]
+                if detail_lines:
+                    data['details'] = detail_lines
+
+        if 'date' in data:
+            set_temporal_fields(data, filepath)
+
+        # Extract full content for detail view
+        data['full_content'] = content
+
+        return {key: data[key] for key in RECORD_KEYS if key in data}
+
+    except Exception as e:
+        print(f"Error parsing {filepath}: {e}")
+        return None
+
 
+def parse_legacy_content_regex(filepath: Path, content: str) -> Optional[Dict]:
+    """Reference parser for the legacy layout: one whole-document regex scan per field
+
+    Kept so --check-parser can diff it against parse_legacy_content.
+    """
+    try:
         # Extract metadata
         data = {
             'filename': filepath.name,
@@ -89,11 +285,8 @@ def parse_devlog_file(filepath: Path) -> Optional[Dict]:
 
         # Parse date to timestamp for sorting
         if 'date' in data:
-            try:
-                dt = datetime.strptime(data['date'], '%Y-%m-%d %H:%M:%S')
-                data['timestamp'] = dt.isoformat()
-            except:
-                data['timestamp'] = data['date']
+            data['timestamp'] = data['date']
+            data.update(temporal_fields(data['date']))
 
         # Extract full content for detail view
         data['full_content'] = content
@@ -105,25 +298,449 @@ def parse_devlog_file(filepath: Path) -> Optional[Dict]:
         return None
 
 
-def parse_all_devlogs(devlog_dir: Path) -> List[Dict]:
-    """Parse all dev-log files in directory"""
-    logs = []
+# Current layout: '# Dev Log #010: title', '**Date**: 2026-01-25 10:21',
+# plain '## Summary' / '## Changes Made' sections and NNN_slug_YYYYMMDD_HHMM.md
+# filenames. It has no Type, Commit or change-count fields; the type is
+# inferred from the title and the commit taken from the Related section.
+CURRENT_TITLE_RE = re.compile(r'^#\s+Dev Log\s+#(\d+):\s*(.+?)\s*$', re.MULTILINE)
+CURRENT_FIELD_RE = re.compile(r'^\*\*(Date|Author|Phase)\*\*:\s*(.+?)\s*$', re.MULTILINE)
+CURRENT_SECTION_RE = re.compile(r'^##\s+(.+?)\s*$', re.MULTILINE)
+# 'Commit: abc1234', '**Commits:** abc1234, ...', '- **Commit**: `abc1234`'
+CURRENT_COMMIT_RE = re.compile(r'\bCommits?(?::\*\*|\*\*:|:)\s+`?([0-9a-f]{7,40})\b')
+CURRENT_FILENAME_RE = re.compile(r'^(\d+)_.*?(?:_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2}))?\.md$')
+BULLET_RE = re.compile(r'^-\s+(.+?)\s*$')
+RULE_RE = re.compile(r'^(?:-{3,}|\*{3,}|_{3,})$')
+
+# First keyword in the title wins; titles with none count as features
+TITLE_TYPE_RE = re.compile(
+    r'(?P<ci>\bCI\b|\bCI/CD\b|\bpipeline|\bworkflow|\bdeploy)'
+    r'|(?P<test>\btests?\b|\bE2E\b|\bcoverage\b|테스트)'
+    r'|(?P<fix>\bfix(?:es|ed)?\b|\bbugs?\b|\bhotfix|수정)'
+    r'|(?P<docs>\bdocs?\b|\bdocumentation\b|문서)'
+    r'|(?P<refactor>\brefactor|\brebrand|\bclean ?up\b|리팩토링|리브랜딩)'
+    r'|(?P<setup>\binit(?:ial(?:ization)?)?\b|\bsetup\b|초기)',
+    re.IGNORECASE,
+)
+
+
+def current_sections(content: str) -> Dict[str, str]:
+    """Map each '## ' heading (first occurrence) to the text under it"""
+    sections = {}
+    headings = list(CURRENT_SECTION_RE.finditer(content))
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(content)
+        sections.setdefault(heading.group(1).lower(), content[heading.end():end])
+    return sections
+
+
+def top_level_bullets(section: str) -> List[str]:
+    """Unindented '- ' items of a section, skipping fenced code blocks"""
+    bullets = []
+    in_code = False
+    for line in section.split('\n'):
+        if line.startswith('```'):
+            in_code = not in_code
+            continue
+        bullet = None if in_code else BULLET_RE.match(line)
+        if bullet:
+            bullets.append(bullet.group(1))
+    return bullets
+
+
+def parse_current_content(filepath: Path, content: str) -> Optional[Dict]:
+    """Parse a dev-log in the current '# Dev Log #NNN: title' layout"""
+    try:
+        data = {
+            'filename': filepath.name,
+            'filepath': str(filepath),
+        }
+
+        filename_match = CURRENT_FILENAME_RE.match(filepath.name)
+        if filename_match:
+            data['number'] = filename_match.group(1)
+
+        title_match = CURRENT_TITLE_RE.search(content)
+        if title_match:
+            data['log_number'], data['title'] = title_match.groups()
+            type_match = TITLE_TYPE_RE.search(data['title'])
+            data['type'] = type_match.lastgroup if type_match else 'feat'
+
+        for field in CURRENT_FIELD_RE.finditer(content):
+            data.setdefault(field.group(1).lower(), field.group(2))
+
+        # Filenames carry the session start, for logs written without a Date
+        if 'date' not in data and filename_match and filename_match.group(2):
+            year, month, day, hour, minute = filename_match.groups()[1:]
+            data['date'] = f'{year}-{month}-{day} {hour}:{minute}'
+
+        commit_match = CURRENT_COMMIT_RE.search(content)
+        if commit_match:
+            data['commit'] = commit_match.group(1)
+
+        sections = current_sections(content)
+        summary = [line.strip() for line in sections.get('summary', '').split('\n')
+                   if line.strip() and not line.startswith('#') and not RULE_RE.match(line.strip())]
+        if summary:
+            data['summary'] = summary[0]
+
+        details = top_level_bullets(sections.get('changes made', ''))
+        if details:
+            data['details'] = details
+
+        if 'date' in data:
+            set_temporal_fields(data, filepath)
+
+        data['full_content'] = content
+
+        return {key: data[key] for key in RECORD_KEYS if key in data}
+
+    except Exception as e:
+        print(f"Error parsing {filepath}: {e}")
+        return None
+
+
+# Known layouts, tried in registration order. A dialect is picked by its
+# heading pattern (searched near the top of the file), then by its filename
+# pattern; files matching neither are parsed as legacy. 'fields' drive the
+# coverage report, 'reference' (optional) is diffed by --check-parser.
+DIALECTS = []
+DETECT_WINDOW = 4096
+
+
+def register_dialect(name: str, heading: re.Pattern, filename: re.Pattern, parse,
+                     fields: List[str], reference=None):
+    """Add a dev-log layout to the parser"""
+    DIALECTS.append({
+        'name': name,
+        'heading': heading,
+        'filename': filename,
+        'parse': parse,
+        'fields': fields,
+        'reference': reference,
+    })
+
+
+register_dialect(
+    'legacy',
+    re.compile(r'^#\s+Development Log\s+#\d', re.MULTILINE),
+    re.compile(r'^\d+-'),
+    parse_legacy_content,
+    ['log_number', 'title', 'date', 'author', 'commit', 'type', 'summary', 'details',
+     'files_changed', 'lines_added', 'lines_deleted'],
+    reference=parse_legacy_content_regex,
+)
+register_dialect(
+    'current',
+    re.compile(r'^#\s+Dev Log\s+#\d+:', re.MULTILINE),
+    CURRENT_FILENAME_RE,
+    parse_current_content,
+    ['log_number', 'title', 'date', 'author', 'phase', 'commit', 'summary', 'details'],
+)
+
+
+def detect_dialect(filepath: Path, content: str) -> Dict:
+    """Pick the dialect for a file by its heading, then by its filename"""
+    for dialect in DIALECTS:
+        if dialect['heading'].search(content, 0, DETECT_WINDOW):
+            return dialect
+    for dialect in DIALECTS:
+        if dialect['filename'].match(filepath.name):
+            return dialect
+    return DIALECTS[0]
+
+
+def parse_devlog_content(filepath: Path, content: str) -> Optional[Dict]:
+    """Parse dev-log markdown content read from filepath, in whichever layout it uses"""
+    with profile.span('parse.detect'):
+        dialect = detect_dialect(filepath, content)
+    record = dialect['parse'](filepath, content)
+    if record is not None:
+        record['dialect'] = dialect['name']
+    return record
+
+
+def dialect_coverage(logs: List[Dict]) -> Dict[str, Dict]:
+    """Files per dialect and how many of them yielded each of its fields"""
+    by_name = {dialect['name']: dialect for dialect in DIALECTS}
+    coverage = {}
+    for log in logs:
+        dialect = by_name.get(log.get('dialect'), DIALECTS[0])
+        entry = coverage.setdefault(dialect['name'], {
+            'files': 0,
+            'fields': dict.fromkeys(dialect['fields'], 0),
+        })
+        entry['files'] += 1
+        for field in dialect['fields']:
+            if log.get(field) not in (None, '', []):
+                entry['fields'][field] += 1
+    return coverage
+
+
+def report_dialect_coverage(coverage: Dict[str, Dict]):
+    """Print files per dialect and the share of them each field was found in"""
+    for name, entry in coverage.items():
+        fields = ', '.join(f"{field} {count * 100 // entry['files']}%"
+                           for field, count in entry['fields'].items())
+        print(f"[Dialect] {name}: {entry['files']} files ({fields})")
+
+
+def load_parse_cache(cache_file: Path) -> Dict:
+    """Load the parse manifest, discarding it if the parser has changed
+
+    Returns {'files': {name: entry}, 'activity': series} or {}.
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if cache.get('version') != CACHE_VERSION or cache.get('parser') != PARSER_SIGNATURE:
+        return {}
+
+    return cache
+
+
+def save_parse_cache(cache_file: Path, entries: Dict[str, Dict], activity: Dict):
+    """Write the parse manifest and the activity series of its records atomically"""
+    cache = {
+        'version': CACHE_VERSION,
+        'parser': PARSER_SIGNATURE,
+        'files': entries,
+        'activity': activity,
+    }
+
+    tmp_file = cache_file.with_suffix(cache_file.suffix + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_file, cache_file)
+
+
+def fill_change_totals(record: Dict):
+    """Derive change totals from file rows for layouts without an overview table"""
+    rows = record['file_rows']
+    if not rows:
+        return
+    record.setdefault('files_changed', len(rows))
+    if any(row['added'] or row['deleted'] for row in rows):
+        record.setdefault('lines_added', sum(row['added'] for row in rows))
+        record.setdefault('lines_deleted', sum(row['deleted'] for row in rows))
+
+
+def parse_batch(batch: List[Tuple[str, Optional[str]]], blob_dir: Path = DEFAULT_BLOB_DIR) -> Dict:
+    """Read, hash and parse a batch of (path, cached sha256) pairs
+
+    Runs in worker processes under --jobs. A file whose hash equals its
+    cached sha256 is not parsed; its record comes back as None. Parsed
+    records keep only the content hash; the markdown body goes to the blob
+    store.
+    """
+    started = time.perf_counter()
+    results = []
+    total_bytes = 0
+
+    for path, cached_digest in batch:
+        filepath = Path(path)
+        with profile.span('parse.read'):
+            st = filepath.stat()
+            raw = filepath.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+        total_bytes += len(raw)
+
+        record = None
+        if digest != cached_digest:
+            with profile.span('parse.file'):
+                record = parse_devlog_content(filepath, raw.decode('utf-8'))
+            if record:
+                content = record.pop('full_content')
+                with profile.span('parse.analyze_file_categories'):
+                    record['file_categories'] = count_categories(content)
+                with profile.span('parse.file_rows'):
+                    record['file_rows'] = extract_file_rows(content)
+                    fill_change_totals(record)
+                with profile.span('parse.deployment'):
+                    category = deployment_category(record, content)
+                    if category:
+                        record['deployment'] = category
+                with profile.span('parse.search_terms'):
+                    record['search_terms'] = search_terms(record, content)
+                with profile.span('parse.blob_write'):
+                    record['content_sha'] = put_blob(blob_dir, raw, digest)
+
+        results.append((filepath.name, st.st_mtime_ns, st.st_size, digest, record))
+
+    return {
+        'worker': os.getpid(),
+        'results': results,
+        'bytes': total_bytes,
+        'seconds': time.perf_counter() - started,
+        'profile': profile.drain() if profile.enabled() else [],
+    }
+
+
+def run_batches(pending: List[Tuple[str, Optional[str]]], jobs: int, blob_dir: Path) -> List[Dict]:
+    """Parse pending files serially or across a process pool"""
+    if jobs <= 1 or len(pending) < 2:
+        return [parse_batch(pending, blob_dir)] if pending else []
+
+    # Several chunks per worker so one slow chunk cannot stall the pool
+    chunk_size = max(1, -(-len(pending) // (jobs * 4)))
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+
+    # Prefer fork so this also works when loaded as a module by devlog.py
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context,
+                             initializer=profile.reset_worker) as executor:
+        return list(executor.map(partial(parse_batch, blob_dir=blob_dir), chunks))
+
+
+def report_throughput(batches: List[Dict]):
+    """Print files and bytes parsed per worker process"""
+    workers = {}
+    for batch in batches:
+        totals = workers.setdefault(batch['worker'], {'files': 0, 'bytes': 0, 'seconds': 0.0})
+        totals['files'] += len(batch['results'])
+        totals['bytes'] += batch['bytes']
+        totals['seconds'] += batch['seconds']
+
+    for worker, totals in sorted(workers.items()):
+        rate = totals['files'] / totals['seconds'] if totals['seconds'] > 0 else 0
+        print(f"[Worker {worker}] {totals['files']} files, "
+              f"{totals['bytes'] / 1024:.1f} KB in {totals['seconds']:.2f}s ({rate:.0f} files/s)")
+
+
+def parse_all_devlogs(devlog_dir: Path, cache_file: Optional[Path] = None, jobs: int = 1,
+                      blob_dir: Path = DEFAULT_BLOB_DIR) -> Tuple[List[Dict], Optional[Dict]]:
+    """Parse all dev-log files in directory
+
+    When cache_file is given, files whose mtime and size match the manifest
+    are reused without being read, files whose content hash still matches
+    are reused after a read, and only new or edited files are parsed.
+    Files that no longer exist drop out of the manifest.
+
+    With jobs > 1 the files that need reading are parsed in chunks across a
+    process pool. Records are merged back in file order before sorting, so
+    the result does not depend on the number of jobs.
+
+    Markdown bodies are written to blob_dir; records carry content_sha.
+    Blobs no longer referenced by any log are removed.
+
+    The manifest also holds the per-day activity series of its records. It
+    is updated with only the new, edited and dropped records instead of
+    being rebuilt from every log, and returned with the logs for
+    build_devlog_data (None without a cache_file).
+    """
+    with profile.span('cache.load'):
+        cache = load_parse_cache(cache_file) if cache_file and blob_dir.exists() else {}
+    cached = cache.get('files', {})
+    entries = {}
+    added = []
+    retracted = []
+    pending = []
 
     # Get all .md files except README.md
     md_files = sorted([f for f in devlog_dir.glob('*.md') if f.name != 'README.md'])
 
     print(f"Found {len(md_files)} dev-log files")
 
-    for filepath in md_files:
-        log_data = parse_devlog_file(filepath)
-        if log_data:
-            logs.append(log_data)
-            print(f"[OK] Parsed: {filepath.name}")
+    with profile.span('cache.stat'):
+        for filepath in md_files:
+            st = filepath.stat()
+            entry = cached.get(filepath.name)
+
+            if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                entries[filepath.name] = entry
+            else:
+                pending.append((str(filepath), entry['sha256'] if entry else None))
+
+    batches = run_batches(pending, jobs, blob_dir)
+    parsed = 0
+
+    for batch in batches:
+        profile.merge(batch['profile'])
+        for name, mtime_ns, size, digest, record in batch['results']:
+            if record is None:
+                if cached.get(name, {}).get('sha256') != digest:
+                    continue
+                record = cached[name]['record']
+            else:
+                parsed += 1
+                print(f"[OK] Parsed: {name}")
+                added.append(record)
+                if name in cached:
+                    retracted.append(cached[name]['record'])
+
+            entries[name] = {
+                'mtime_ns': mtime_ns,
+                'size': size,
+                'sha256': digest,
+                'record': record,
+            }
+
+    if jobs > 1 and batches:
+        report_throughput(batches)
+
+    logs = [entries[f.name]['record'] for f in md_files if f.name in entries]
+    activity = None
+
+    if cache_file:
+        dropped = set(cached) - set(entries)
+        print(f"[Cache] Reused {len(entries) - parsed}, parsed {parsed}, dropped {len(dropped)}")
+        with profile.span('stats.activity'):
+            if 'activity' in cache:
+                retracted.extend(cached[name]['record'] for name in dropped)
+                activity = extend_series(retract_series(cache['activity'], retracted), added)
+            else:
+                activity = build_series(logs)
+        if entries != cached:
+            with profile.span('cache.save'):
+                save_parse_cache(cache_file, entries, activity)
+
+    if not cache_file or entries != cached:
+        with profile.span('parse.blob_prune'):
+            prune_blobs(blob_dir, (log['content_sha'] for log in logs))
+
+    report_dialect_coverage(dialect_coverage(logs))
 
     # Sort by log number (descending - newest first)
     logs.sort(key=lambda x: int(x.get('log_number', 0)), reverse=True)
 
-    return logs
+    return logs, activity
+
+
+def check_parser(devlog_dir: Path) -> int:
+    """Diff each dialect's parser against its reference regex parser
+
+    Files in dialects without a reference parser are counted but not
+    diffed. Returns the number of files whose records differ.
+    """
+    md_files = sorted([f for f in devlog_dir.glob('*.md') if f.name != 'README.md'])
+    mismatches = 0
+    unchecked = 0
+
+    for filepath in md_files:
+        content = filepath.read_text(encoding='utf-8')
+        dialect = detect_dialect(filepath, content)
+        if dialect['reference'] is None:
+            unchecked += 1
+            continue
+
+        expected = dialect['reference'](filepath, content)
+        actual = dialect['parse'](filepath, content)
+
+        if actual == expected and list(actual or {}) == list(expected or {}):
+            continue
+
+        mismatches += 1
+        print(f"[DIFF] {filepath.name} ({dialect['name']})")
+        for key in sorted(set(expected or {}) | set(actual or {})):
+            if (expected or {}).get(key) != (actual or {}).get(key):
+                print(f"   - {key}: regex={(expected or {}).get(key)!r} single-pass={(actual or {}).get(key)!r}")
+
+    checked = len(md_files) - unchecked
+    print(f"\n[Check] {checked - mismatches}/{checked} files identical"
+          + (f" ({unchecked} without a reference parser)" if unchecked else ''))
+    return mismatches
 
 
 def analyze_file_categories(logs: List[Dict]) -> Dict:
@@ -137,44 +754,34 @@ def analyze_file_categories(logs: List[Dict]) -> Dict:
     }
 
     for log in logs:
-        content = log.get('full_content', '')
-
-        # Count frontend files
-        frontend_patterns = ['frontend/', 'src/app/', 'src/components/', '.tsx', '.jsx', 'page.tsx']
-        backend_patterns = ['server/', 'app/api/', 'app/models/', 'app/services/', '.py']
-        docs_patterns = ['docs/', '.md', 'README']
-        config_patterns = ['.yml', '.yaml', '.json', 'docker-compose', '.env', 'Dockerfile']
-
-        for pattern in frontend_patterns:
-            if pattern in content:
-                categories['frontend'] += content.count(pattern)
-
-        for pattern in backend_patterns:
-            if pattern in content:
-                categories['backend'] += content.count(pattern)
-
-        for pattern in docs_patterns:
-            if pattern in content:
-                categories['docs'] += content.count(pattern)
-
-        for pattern in config_patterns:
-            if pattern in content:
-                categories['config'] += content.count(pattern)
+        for category, count in log.get('file_categories', {}).items():
+            categories[category] += count
 
     return categories
 
 
-def generate_statistics(logs: List[Dict]) -> Dict:
-    """Generate statistics from parsed logs"""
+def generate_statistics(logs: List[Dict], activity: Optional[Dict] = None) -> Dict:
+    """Generate statistics from parsed logs
+
+    activity is the logs' per-day series when the caller already has it
+    (see parse_all_devlogs); otherwise it is built here.
+    """
     stats = {
         'total_logs': len(logs),
         'total_files_changed': sum(log.get('files_changed', 0) for log in logs),
         'total_lines_added': sum(log.get('lines_added', 0) for log in logs),
         'total_lines_deleted': sum(log.get('lines_deleted', 0) for log in logs),
         'by_type': {},
-        'categories': analyze_file_categories(logs),
     }
 
+    with profile.span('stats.analyze_file_categories'):
+        stats['categories'] = analyze_file_categories(logs)
+    if activity is not None:
+        stats['activity'] = activity
+    else:
+        with profile.span('stats.activity'):
+            stats['activity'] = build_series(logs)
+
     # Count by type
     for log in logs:
         log_type = log.get('type', 'unknown')
@@ -185,34 +792,69 @@ def generate_statistics(logs: List[Dict]) -> Dict:
     return stats
 
 
+def build_devlog_data(logs: List[Dict], activity: Optional[Dict] = None) -> Dict:
+    """Build the dev-logs.json document from parsed logs (and their activity series, if known)"""
+    # Honour SOURCE_DATE_EPOCH so repeated builds can be compared byte for byte
+    source_date = os.environ.get('SOURCE_DATE_EPOCH')
+    generated_at = datetime.fromtimestamp(int(source_date)) if source_date else datetime.now()
+
+    with profile.span('stats.generate_statistics'):
+        stats = generate_statistics(logs, activity)
+
+    return {
+        'generated_at': generated_at.isoformat(),
+        'statistics': stats,
+        'logs': logs,
+    }
+
+
+def save_devlog_data(output_file: Path, data: Dict):
+    """Write the dev-logs.json document (without build-only record fields)"""
+    logs = [{key: value for key, value in log.items() if key not in BUILD_ONLY_FIELDS}
+            for log in data['logs']]
+    with profile.span('json.dump'), open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(dict(data, logs=logs), f, ensure_ascii=False, indent=2)
+
+
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description='Parse dev-log markdown files into JSON')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore the parse manifest and re-parse every file')
+    parser.add_argument('--check-parser', metavar='DIR', nargs='?', const='',
+                        help='Diff the single-pass parser against the regex parser '
+                             '(defaults to docs/dev-log; performance/fixtures/legacy-dialect '
+                             'holds legacy edge cases) and exit')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Parse changed files across N worker processes (default: 1)')
+    args = parser.parse_args()
+
     # Get project root
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     devlog_dir = project_root / 'docs' / 'dev-log'
     output_dir = project_root / 'docs' / 'html' / 'data'
 
+    if args.check_parser is not None:
+        check_dir = Path(args.check_parser) if args.check_parser else devlog_dir
+        raise SystemExit(1 if check_parser(check_dir) else 0)
+
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Parse all logs
     print("\n[Parsing] dev-log files...")
-    logs = parse_all_devlogs(devlog_dir)
+    cache_file = None if args.no_cache else output_dir / '.parse-cache.json'
+    logs, activity = parse_all_devlogs(devlog_dir, cache_file, args.jobs)
 
     # Generate statistics
-    stats = generate_statistics(logs)
+    output_data = build_devlog_data(logs, activity)
+    stats = output_data['statistics']
 
     # Save to JSON
     output_file = output_dir / 'dev-logs.json'
-    output_data = {
-        'generated_at': datetime.now().isoformat(),
-        'statistics': stats,
-        'logs': logs,
-    }
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    save_devlog_data(output_file, output_data)
+    write_search_index(logs)
 
     print(f"\n[SUCCESS] Successfully parsed {len(logs)} logs")
     print(f"[Statistics]")
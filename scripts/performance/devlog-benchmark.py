@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Dev Log Scaling Benchmark
+Times parsing and every page generator on synthetic corpora of growing size
+
+Usage:
+    python3 scripts/performance/devlog-benchmark.py                         # 100, 1000, 10000 logs
+    python3 scripts/performance/devlog-benchmark.py --sizes 1000 10000 100000
+    python3 scripts/performance/devlog-benchmark.py --save-baseline scripts/performance/devlog-baseline.json
+
+Each stage gets a scaling exponent k from its two largest sizes
+(time ~ n^k). Stages growing faster than linear, or noticeably faster than
+the stored baseline, are flagged and the script exits with status 1.
+devlog-baseline.json was recorded with the default sizes and --repeat 5;
+re-record it when a change alters a stage's scaling on purpose. Stages
+with on-disk caches start every run with them empty, so the times are
+those of a first build.
+
+The generated corpora use the legacy dialect, so the smallest one is also
+diffed against the reference regex parser (see parse-devlog.py
+--check-parser); any mismatch fails the run as well.
+"""
+
+import io
+import sys
+import math
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+import importlib.util
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+PERF_DIR = Path(__file__).parent
+SCRIPT_DIR = PERF_DIR.parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import devlog
+import devlog_store
+import devlog_details
+import devlog_search
+
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_BASELINE = PERF_DIR / 'devlog-baseline.json'
+
+# Exponent above which a stage counts as super-linear without a baseline,
+# and how far a stage may drift above its baseline exponent
+LINEAR_LIMIT = 1.2
+BASELINE_TOLERANCE = 0.2
+# Stages faster than this at the largest size are too noisy to judge
+MIN_SECONDS = 0.005
+
+
+def load_corpus_module():
+    """Import devlog-corpus.py from this directory"""
+    spec = importlib.util.spec_from_file_location('devlog_corpus', PERF_DIR / 'devlog-corpus.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def prepare_corpus(root: Path, size: int, seed: int) -> Path:
+    """Generate the corpus for size, reusing a complete one from an earlier run"""
+    corpus_dir = root / f'seed{seed}-n{size}'
+    if len(list(corpus_dir.glob('*.md'))) == size:
+        return corpus_dir
+
+    for path in corpus_dir.glob('*.md'):
+        path.unlink()
+    load_corpus_module().generate_corpus(corpus_dir, size, seed)
+    return corpus_dir
+
+
+def timed(fn: Callable, repeat: int, setup: Optional[Callable] = None) -> Tuple[float, object]:
+    """Run fn repeat times and return the best wall time with the last result
+
+    setup, if given, runs untimed before every run.
+    """
+    best = math.inf
+    result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def peak_memory(fn: Callable) -> int:
+    """Bytes allocated by fn at its peak, above what was live before it ran"""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def clear_dirs(*dirs: Path) -> Callable:
+    """Setup that empties dirs and the in-memory blob cache, so a stage runs cold"""
+    def setup():
+        for path in dirs:
+            shutil.rmtree(path, ignore_errors=True)
+        devlog_store.get_blob.cache_clear()
+    return setup
+
+
+def benchmark_size(corpus_dir: Path, repeat: int, memory: bool) -> Dict[str, Dict]:
+    """Time (and optionally measure) every stage on one corpus
+
+    Stages that keep on-disk caches (blobs, rendered bodies, detail and
+    search shards) start every run from empty ones, so best-of-N times a
+    first build rather than cache hits.
+    """
+    parser = devlog.load_script('parse-devlog.py')
+    # Every stage reads and writes corpus-local directories, never docs/html
+    blob_dir = corpus_dir / 'blobs'
+    details_dir = corpus_dir / 'details'
+    render_dir = corpus_dir / 'rendered'
+    search_dir = corpus_dir / 'search'
+    devlog_store.set_blob_dir(blob_dir)
+    devlog_search.set_search_dir(search_dir)
+
+    def parse():
+        with redirect_stdout(io.StringIO()):
+            return parser.parse_all_devlogs(corpus_dir, None, 1, blob_dir)[0]
+
+    stages: List[Tuple[str, Callable, Optional[Callable]]] = [('parse', parse, clear_dirs(blob_dir))]
+    seconds, logs = timed(parse, repeat, stages[-1][2])
+    results = {'parse': {'seconds': seconds}}
+
+    def statistics():
+        with redirect_stdout(io.StringIO()):
+            return parser.build_devlog_data(logs)
+
+    stages.append(('statistics', statistics, None))
+    seconds, data = timed(statistics, repeat)
+    results['statistics'] = {'seconds': seconds}
+
+    def details():
+        return devlog_details.write_detail_shards(logs, details_dir, render_dir)
+
+    stages.append(('details', details, clear_dirs(details_dir, render_dir)))
+    seconds, _ = timed(details, repeat, stages[-1][2])
+    results['details'] = {'seconds': seconds}
+
+    def search():
+        return devlog_search.write_search_index(logs)
+
+    stages.append(('search', search, clear_dirs(search_dir)))
+    seconds, _ = timed(search, repeat, stages[-1][2])
+    results['search'] = {'seconds': seconds}
+
+    for name, script, output, render in devlog.PAGES:
+        render_fn = getattr(devlog.load_script(script), render)
+
+        def render_page(render_fn=render_fn):
+            with redirect_stdout(io.StringIO()):
+                return render_fn(data)
+
+        stages.append((f'render.{name}', render_page, None))
+        seconds, html = timed(render_page, repeat)
+        results[f'render.{name}'] = {'seconds': seconds, 'output_bytes': len(html.encode('utf-8'))}
+
+    # tracemalloc slows allocation-heavy code several times over, so memory
+    # gets its own pass instead of skewing the timings above
+    if memory:
+        for name, fn, setup in stages:
+            if setup:
+                setup()
+            results[name]['peak_bytes'] = peak_memory(fn)
+
+    return results
+
+
+def scaling_exponent(size_a: int, value_a: float, size_b: int, value_b: float) -> Optional[float]:
+    """Slope of log(value) against log(size) between two points"""
+    if size_a == size_b or value_a <= 0 or value_b <= 0:
+        return None
+    return math.log(value_b / value_a) / math.log(size_b / size_a)
+
+
+def analyze(runs: Dict[int, Dict[str, Dict]], metric: str) -> Dict[str, Optional[float]]:
+    """Scaling exponent of each stage between the two largest sizes"""
+    sizes = sorted(runs)
+    if len(sizes) < 2:
+        return {}
+
+    small, large = sizes[-2], sizes[-1]
+    exponents = {}
+    for stage, row in runs[large].items():
+        if metric in row and metric in runs[small].get(stage, {}):
+            exponents[stage] = scaling_exponent(small, runs[small][stage][metric],
+                                                large, row[metric])
+    return exponents
+
+
+def find_regressions(runs: Dict[int, Dict[str, Dict]], exponents: Dict[str, Optional[float]],
+                     baseline: Optional[Dict]) -> List[str]:
+    """Stages whose time grows super-linearly or faster than in the baseline"""
+    reference = (baseline or {}).get('exponents', {})
+    largest = runs[max(runs)]
+    flagged = []
+    for stage, exponent in exponents.items():
+        if exponent is None or largest[stage]['seconds'] < MIN_SECONDS:
+            continue
+        limit = LINEAR_LIMIT
+        if reference.get(stage) is not None:
+            limit = max(limit, reference[stage] + BASELINE_TOLERANCE)
+        if exponent > limit:
+            flagged.append(stage)
+    return flagged
+
+
+def format_bytes(value: int) -> str:
+    """Format a byte count with a binary unit"""
+    for unit in ['B', 'KB', 'MB']:
+        if abs(value) < 1024:
+            return f"{value:.0f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GB"
+
+
+def format_exponent(value: Optional[float]) -> str:
+    """Format a scaling exponent (or a dash when unknown)"""
+    return '-' if value is None else f"n^{value:.2f}"
+
+
+def print_report(runs: Dict[int, Dict[str, Dict]], exponents: Dict, memory_exponents: Dict,
+                 baseline: Optional[Dict], flagged: List[str]):
+    """Print time and memory per stage and size, with scaling exponents"""
+    sizes = sorted(runs)
+    stages = list(runs[sizes[0]])
+    reference = (baseline or {}).get('exponents', {})
+
+    header = f"{'Stage':<22}" + ''.join(f"{f'n={size}':>12}" for size in sizes)
+    print(f"\n[Time] best wall time")
+    print(header + f"{'scaling':>10}{'baseline':>10}")
+    print('-' * (len(header) + 20))
+    for stage in stages:
+        cells = ''.join(f"{runs[size][stage]['seconds'] * 1000:>10.1f}ms" for size in sizes)
+        mark = '  [!] super-linear' if stage in flagged else ''
+        print(f"{stage:<22}{cells}{format_exponent(exponents.get(stage)):>10}"
+              f"{format_exponent(reference.get(stage)):>10}{mark}")
+
+    if 'peak_bytes' not in runs[sizes[0]][stages[0]]:
+        return
+
+    print(f"\n[Memory] tracemalloc peak")
+    print(header + f"{'scaling':>10}")
+    print('-' * (len(header) + 10))
+    for stage in stages:
+        cells = ''.join(f"{format_bytes(runs[size][stage]['peak_bytes']):>12}" for size in sizes)
+        print(f"{stage:<22}{cells}{format_exponent(memory_exponents.get(stage)):>10}")
+
+
+def load_baseline(path: Optional[Path]) -> Optional[Dict]:
+    """Load a stored baseline, if there is one"""
+    if path is None or not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path: Path, runs: Dict[int, Dict[str, Dict]], exponents: Dict,
+                  memory_exponents: Dict, seed: int):
+    """Write this run as the baseline for later comparisons"""
+    baseline = {
+        'seed': seed,
+        'sizes': sorted(runs),
+        'exponents': exponents,
+        'memory_exponents': memory_exponents,
+        'runs': {str(size): runs[size] for size in sorted(runs)},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Benchmark dev-log parsing and page generation')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Corpus sizes to benchmark (default: 100 1000 10000)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per stage; the best time is kept (default: 3)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the tracemalloc pass')
+    parser.add_argument('--corpus-dir', type=Path,
+                        default=Path(tempfile.gettempdir()) / 'devlog-benchmark',
+                        help='Where generated corpora are kept between runs')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='Baseline to compare scaling against (default: %(default)s, if present)')
+    parser.add_argument('--save-baseline', type=Path, metavar='FILE',
+                        help='Store this run as a baseline')
+    parser.add_argument('--output', type=Path, metavar='FILE',
+                        help='Also write the raw results as JSON')
+    args = parser.parse_args()
+
+    runs = {}
+    mismatches = 0
+    for size in sorted(set(args.sizes)):
+        print(f"[Corpus] {size} logs (seed {args.seed})...")
+        corpus_dir = prepare_corpus(args.corpus_dir, size, args.seed)
+        if not runs:
+            mismatches = devlog.load_script('parse-devlog.py').check_parser(corpus_dir)
+        runs[size] = benchmark_size(corpus_dir, args.repeat, not args.no_memory)
+
+    baseline = load_baseline(args.baseline)
+    exponents = analyze(runs, 'seconds')
+    memory_exponents = analyze(runs, 'peak_bytes')
+    flagged = find_regressions(runs, exponents, baseline)
+
+    print_report(runs, exponents, memory_exponents, baseline, flagged)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'exponents': exponents, 'memory_exponents': memory_exponents,
+                       'runs': {str(size): runs[size] for size in runs}}, f, indent=2)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, runs, exponents, memory_exponents, args.seed)
+        print(f"\n[OK] Baseline saved: {args.save_baseline}")
+
+    if mismatches:
+        print(f"\n[WARN] Single-pass parser differs from the reference on {mismatches} files")
+    if flagged:
+        print(f"\n[WARN] Super-linear growth: {', '.join(flagged)}")
+    if mismatches or flagged:
+        raise SystemExit(1)
+
+    print(f"\n[SUCCESS] No super-linear stages")
+
+
+if __name__ == '__main__':
+    main()
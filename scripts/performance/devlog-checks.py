@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Dev Log Self-Checks
+Fixed inputs with known answers for the build's helpers
+
+Usage:
+    python3 scripts/performance/devlog-checks.py
+
+Every check returns a list of problems; any problem fails the run with
+status 1.
+"""
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from statistics import median
+from typing import Callable, List
+
+PERF_DIR = Path(__file__).parent
+SCRIPT_DIR = PERF_DIR.parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+# Hand-written legacy-dialect logs with edge cases the generated corpus lacks
+LEGACY_FIXTURE_DIR = PERF_DIR / 'fixtures' / 'legacy-dialect'
+
+import devlog
+from devlog_files import (CONTENT_CATEGORY_RULES, OTHER, PATH_CATEGORY_RULES, classify_path,
+                          count_categories)
+from devlog_markdown import render_markdown
+from devlog_sketch import build_sketch, quantile_buckets
+
+
+CHECKS: List[Callable[[], List[str]]] = []
+
+
+def check(fn: Callable[[], List[str]]) -> Callable[[], List[str]]:
+    """Register a check"""
+    CHECKS.append(fn)
+    return fn
+
+
+@check
+def legacy_parser_fixture() -> List[str]:
+    """The single-pass legacy parser matches the regex reference on the fixture"""
+    parser = devlog.load_script('parse-devlog.py')
+    paths = sorted(LEGACY_FIXTURE_DIR.glob('*.md'))
+    if not paths:
+        return [f'no fixture logs in {LEGACY_FIXTURE_DIR}']
+
+    problems = [f'{path.name} is not detected as legacy' for path in paths
+                if parser.detect_dialect(path, path.read_text(encoding='utf-8'))['name'] != 'legacy']
+    report = io.StringIO()
+    with redirect_stdout(report):
+        mismatches = parser.check_parser(LEGACY_FIXTURE_DIR)
+    if mismatches:
+        problems += [line.strip() for line in report.getvalue().splitlines()
+                     if line.startswith(('[DIFF]', '   - '))]
+    return problems
+
+
+@check
+def category_rules() -> List[str]:
+    """The single-scan category matchers agree with plain substring tests
+
+    Counts must equal per-pattern str.count sums and classes the first
+    category with any pattern in the lowercased path, as before the rules
+    were compiled.
+    """
+    texts = [path.read_text(encoding='utf-8') for path in sorted(LEGACY_FIXTURE_DIR.glob('*.md'))]
+    texts += ['apps/web/src/app/page.tsx', 'app/api/app/models/x.py', 'README.md docs/README',
+              'docker-compose.yml Dockerfile .env.example', 'src/app/api/', 'myapp/config.ts',
+              'Docs/Styles/x.TSX', 'x.jsonl .yamll', 'scripts/deploy.sh']
+    problems = []
+
+    for text in texts:
+        expected = {category: sum(text.count(pattern) for pattern in patterns)
+                    for category, patterns in CONTENT_CATEGORY_RULES}
+        if count_categories(text) != expected:
+            problems.append(f'count_categories({text[:40]!r}) = {count_categories(text)}, expected {expected}')
+
+        for path in text.split():
+            expected = next((category for category, patterns in PATH_CATEGORY_RULES
+                             if any(pattern in path.lower() for pattern in patterns)), OTHER)
+            if classify_path(path) != expected:
+                problems.append(f'classify_path({path!r}) = {classify_path(path)!r}, expected {expected!r}')
+
+    return problems
+
+
+@check
+def equal_sized_commits() -> List[str]:
+    """Commits of one size share a single adaptive bucket, never '> p99'"""
+    commit_size = devlog.load_script('generate-commit-size.py')
+    quantiles = [q for _, q in commit_size.ADAPTIVE_QUANTILES]
+
+    def buckets_of(logs):
+        sketch = build_sketch(commit_size.commit_lines(log) for log in logs)
+        return commit_size.adaptive_buckets(logs, quantile_buckets(sketch, quantiles))
+
+    problems = []
+
+    for size in (500, 718, 1000):
+        # Every quantile falls on the same size: all commits in the first bucket
+        logs = [{'lines_added': size}] * 10
+        counts = [len(bucket) for bucket in buckets_of(logs)]
+        if counts[0] != len(logs):
+            problems.append(f'{len(logs)} commits of {size} lines spread as {counts}')
+
+        # Smaller and larger commits around them: one middle bucket
+        logs = [{'lines_added': 1}] * 10 + [{'lines_added': size}] * 10 + [{'lines_added': 20000}] * 10
+        buckets = buckets_of(logs)
+        middle = next(j for j, bucket in enumerate(buckets) if 10 in bucket)
+        if buckets[middle] != list(range(10, 20)) or middle in (0, len(buckets) - 1):
+            problems.append(f'{size}-line commits between smaller and larger ones spread as '
+                            f'{[len(bucket) for bucket in buckets]}')
+
+    return problems
+
+
+@check
+def deployment_lead_times() -> List[str]:
+    """Lead times link changes to later deployments, never a deployment to itself"""
+    deployment = devlog.load_script('generate-deployment.py')
+    hour = 3600
+    logs = [
+        {'epoch': 0, 'type': 'feat'},
+        {'epoch': 2 * hour, 'type': 'fix', 'deployment': 'hotfix'},
+        {'epoch': 5 * hour, 'type': 'fix'},
+        {'epoch': 5 * hour, 'type': 'ci', 'deployment': 'release'},
+        {'epoch': 9 * hour, 'type': 'feat', 'deployment': 'release'},
+    ]
+    snapshots, _ = deployment.analyze_dora_metrics(logs, deployment.get_deployment_logs(logs))
+    # feat at 0 ships with the hotfix at 2h; the fix at 5h is not strictly
+    # before the release at 5h, so it ships at 9h; the deploying feat/fix
+    # logs add no lead time of their own
+    expected = median([2 * hour, 4 * hour])
+    lead_time = dict(snapshots)['All Time']['lead_time']
+    return [] if lead_time == expected else [f'All Time lead time {lead_time}s, expected {expected}s']
+
+
+@check
+def hostile_markdown() -> List[str]:
+    """Deep nesting and unmatched emphasis render quickly and without errors"""
+    documents = {
+        'nested quotes': '>' * 3000,
+        'nested lists': '- ' * 2000 + 'x',
+        'quotes in lists': '- > ' * 1500 + 'x',
+        'nested strong': '**' * 3000 + 'x' + '**' * 3000,
+        'unmatched _': '_a ' * 5000,
+        'unmatched __': '__a ' * 5000,
+        'unmatched *': '*a ' * 5000,
+        'unmatched ~~': '~~a ' * 5000,
+        'unmatched image': '![a ' * 5000,
+    }
+    problems = []
+    for name, text in documents.items():
+        started = time.perf_counter()
+        try:
+            render_markdown(text)
+        except RecursionError:
+            problems.append(f'{name}: RecursionError')
+            continue
+        seconds = time.perf_counter() - started
+        if seconds > 0.1:
+            problems.append(f'{name}: {seconds:.2f}s')
+    return problems
+
+
+def main():
+    """Main function"""
+    failed = 0
+    for fn in CHECKS:
+        problems = fn()
+        if problems:
+            failed += 1
+            print(f"[FAIL] {fn.__name__}")
+            for problem in problems:
+                print(f"   - {problem}")
+        else:
+            print(f"[OK] {fn.__name__}")
+
+    if failed:
+        print(f"\n[WARN] {failed} of {len(CHECKS)} checks failed")
+        raise SystemExit(1)
+    print(f"\n[SUCCESS] {len(CHECKS)} checks passed")
+
+
+if __name__ == '__main__':
+    main()
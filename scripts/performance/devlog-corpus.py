@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dev Log Corpus Generator
+Writes a deterministic, seeded set of dev-log markdown files for benchmarks
+
+Usage:
+    python3 scripts/performance/devlog-corpus.py OUTPUT_DIR --count 10000 --seed 42
+    python3 scripts/performance/devlog-corpus.py OUTPUT_DIR --count 10000 --current-share 0.5   # mixed layouts
+"""
+
+import re
+import random
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import List
+
+
+# (type, korean label, weight)
+LOG_TYPES = [
+    ('feat', '기능 추가', 35),
+    ('fix', '버그 수정', 25),
+    ('docs', '문서', 10),
+    ('refactor', '리팩토링', 8),
+    ('test', '테스트', 8),
+    ('chore', '기타', 6),
+    ('ci', 'CI/CD', 8),
+]
+
+AUTHORS = ['Kim Minjun', 'Lee Seoyeon', 'Park Jiho', 'Choi Yuna', 'Claude Code']
+
+FILE_POOLS = {
+    'frontend': ['apps/web/src/app/{name}/page.tsx', 'apps/web/src/components/{name}/{Name}.tsx',
+                 'apps/web/src/hooks/use{Name}.ts', 'apps/web/src/styles/{name}.css'],
+    'backend': ['apps/api/src/{name}/{name}.service.ts', 'apps/api/src/{name}/{name}.controller.ts',
+                'apps/api/src/{name}/dto/create-{name}.dto.ts', 'scripts/{name}.py'],
+    'docs': ['docs/{Name}.md', 'docs/dev-log/{name}.md', 'README.md'],
+    'config': ['.github/workflows/{name}.yml', 'docker-compose.yml', 'apps/api/package.json',
+               'apps/web/tsconfig.json', '.env.example', 'Dockerfile'],
+}
+
+MODULES = ['auth', 'courses', 'projects', 'community', 'chat', 'canvas', 'admin', 'users',
+           'qna', 'quiz', 'report', 'mentoring', 'notifications', 'search', 'level']
+
+VERBS = ['Add', 'Fix', 'Refactor', 'Update', 'Improve', 'Remove', 'Document', 'Optimize']
+OBJECTS = ['pagination', 'validation', 'caching', 'error handling', 'dark mode', 'i18n strings',
+           'GitHub OAuth flow', 'Prisma schema', 'E2E tests', 'Docker build', 'WebSocket gateway',
+           'rate limiting', 'search filters', 'leaderboard', '코스 진도 추적', '알림 설정']
+
+
+def random_path(rng: random.Random) -> str:
+    """Pick a realistic file path"""
+    category = rng.choices(list(FILE_POOLS), weights=[4, 4, 2, 1])[0]
+    name = rng.choice(MODULES)
+    return rng.choice(FILE_POOLS[category]).format(name=name, Name=name.title())
+
+
+def commit_time(rng: random.Random, day: datetime) -> datetime:
+    """Pick a commit time on day, skewed towards working hours"""
+    hour = min(23, max(0, int(rng.gauss(15, 4))))
+    return day.replace(hour=hour, minute=rng.randrange(60), second=rng.randrange(60))
+
+
+def render_log(number: int, when: datetime, rng: random.Random) -> str:
+    """Render one dev-log entry in the legacy '# Development Log #NN' layout"""
+    log_type, label, _ = rng.choices(LOG_TYPES, weights=[t[2] for t in LOG_TYPES])[0]
+    module = rng.choice(MODULES)
+    title = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} in {module}"
+    commit = '%040x' % rng.getrandbits(160)
+
+    files = []
+    for _ in range(max(1, int(rng.expovariate(1 / 6)))):
+        marker = rng.choices(['~', '+', '-'], weights=[6, 3, 1])[0]
+        added = 0 if marker == '-' else int(rng.paretovariate(1.2) * 8)
+        deleted = int(rng.paretovariate(1.5) * 3) if marker != '+' else 0
+        files.append((marker, random_path(rng), added, deleted))
+
+    lines_added = sum(f[2] for f in files)
+    lines_deleted = sum(f[3] for f in files)
+
+    details = [f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} for `{rng.choice(files)[1]}`"
+               for _ in range(rng.randint(1, 8))]
+
+    out = [
+        f"# Development Log #{number:02d} - {title} ({label})",
+        "",
+        f"**Date**: {when.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"**Author**: {rng.choice(AUTHORS)}",
+        f"**Commit**: `{commit}`",
+        f"**Type**: {log_type}",
+        "",
+        "## Summary (요약)",
+        "",
+        f"{title}. Touches {len(files)} files in the {module} module.",
+        "",
+        "## Changes Overview (변경 개요)",
+        "",
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Files Changed (변경된 파일) | {len(files)} |",
+        f"| Lines Added (추가된 라인) | +{lines_added} |",
+        f"| Lines Deleted (삭제된 라인) | -{lines_deleted} |",
+        "",
+        "### Details (상세 내용)",
+        "",
+    ]
+    out += [f"- {detail}" for detail in details]
+    out += [
+        "",
+        "## Files Changed (변경된 파일 목록)",
+        "",
+        "| Status | File | Added | Deleted |",
+        "|--------|------|-------|---------|",
+    ]
+    out += [f"| `{marker}` | `{path}` | +{added} | -{deleted} |" for marker, path, added, deleted in files]
+    out += ["", "🤖 Generated with devlog tooling", ""]
+
+    return '\n'.join(out)
+
+
+def render_current_log(number: int, when: datetime, rng: random.Random) -> str:
+    """Render one dev-log entry in the current '# Dev Log #NNN:' layout"""
+    module = rng.choice(MODULES)
+    title = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} in {module}"
+    commit = '%07x' % rng.getrandbits(28)
+
+    out = [
+        f"# Dev Log #{number:03d}: {title}",
+        "",
+        f"**Date**: {when.strftime('%Y-%m-%d %H:%M')}",
+        f"**Author**: {rng.choice(AUTHORS)}",
+        f"**Phase**: {rng.randint(1, 12)} - {module.title()}",
+        "",
+        "## Summary",
+        f"{title}. Follow-up work across the {module} module.",
+        "",
+        "## Changes Made",
+    ]
+    for _ in range(rng.randint(1, 4)):
+        out += ["", f"### {rng.choice(MODULES).title()}"]
+        out += [f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} in `{random_path(rng)}`"
+                for _ in range(rng.randint(1, 5))]
+    out += [
+        "",
+        "## Related",
+        f"- Commit: {commit} ({title})",
+        "",
+    ]
+
+    return '\n'.join(out)
+
+
+def log_filename(number: int, when: datetime, current: bool, text: str) -> str:
+    """Filename in the style of the layout: NNNNN-YYYY-MM-DD-log.md or NNN_slug_YYYYMMDD_HHMM.md"""
+    if not current:
+        return f"{number:05d}-{when.strftime('%Y-%m-%d')}-log.md"
+    title = text.split('\n', 1)[0].split(':', 1)[1]
+    slug = re.sub(r'[^a-z0-9]+', '_', title.lower()).strip('_')[:40] or 'log'
+    return f"{number:03d}_{slug}_{when.strftime('%Y%m%d_%H%M')}.md"
+
+
+def generate_corpus(output_dir: Path, count: int, seed: int = 42,
+                    start: datetime = datetime(2022, 1, 3), current_share: float = 0.0) -> List[Path]:
+    """Write count dev-logs into output_dir and return their paths
+
+    current_share of the logs (picked at random) use the current layout,
+    the rest the legacy one. Output depends only on the arguments, so the
+    same arguments always produce byte-identical files.
+    """
+    rng = random.Random(seed)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    day = start
+    paths = []
+    for number in range(1, count + 1):
+        # Several commits on busy days, occasional gaps of a few days
+        if rng.random() < 0.45:
+            day += timedelta(days=int(rng.expovariate(0.8)) + 1)
+        when = commit_time(rng, day)
+
+        # Only draw when mixing, so legacy-only corpora stay as they were
+        current = current_share > 0 and rng.random() < current_share
+        text = render_current_log(number, when, rng) if current else render_log(number, when, rng)
+
+        path = output_dir / log_filename(number, when, current, text)
+        path.write_text(text, encoding='utf-8')
+        paths.append(path)
+
+    return paths
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic dev-log corpus')
+    parser.add_argument('output_dir', type=Path)
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--current-share', type=float, default=0.0, metavar='FRACTION',
+                        help='Fraction of logs written in the current "Dev Log #NNN:" layout (default: 0)')
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.output_dir, args.count, args.seed, current_share=args.current_share)
+    print(f"[SUCCESS] Wrote {len(paths)} dev-logs to {args.output_dir}")
+
+
+if __name__ == '__main__':
+    main()